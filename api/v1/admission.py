@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""This module limits the requests served at once, with separate budgets
+for the cheap reads and for the expensive requests (the writes,
+/places_search and /batch), turning the requests beyond them away with
+503 Service Unavailable"""
+
+from os import getenv
+import threading
+from flask import jsonify, request
+import models
+from models.engine.limiter import Limiter
+
+
+def limiter(name, concurrency, queue):
+    """returns the Limiter of the name budget, from the HBNB_<NAME>_
+    CONCURRENCY and HBNB_<NAME>_QUEUE variables or their defaults, or None
+    if its concurrency is 0"""
+    concurrency = int(getenv('HBNB_{}_CONCURRENCY'.format(name),
+                             str(concurrency)))
+    if concurrency <= 0:
+        return None
+    return Limiter(concurrency,
+                   int(getenv('HBNB_{}_QUEUE'.format(name), str(queue))),
+                   float(getenv('HBNB_QUEUE_TIMEOUT', '5')))
+
+
+budgets = {"read": limiter("READ", 32, 64),
+           "expensive": limiter("EXPENSIVE", 4, 16)}
+# the seconds a turned away client is told to wait before retrying
+retry_after = getenv('HBNB_RETRY_AFTER', '1')
+# the methods of the cheap requests
+reads = ('GET', 'HEAD', 'OPTIONS')
+# the endpoints always using the expensive budget
+expensive = ('app_views.places_search', 'app_views.batch')
+# the endpoints never limited, so health checks and scrapes still answer
+exempt = ('app_views.status', 'metrics', 'profile')
+# the number of slots held by the current thread: the requests run inside
+# a request, such as the /batch operations, use the slot of their parent
+held = threading.local()
+
+
+def budget():
+    """returns the name of the budget of the request"""
+    if request.method not in reads or request.endpoint in expensive:
+        return "expensive"
+    return "read"
+
+
+def admit():
+    """takes a slot of the budget of the request, or turns it away with
+    503 and Retry-After when the budget and its queue are full"""
+    if request.endpoint in exempt or getattr(held, "count", 0):
+        return None
+    name = budget()
+    limit = budgets[name]
+    if limit is None:
+        return None
+    if not limit.acquire():
+        models.metrics.inc("http_requests_rejected_total", budget=name)
+        response = jsonify({"error": "Service unavailable"})
+        response.status_code = 503
+        response.headers['Retry-After'] = retry_after
+        return response
+    held.count = 1
+    request.environ['hbnb.admission'] = limit
+    return None
+
+
+def leave(error=None):
+    """gives back the slot of the request, once its response is sent"""
+    limit = request.environ.pop('hbnb.admission', None)
+    if limit is not None:
+        held.count = 0
+        limit.release()
+
+
+def init_app(app):
+    """limits the requests of app to their budgets"""
+    models.metrics.counter("http_requests_rejected_total",
+                           "HTTP requests turned away, by budget.")
+    app.before_request(admit)
+    app.teardown_request(leave)
@@ -2,7 +2,10 @@
 """ Module for app.py """
 from flask import Flask, Blueprint, jsonify
 from flask_cors import CORS
+import models
 from models import storage
+from models.engine import metrics
+from api.v1 import admission, compression, profiling, queries
 from api.v1.views import app_views
 from os import getenv
 
@@ -15,6 +18,16 @@ app.url_map.strict_slashes = False
 
 # register the blueprint app_views to your Flask instance app
 app.register_blueprint(app_views)
+# compress the responses the client accepts compressed
+compression.init_app(app)
+# count and time the requests, exporting them with the storage metrics
+metrics.init_app(app, models.metrics)
+# turn requests away with 503 once their concurrency budget is full
+admission.init_app(app)
+# profile the requests sent with the profiling secret, if one is set
+profiling.init_app(app)
+# count the SQL statements of each request, logging the N+1 queries
+queries.init_app(app)
 
 
 # declare a method to handle @app.teardown_appcontext
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+"""This module compresses the responses of the API with the content coding
+the client prefers among gzip, and br and zstd when their modules are
+installed"""
+
+import gzip
+from os import getenv
+import zlib
+from flask import request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# responses smaller than this many bytes are sent as they are
+min_size = int(getenv('HBNB_COMPRESS_MIN_SIZE', '1024'))
+# the compression level, clamped to the range of each coding
+level = int(getenv('HBNB_COMPRESS_LEVEL', '6'))
+mimetypes = ('application/json', 'application/x-ndjson')
+# every coding an ETag may be suffixed with, available here or not
+all_codings = ('br', 'zstd', 'gzip')
+
+
+def codings():
+    """returns the available content codings, the preferred first"""
+    names = []
+    if brotli is not None:
+        names.append('br')
+    if zstandard is not None:
+        names.append('zstd')
+    names.append('gzip')
+    return names
+
+
+def negotiate():
+    """returns the available content coding the Accept-Encoding header of
+    the request prefers, None if it accepts none of them"""
+    best = None
+    quality = 0
+    for coding in codings():
+        value = request.accept_encodings[coding]
+        if value > quality:
+            best, quality = coding, value
+    return best
+
+
+def identity_etag(etag):
+    """returns etag without the -<coding> suffix of a compressed
+    response, the ETag of the uncompressed one"""
+    for coding in all_codings:
+        if etag.endswith('-' + coding):
+            return etag[:-len(coding) - 1]
+    return etag
+
+
+def compressor(coding):
+    """returns a (compress, finish) pair of functions compressing a
+    stream of chunks with coding, compress(chunk) returning the bytes
+    ready to send for the chunk so far"""
+    if coding == 'br':
+        stream = brotli.Compressor(quality=min(max(level, 0), 11))
+        return (lambda chunk: stream.process(chunk) + stream.flush(),
+                stream.finish)
+    if coding == 'zstd':
+        stream = zstandard.ZstdCompressor(
+            level=min(max(level, 1), 22)).compressobj()
+        return (lambda chunk: stream.compress(chunk) +
+                stream.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+                stream.flush)
+    stream = zlib.compressobj(min(max(level, 1), 9), zlib.DEFLATED, 31)
+    return (lambda chunk: stream.compress(chunk) +
+            stream.flush(zlib.Z_SYNC_FLUSH),
+            stream.flush)
+
+
+def compress(body, coding):
+    """returns body compressed with coding"""
+    if coding == 'br':
+        return brotli.compress(body, quality=min(max(level, 0), 11))
+    if coding == 'zstd':
+        return zstandard.ZstdCompressor(
+            level=min(max(level, 1), 22)).compress(body)
+    return gzip.compress(body, min(max(level, 1), 9), mtime=0)
+
+
+def compress_stream(chunks, coding):
+    """yields the chunks compressed with coding, each one flushed so the
+    client can decode it as soon as it is received"""
+    process, finish = compressor(coding)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        if chunk:
+            yield process(chunk)
+    yield finish()
+
+
+def compressible(response):
+    """tells if response is worth compressing: a JSON body of at least
+    min_size bytes, or a streamed one, not already encoded"""
+    if response.direct_passthrough or \
+            response.mimetype not in mimetypes or \
+            'Content-Encoding' in response.headers or \
+            response.status_code < 200 or response.status_code in (204, 304):
+        return False
+    return response.is_streamed or \
+        response.calculate_content_length() >= min_size
+
+
+def compressed(response, variants=None):
+    """returns response compressed with the coding the request prefers,
+    if any and if it is worth it
+
+    variants, a dictionary {coding: compressed body}, keeps the
+    compressed bodies of a cached response: a body is only compressed
+    the first time a coding is asked for it. A compressed response gets
+    a strong ETag of its own, the one of the uncompressed response
+    suffixed with -<coding> (see identity_etag).
+    """
+    if not compressible(response):
+        return response
+    response.vary.add('Accept-Encoding')
+    coding = negotiate()
+    if coding is None:
+        return response
+    if response.is_streamed:
+        response.response = compress_stream(response.response, coding)
+    else:
+        if variants is None:
+            variants = {}
+        if coding not in variants:
+            variants[coding] = compress(response.get_data(), coding)
+        response.set_data(variants[coding])
+    response.headers['Content-Encoding'] = coding
+    etag, weak = response.get_etag()
+    if etag is not None:
+        response.set_etag(etag if weak else etag + '-' + coding, weak)
+    return response
+
+
+def init_app(app):
+    """compresses the responses of app"""
+    app.after_request(compressed)
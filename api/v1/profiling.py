@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""This module profiles the requests sent with the X-HBNB-Profile header
+holding the secret of HBNB_PROFILE_SECRET, keeping a report of each one
+for GET /profiles/<profile_id>"""
+
+from collections import OrderedDict
+import cProfile
+import hmac
+from os import getenv
+import pstats
+import sys
+import threading
+import time
+import uuid
+from flask import abort, jsonify, request
+from models import storage
+
+header = 'X-HBNB-Profile'
+# profiling is off, at no cost, unless a secret is set
+secret = getenv('HBNB_PROFILE_SECRET')
+# the number of functions listed in a report, by cumulative time
+top = int(getenv('HBNB_PROFILE_TOP', '30'))
+# the number of reports kept, the oldest dropped first
+max_reports = int(getenv('HBNB_PROFILE_REPORTS', '32'))
+reports = OrderedDict()
+lock = threading.Lock()
+# the statements list of the request profiled by the current thread
+current = threading.local()
+
+
+def authorized():
+    """tells if the profiling header of the request holds the secret"""
+    return hmac.compare_digest(request.headers.get(header, '').encode(),
+                               secret.encode())
+
+
+def on_statement(statement, parameters, duration):
+    """records statement and its duration if the current thread is
+    profiling a request"""
+    statements = getattr(current, "statements", None)
+    if statements is not None:
+        statements.append({"statement": statement,
+                           "duration": round(duration, 6)})
+
+
+def start_profile():
+    """starts profiling the request, if it asks for it"""
+    if header not in request.headers or not authorized():
+        return
+    profiler = cProfile.Profile()
+    current.statements = []
+    request.environ['hbnb.profile'] = (profiler, current.statements,
+                                       time.perf_counter())
+    profiler.enable()
+
+
+def report(profiler, statements, duration, status):
+    """returns the report of a profiled request: its top functions by
+    cumulative time, the number of calls to each storage method and the
+    SQL statements it executed"""
+    profiler.create_stats()
+    stats = pstats.Stats(profiler).stats
+    storage_file = sys.modules[type(storage).__module__].__file__
+    functions = []
+    storage_calls = {}
+    for (path, line, name), (cc, nc, tt, ct, callers) in stats.items():
+        functions.append({"function": "{}:{}({})".format(path, line, name),
+                          "calls": nc, "total_time": round(tt, 6),
+                          "cumulative_time": round(ct, 6)})
+        if path == storage_file and name.isidentifier() and \
+                not name.startswith('_'):
+            storage_calls[name] = storage_calls.get(name, 0) + nc
+    functions.sort(key=lambda function: -function["cumulative_time"])
+    return {"method": request.method, "path": request.full_path.rstrip('?'),
+            "status": status, "duration": round(duration, 6),
+            "functions": functions[:top], "storage_calls": storage_calls,
+            "statements": statements}
+
+
+def stop_profile(response):
+    """stops profiling the request and keeps its report, naming it in the
+    X-HBNB-Profile-Id header of response"""
+    profile = request.environ.pop('hbnb.profile', None)
+    if profile is None:
+        return response
+    profiler, statements, start = profile
+    profiler.disable()
+    current.statements = None
+    profile_id = str(uuid.uuid4())
+    kept = report(profiler, statements, time.perf_counter() - start,
+                  response.status_code)
+    with lock:
+        reports[profile_id] = kept
+        while len(reports) > max_reports:
+            reports.popitem(last=False)
+    response.headers['X-HBNB-Profile-Id'] = profile_id
+    return response
+
+
+def discard_profile(error=None):
+    """stops the profiler of a request that ended without a response"""
+    profile = request.environ.pop('hbnb.profile', None)
+    if profile is not None:
+        profile[0].disable()
+        current.statements = None
+
+
+def get_profile(profile_id):
+    """returns the report of a profiled request, to the requests with the
+    profiling header holding the secret"""
+    if not authorized():
+        abort(404)
+    with lock:
+        kept = reports.get(profile_id)
+    if kept is None:
+        abort(404)
+    return jsonify(kept)
+
+
+def init_app(app):
+    """profiles the requests of app asking for it, if a secret is set
+
+    The profile covers the request up to its response: the body of a
+    streamed response is produced after it ends.
+    """
+    if not secret:
+        return
+    storage.subscribe_statements(on_statement)
+    app.before_request(start_profile)
+    app.after_request(stop_profile)
+    app.teardown_request(discard_profile)
+    app.add_url_rule('/profiles/<profile_id>', 'profile', get_profile)
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+"""This module counts the SQL statements of each request, logging the
+requests running more than HBNB_QUERY_BUDGET of them and the statements
+they repeat at least HBNB_QUERY_REPEATS times, likely N+1 queries"""
+
+from os import getenv
+from flask import current_app, request
+import models
+from models import storage
+from models.engine.query_tracker import QueryTracker
+
+# the number of statements a request may run without being logged
+budget = int(getenv('HBNB_QUERY_BUDGET', '20'))
+# the number of runs of a statement shape flagged as a likely N+1 query
+repeats = int(getenv('HBNB_QUERY_REPEATS', '5'))
+tracker = QueryTracker(storage)
+
+
+def start_log():
+    """starts recording the statements of the request"""
+    request.environ['hbnb.queries'] = tracker.start()
+
+
+def report(logger, method, path, log):
+    """stops recording the statements of log, the one of the request
+    method path, and logs it to logger if it ran too many statements or
+    repeated some"""
+    tracker.stop(log)
+    if log.count > budget:
+        logger.warning("%s %s ran %d SQL statements in %.1f ms (budget %d)",
+                       method, path, log.count, log.duration * 1000, budget)
+    for text, count, duration in log.repeated(repeats):
+        logger.warning("%s %s ran %d times in %.1f ms, likely N+1: %s",
+                       method, path, count, duration * 1000, text)
+
+
+def check_log(response):
+    """reports the statements of the request (see report) once response
+    is sent: at once, or when a streamed body is closed since it runs
+    statements of its own
+
+    In debug mode a response that is not streamed also gets their
+    count, duration and number of repeated shapes in its headers.
+    """
+    log = request.environ.pop('hbnb.queries', None)
+    if log is None:
+        return response
+    args = (current_app.logger, request.method,
+            request.full_path.rstrip('?'), log)
+    if response.is_streamed:
+        response.call_on_close(lambda: report(*args))
+        return response
+    report(*args)
+    if current_app.debug:
+        response.headers['X-HBNB-Queries'] = str(log.count)
+        response.headers['X-HBNB-Query-Time'] = \
+            "{:.3f}".format(log.duration * 1000)
+        response.headers['X-HBNB-Repeated-Queries'] = \
+            str(len(log.repeated(repeats)))
+    return response
+
+
+def end_log(error=None):
+    """stops recording the statements of a request that ended without a
+    response"""
+    log = request.environ.pop('hbnb.queries', None)
+    if log is not None:
+        tracker.stop(log)
+
+
+def init_app(app):
+    """counts the SQL statements of the requests of app, in db mode"""
+    if models.storage_t != "db":
+        return
+    app.before_request(start_log)
+    app.after_request(check_log)
+    app.teardown_request(end_log)
@@ -8,9 +8,13 @@ app_views = Blueprint('app_views', __name__, url_prefix='/api/v1/views')
 
 # wildcard import of everything in the package api.v1.views.index
 from api.v1.views.index import *
+from api.v1.views.states import *
 from api.v1.views.cities import *
 from api.v1.views.amenities import *
 from api.v1.views.users import *
 from api.v1.views.places import *
 from api.v1.views.places_reviews import *
 from api.v1.views.places_amenities import *
+from api.v1.views.search import *
+from api.v1.views.autocomplete import *
+from api.v1.views.batch import *
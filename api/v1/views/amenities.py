@@ -7,17 +7,22 @@ from models.city import City
 from models.state import State
 from models.amenity import Amenity
 from flask import jsonify, abort, request
+from api.v1.views.listing import listing
+from api.v1.views.etags import check_if_match, resource, updated
+from api.v1.views.caching import cached
+from api.v1.views.bulk import bulk_create, bulk_update, bulk_delete
+
+# Amenity attributes the amenity listings can be sorted by
+sortable = ('name', 'created_at', 'updated_at')
 
 
 # Retrieves the list of all Amenity objects: GET /api/v1/amenities
 @app_views.route('/amenities', methods=['GET'], strict_slashes=False)
+@cached(("Amenity",))
 def get_amenities():
-    """This function retrieves list of all amenity objects of a State"""
-    amenities = storage.all(Amenity)
-    amenities_list = []
-    for amenity in amenities.values():
-        amenities_list.append(amenity.to_dict())
-    return jsonify(amenities_list), 200
+    """This function retrieves list of all amenity objects, sorted and
+    paginated by the sort, limit, offset and after query parameters"""
+    return listing(Amenity, sortable)
 
 
 # Retrieves a Amenity object. : GET /api/v1/amenities/<amenity_id>
@@ -39,7 +44,7 @@ Raises:
     amenity = storage.get(Amenity, amenity_id)
     if amenity is None:
         abort(404)
-    return jsonify(amenity.to_dict()), 200
+    return resource(amenity)
 
 
 # Deletes a Amenity object: DELETE /api/v1/amenities/<amenity_id>
@@ -61,6 +66,7 @@ Raises:
     amenity = storage.get(Amenity, amenity_id)
     if amenity is None:
         abort(404)
+    check_if_match(amenity)
     storage.delete(amenity)
     storage.save()
     return jsonify({}), 200
@@ -103,11 +109,71 @@ Raises:
     amenity = storage.get(Amenity, amenity_id)
     if amenity is None:
         abort(404)
+    check_if_match(amenity)
     if not request.get_json():
         abort(400, description="Not a JSON")
     data = request.get_json()
     for key, value in data.items():
         if key not in ['id', 'created_at', 'updated_at']:
             setattr(amenity, key, value)
-    storage.save()
-    return jsonify(amenity.to_dict()), 200
+    return updated(amenity)
+
+
+@app_views.route('/amenities/bulk', methods=['POST'], strict_slashes=False)
+def create_amenities_bulk():
+    """
+Creates many Amenity objects in a single write.
+
+Parameters:
+- None (JSON body): a list of Amenity dictionaries, each with a
+"name".
+
+Returns:
+- A JSON response containing the list of the created Amenity objects and
+a status code of 201.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of them is not valid; nothing is created then, and the response
+lists the "errors" as {"index", "error"} dictionaries.
+"""
+    return bulk_create(Amenity, ['name'])
+
+
+@app_views.route('/amenities/bulk', methods=['PUT'], strict_slashes=False)
+def update_amenities_bulk():
+    """
+Updates many Amenity objects in a single write.
+
+Parameters:
+- None (JSON body): a list of dictionaries, each with the "id" of a
+Amenity and the attributes to update; the keys
+id, created_at, updated_at are ignored.
+
+Returns:
+- A JSON response containing the list of the updated Amenity objects and
+a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of the ids is not found; nothing is updated then.
+"""
+    return bulk_update(Amenity, ['id', 'created_at', 'updated_at'])
+
+
+@app_views.route('/amenities/bulk', methods=['DELETE'], strict_slashes=False)
+def delete_amenities_bulk():
+    """
+Deletes many Amenity objects in a single write.
+
+Parameters:
+- None (JSON body): the list of the ids of the Amenity objects to delete.
+
+Returns:
+- An empty JSON response and a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of strings, or if one
+of the ids is not found; nothing is deleted then.
+"""
+    return bulk_delete(Amenity)
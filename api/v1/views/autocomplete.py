@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+"""This module creates the autocomplete view over state, city and amenity
+names"""
+
+from api.v1.views import app_views
+from models import name_index
+from flask import jsonify, request
+
+completable = {"state": "State", "city": "City", "amenity": "Amenity"}
+kinds = {cls: kind for kind, cls in completable.items()}
+
+
+@app_views.route('/autocomplete', methods=['GET'], strict_slashes=False)
+def autocomplete():
+    """
+Completes a prefix to the names of states, cities and amenities, from
+the name index, without loading the objects.
+
+Parameters (query string):
+- q (str): the prefix; a name matches when one of its words starts
+with it, ignoring case and accents
+- type (str): "state", "city" or "amenity" to complete only one kind of
+name
+- limit (int): the number of matches, 1 to 50 (default 10)
+
+Returns:
+- JSON response: a list of {"type", "id", "name"}, sorted by the
+matched part of the name.
+
+Raises:
+- 400: If type or limit are not valid.
+"""
+    query = request.args.get('q', '')
+    kind = request.args.get('type')
+    try:
+        limit = int(request.args.get('limit', 10))
+    except ValueError:
+        return jsonify({'error': "Invalid limit"}), 400
+    if kind is not None and kind not in completable:
+        return jsonify({'error': "Invalid type"}), 400
+    if not 1 <= limit <= 50:
+        return jsonify({'error': "Invalid limit"}), 400
+    classes = [completable[kind]] if kind else None
+    return jsonify([{"type": kinds[cls], "id": obj_id, "name": name}
+                    for cls, obj_id, name
+                    in name_index.complete(query, classes, limit)]), 200
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+"""This module creates the view running many API operations in one
+request"""
+
+from api.v1.views import app_views
+from models import storage
+from flask import current_app, jsonify, request
+
+# the methods a sub-operation may use
+methods = ('GET', 'POST', 'PUT', 'DELETE')
+# the most sub-operations a batch may hold
+max_operations = 1000
+# the response headers returned with the result of a sub-operation
+kept_headers = ('ETag', 'X-Next-Cursor')
+
+
+def dispatch(method, path, body):
+    """returns the {"status", "body", "headers"} result of running the
+    request method path with the JSON body through the application
+
+    The request is marked as part of a batch in its WSGI environ, so the
+    cached views run it instead of answering from models.response_cache.
+    """
+    if not path.startswith(app_views.url_prefix + '/'):
+        path = app_views.url_prefix + '/' + path.lstrip('/')
+    if path.split('?')[0].rstrip('/') == app_views.url_prefix + '/batch':
+        return {"status": 400, "body": {"error": "Nested batch"}}
+    with current_app.test_request_context(
+            path, method=method, json=body,
+            headers={'Accept': 'application/json'},
+            environ_overrides={'hbnb.batch': True}):
+        try:
+            with storage.savepoint():
+                response = current_app.full_dispatch_request()
+        except Exception as error:
+            current_app.logger.exception(error)
+            return {"status": 500, "body": {"error": "Internal error"}}
+        result = {"status": response.status_code,
+                  "body": response.get_json(silent=True)}
+        # runs the close callbacks of a streamed body, as a server would
+        response.close()
+    headers = {name: response.headers[name] for name in kept_headers
+               if name in response.headers}
+    if headers:
+        result["headers"] = headers
+    return result
+
+
+@app_views.route('/batch', methods=['POST'], strict_slashes=False)
+def batch():
+    """
+Runs a list of API operations in one request, in order, as one storage
+unit of work: their writes are persisted once, when the last one is
+done. In db mode each operation runs in a savepoint, so the writes of
+a failed one are rolled back without undoing the others.
+
+Parameters:
+- None (JSON body): a list of operations, each a dictionary with:
+  - method (str): GET, POST, PUT or DELETE
+  - path (str): the path of the operation, e.g. /places/<id>/amenities
+    or /api/v1/views/states?sort=name
+  - body (optional): the JSON body of the operation
+
+Returns:
+- JSON response: the list of the results of the operations, in order,
+each a dictionary with the "status" code of the operation, its JSON
+"body" (null if not JSON) and its ETag and X-Next-Cursor "headers" if
+any. A failed operation does not stop the next ones.
+
+Raises:
+- 400: If the body is not a list of at most 1000 operations, each with
+a valid method and a path.
+"""
+    operations = request.get_json(silent=True)
+    if not isinstance(operations, list):
+        return jsonify({'error': "Not a JSON list"}), 400
+    if len(operations) > max_operations:
+        return jsonify({'error': "Too many operations"}), 400
+    for operation in operations:
+        if not isinstance(operation, dict) or \
+                operation.get('method') not in methods or \
+                not isinstance(operation.get('path'), str):
+            return jsonify({'error': "Invalid operation"}), 400
+    results = []
+    with storage.batch():
+        for operation in operations:
+            results.append(dispatch(operation['method'], operation['path'],
+                                    operation.get('body')))
+    return jsonify(results), 200
@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+"""This module creates, updates and deletes many objects of a class in
+one request, validating all of them before persisting any in a single
+write"""
+
+from datetime import datetime
+from models import storage
+from models.base_model import new_ids
+from flask import Response, jsonify, request, stream_with_context
+from api.v1.views.listing import JSON, encode_stream
+
+# the number of ids looked up in one storage query, so that a large body
+# does not make a single IN clause over all of its ids
+lookup_size = 500
+
+
+def invalid(errors):
+    """returns the 400 response listing the {"index", "error"} errors"""
+    return jsonify({'error': "Invalid items",
+                    'errors': [{'index': index, 'error': error}
+                               for index, error in errors]}), 400
+
+
+def items(kind):
+    """returns the JSON list of the request body if its entries are of
+    kind, else None"""
+    body = request.get_json(silent=True)
+    if not isinstance(body, list) or \
+            not all(isinstance(item, kind) for item in body):
+        return None
+    return body
+
+
+def fetch(cls, ids):
+    """returns {id: object} for the objects of cls with the given ids
+    that exist in storage, looking them up lookup_size ids at a time"""
+    ids = list(dict.fromkeys(ids))
+    objs = {}
+    for i in range(0, len(ids), lookup_size):
+        for obj in storage.get_many(cls, ids[i:i + lookup_size]):
+            objs[obj.id] = obj
+    return objs
+
+
+def existing(cls, ids):
+    """returns the set of the ids of cls that exist in storage, ignoring
+    the values of ids that are not strings"""
+    return set(fetch(cls, [obj_id for obj_id in ids
+                           if isinstance(obj_id, str)]))
+
+
+def objects_response(objs, status):
+    """returns the streamed JSON response listing the dictionaries of
+    objs"""
+    return Response(stream_with_context(encode_stream(objs)), status=status,
+                    mimetype=JSON)
+
+
+def bulk_create(cls, required, parents=None):
+    """creates an object of cls for each dictionary of the request body
+
+    Every dictionary must have the required keys, and the keys of
+    parents, a {key: class} dictionary, must hold the id of an existing
+    object of their class. When one of them does not, nothing is created
+    and the response lists the errors; else all the objects are added to
+    storage at once and saved with a single write.
+    """
+    body = items(dict)
+    if body is None:
+        return jsonify({'error': "Not a JSON list"}), 400
+    parents = parents or {}
+    errors = []
+    for index, item in enumerate(body):
+        for key in required:
+            if key not in item:
+                errors.append((index, "Missing " + key))
+    found = {key: existing(parent, [item.get(key) for item in body])
+             for key, parent in parents.items()}
+    for index, item in enumerate(body):
+        for key in parents:
+            if key in item and (not isinstance(item[key], str) or
+                                item[key] not in found[key]):
+                errors.append((index, "Not found: " + key))
+    if errors:
+        return invalid(sorted(errors))
+    # the ids of the new objects are drawn at once, unless given
+    objs = [cls(**item) if 'id' in item else cls(id=obj_id, **item)
+            for item, obj_id in zip(body, new_ids(len(body)))]
+    storage.new_many(objs)
+    storage.save()
+    return objects_response(objs, 201)
+
+
+def bulk_update(cls, ignored):
+    """updates the object of cls of each dictionary of the request body,
+    found by its "id", with its other keys except the ignored ones
+
+    When an object is not found nothing is updated and the response lists
+    the errors; else the objects that changed get a new updated_at and
+    are saved with a single write.
+    """
+    body = items(dict)
+    if body is None:
+        return jsonify({'error': "Not a JSON list"}), 400
+    objs = fetch(cls, [item.get('id') for item in body
+                       if isinstance(item.get('id'), str)])
+    errors = [(index, "Not found: id") for index, item in enumerate(body)
+              if not isinstance(item.get('id'), str) or
+              item['id'] not in objs]
+    if errors:
+        return invalid(errors)
+    updated = []
+    now = datetime.utcnow()
+    for item in body:
+        obj = objs[item['id']]
+        for key, value in item.items():
+            if key not in ignored:
+                setattr(obj, key, value)
+        if obj.changed_fields():
+            obj.updated_at = now
+        updated.append(obj)
+    storage.save()
+    return objects_response(updated, 200)
+
+
+def bulk_delete(cls):
+    """deletes the objects of cls whose ids are listed in the request
+    body, with a single write; when one is not found nothing is deleted
+    and the response lists the errors"""
+    body = items(str)
+    if body is None:
+        return jsonify({'error': "Not a JSON list"}), 400
+    objs = fetch(cls, body)
+    errors = [(index, "Not found: id") for index, obj_id in enumerate(body)
+              if obj_id not in objs]
+    if errors:
+        return invalid(errors)
+    storage.delete_many(list(objs.values()))
+    storage.save()
+    return jsonify({}), 200
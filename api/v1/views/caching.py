@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+"""This module caches the responses of the read views in
+models.response_cache"""
+
+from functools import wraps
+import json
+from os import getenv
+import models
+from models.engine.cache import later
+from flask import Response, make_response, request
+from api.v1.compression import compressed
+from api.v1.views.etags import matches_none
+from api.v1.views.expand import scopes as expand_scopes
+
+
+# the largest streamed body, in bytes, kept while it is sent
+max_body = int(getenv('HBNB_CACHE_MAX_BODY', str(1 << 20)))
+
+
+def request_key():
+    """returns the cache key of the request: its method, path, sorted
+    query string, Accept header and, for a POST, its JSON body with
+    sorted keys"""
+    key = [request.method, request.path,
+           json.dumps(sorted(request.args.items(multi=True))),
+           request.headers.get('Accept', '')]
+    if request.method == 'POST':
+        key.append(json.dumps(request.get_json(silent=True),
+                              sort_keys=True))
+    return "\n".join(key)
+
+
+def kept_headers(response):
+    """returns the headers of response kept with its body"""
+    return [(name, value) for name, value in response.headers.items()
+            if name not in ('Content-Length', 'X-Cache')]
+
+
+def tee(chunks, key, headers):
+    """yields the chunks of a streamed 200 response, then keeps its body
+    under key (see Cache.key) unless it grew beyond max_body, waking the
+    requests waiting for it either way"""
+    body = []
+    size = 0
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            if body is not None:
+                size += len(chunk)
+                if size > max_body:
+                    body = None
+                else:
+                    body.append(chunk)
+            yield chunk
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+    models.response_cache.put(
+        key, None if body is None else (200, headers, b"".join(body), {}))
+
+
+def cached(*scopes):
+    """decorates a view so its 200 responses are kept in
+    models.response_cache until a write changes one of scopes
+
+    A scope is (class name,) for all the objects of a class, or
+    (class name, attribute, argument) for the ones whose attribute is the
+    value of the view argument, e.g. ("Review", "place_id", "place_id")
+    for the reviews of the place_id of the URL; the classes embedded by
+    the expand parameter are added to them. A kept response is sent
+    again with the X-Cache: HIT header, or as 304 Not Modified when the
+    If-None-Match header holds its ETag. Its compressed bodies are kept
+    with it, so it is only compressed once for each content coding.
+    A streamed response is sent as it is produced, and only kept once
+    fully sent, if not larger than max_body: the identical requests
+    missing it meanwhile wait for it as for any other response. The
+    operations of a /batch request are never answered from, nor kept
+    in, the cache.
+    """
+    def decorator(view):
+        """returns the caching view"""
+        @wraps(view)
+        def wrapper(**kwargs):
+            """returns the kept response of the request, or the one of
+            view when there is none"""
+            if request.environ.get('hbnb.batch'):
+                # in db mode the writes of a batch only bump the versions
+                # when it commits, so kept responses may predate them
+                return view(**kwargs)
+            fresh = []
+
+            def compute():
+                """returns ((status, headers, body, compressed bodies),
+                True) for a 200 response of view, (response, later) for a
+                streamed one, kept by tee() once sent, else (response,
+                False)"""
+                response = make_response(view(**kwargs))
+                fresh.append(response)
+                if response.status_code != 200:
+                    return response, False
+                if response.is_streamed:
+                    return response, later
+                return (200, kept_headers(response), response.get_data(),
+                        {}), True
+
+            resolved = [scope if len(scope) == 1 else
+                        (scope[0], scope[1], kwargs[scope[2]])
+                        for scope in scopes]
+            expand = request.args.get('expand')
+            if request.method == 'POST':
+                body = request.get_json(silent=True)
+                if isinstance(body, dict):
+                    expand = body.get('expand')
+            resolved.extend(expand_scopes(expand))
+            cache = models.response_cache
+            key = cache.key(request_key(), resolved)
+            value = cache.lookup(key, compute)
+            if fresh:
+                response = fresh[0]
+                response.headers['X-Cache'] = 'MISS'
+                if response.status_code != 200:
+                    return response
+                if response.is_streamed:
+                    if cache.ttl:
+                        response.response = tee(response.response, key,
+                                                kept_headers(response))
+                        # wakes the waiting requests if it is not fully sent
+                        response.call_on_close(lambda: cache.put(key))
+                    return response
+                return compressed(response, value[3])
+            response = Response(value[2], value[0], value[1])
+            etag, weak = response.get_etag()
+            if etag is not None and matches_none(etag):
+                response = Response(status=304)
+                response.set_etag(etag, weak)
+            response.headers['X-Cache'] = 'HIT'
+            return compressed(response, value[3])
+        return wrapper
+    return decorator
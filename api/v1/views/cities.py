@@ -2,24 +2,30 @@
 """cities"""
 from api.v1.views import app_views
 from flask import jsonify, abort, request
-from models import storage
+from models import storage, state_cities
 from models.city import City
 from models.state import State
 from datetime import datetime
 import uuid
+from api.v1.views.listing import listing
+from api.v1.views.etags import check_if_match, resource, updated
+from api.v1.views.caching import cached
+from api.v1.views.bulk import bulk_create, bulk_update, bulk_delete
+
+# City attributes the city listings can be sorted by
+sortable = ('name', 'created_at', 'updated_at')
 
 
 @app_views.route('/states/<state_id>/cities', methods=['GET'])
 @app_views.route('/states/<state_id>/cities/', methods=['GET'])
+@cached(("State", "id", "state_id"), ("City", "state_id", "state_id"))
 def list_cities_of_state(state_id):
-    '''Retrieves a list of all City objects'''
-    all_states = storage.all("State").values()
-    state_obj = [obj.to_dict() for obj in all_states if obj.id == state_id]
-    if state_obj == []:
+    '''Retrieves a list of all City objects of a state, sorted and
+    paginated by the sort, limit, offset and after query parameters'''
+    if storage.get(State, state_id) is None:
         abort(404)
-    list_cities = [obj.to_dict() for obj in storage.all("City").values()
-                   if state_id == obj.state_id]
-    return jsonify(list_cities)
+    return listing(City, sortable, state_cities.ids([state_id]),
+                   ('state_id', state_id))
 
 
 @app_views.route('/states/<state_id>/cities', methods=['POST'])
@@ -45,40 +51,93 @@ def create_city(state_id):
 @app_views.route('/cities/<city_id>', methods=['GET'])
 def get_city(city_id):
     '''Retrieves a City object'''
-    all_cities = storage.all("City").values()
-    city_obj = [obj.to_dict() for obj in all_cities if obj.id == city_id]
-    if city_obj == []:
+    city = storage.get(City, city_id)
+    if city is None:
         abort(404)
-    return jsonify(city_obj[0])
+    return resource(city)
 
 
 @app_views.route('/cities/<city_id>', methods=['DELETE'])
 def delete_city(city_id):
     '''Deletes a City object'''
-    all_cities = storage.all("City").values()
-    city_obj = [obj.to_dict() for obj in all_cities if obj.id == city_id]
-    if city_obj == []:
+    city = storage.get(City, city_id)
+    if city is None:
         abort(404)
-    city_obj.remove(city_obj[0])
-    for obj in all_cities:
-        if obj.id == city_id:
-            storage.delete(obj)
-            storage.save()
+    check_if_match(city)
+    storage.delete(city)
+    storage.save()
     return jsonify({}), 200
 
 
 @app_views.route('/cities/<city_id>', methods=['PUT'])
 def updates_city(city_id):
     '''Updates a City object'''
-    all_cities = storage.all("City").values()
-    city_obj = [obj.to_dict() for obj in all_cities if obj.id == city_id]
-    if city_obj == []:
+    city = storage.get(City, city_id)
+    if city is None:
         abort(404)
+    check_if_match(city)
     if not request.get_json():
         abort(400, 'Not a JSON')
-    city_obj[0]['name'] = request.json['name']
-    for obj in all_cities:
-        if obj.id == city_id:
-            obj.name = request.json['name']
-    storage.save()
-    return jsonify(city_obj[0]), 200
+    city.name = request.json['name']
+    return updated(city)
+
+
+@app_views.route('/cities/bulk', methods=['POST'], strict_slashes=False)
+def create_cities_bulk():
+    """
+Creates many City objects in a single write.
+
+Parameters:
+- None (JSON body): a list of City dictionaries, each with a
+"name" and the "state_id" of an existing State.
+
+Returns:
+- A JSON response containing the list of the created City objects and
+a status code of 201.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of them is not valid; nothing is created then, and the response
+lists the "errors" as {"index", "error"} dictionaries.
+"""
+    return bulk_create(City, ['name', 'state_id'],
+                       {'state_id': State})
+
+
+@app_views.route('/cities/bulk', methods=['PUT'], strict_slashes=False)
+def update_cities_bulk():
+    """
+Updates many City objects in a single write.
+
+Parameters:
+- None (JSON body): a list of dictionaries, each with the "id" of a
+City and the attributes to update; the keys
+id, state_id, created_at, updated_at are ignored.
+
+Returns:
+- A JSON response containing the list of the updated City objects and
+a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of the ids is not found; nothing is updated then.
+"""
+    return bulk_update(City, ['id', 'state_id', 'created_at', 'updated_at'])
+
+
+@app_views.route('/cities/bulk', methods=['DELETE'], strict_slashes=False)
+def delete_cities_bulk():
+    """
+Deletes many City objects in a single write.
+
+Parameters:
+- None (JSON body): the list of the ids of the City objects to delete.
+
+Returns:
+- An empty JSON response and a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of strings, or if one
+of the ids is not found; nothing is deleted then.
+"""
+    return bulk_delete(City)
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""This module computes the ETags of the resources and collections and
+answers the conditional requests made with them"""
+
+import hashlib
+import models
+from flask import Response, abort, jsonify, request
+from api.v1.compression import identity_etag
+from api.v1.views.fields import request_fields
+from api.v1.views.expand import expand_dicts, request_expand, version
+
+
+def digest(*parts):
+    """returns the hex digest of parts, used as a strong ETag"""
+    text = "\0".join(str(part) for part in parts)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def resource_etag(obj):
+    """returns the ETag of obj, from its class, id and updated_at"""
+    return digest(obj.__class__.__name__, obj.id, obj.updated_at)
+
+
+def collection_etag(cls, attribute=None, value=None, variant=''):
+    """returns the ETag of a listing of the objects of cls, or only of
+    the ones whose attribute is value, from their version in
+    models.versions and the query string and variant of the request"""
+    version = models.versions.version(cls.__name__, attribute, value)
+    return digest(version, request.query_string.decode(), variant)
+
+
+def matches_none(etag):
+    """tells if the If-None-Match header holds etag, or the ETag of one
+    of its compressed responses, in weak comparison"""
+    tags = request.if_none_match
+    return tags.star_tag or etag in {identity_etag(tag) for tag
+                                     in tags.as_set(include_weak=True)}
+
+
+def not_modified(etag):
+    """returns the 304 Not Modified response if the If-None-Match header
+    of a GET holds etag, else None"""
+    if request.method not in ('GET', 'HEAD') or not matches_none(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def check_if_match(obj):
+    """aborts with 412 Precondition Failed if the request has an If-Match
+    header not holding the ETag of obj, or the one of a compressed
+    response of obj, in strong comparison"""
+    tags = request.if_match
+    if not tags or tags.star_tag:
+        return
+    if resource_etag(obj) not in {identity_etag(tag)
+                                  for tag in tags.as_set()}:
+        abort(412)
+
+
+def resource(obj, status=200):
+    """returns the JSON response of obj with its ETag, or 304 Not Modified
+    when the If-None-Match header of a GET holds it
+
+    A GET with the fields query parameter only gets these attributes of
+    obj, and one with the expand query parameter also gets the children
+    it names (see expand_dicts), under an ETag of their own.
+    """
+    cls = obj.__class__.__name__
+    try:
+        fields = request_fields()
+        tree = request_expand(cls)
+    except ValueError as error:
+        return jsonify({'error': str(error)}), 400
+    etag = resource_etag(obj)
+    if fields is not None or tree is not None:
+        etag = digest(etag, ",".join(fields or []), request.query_string,
+                      version(tree, cls))
+    response = not_modified(etag)
+    if response is None:
+        response = jsonify(expand_dicts([obj], tree, fields)[0])
+        response.status_code = status
+        response.set_etag(etag)
+    return response
+
+
+def updated(obj):
+    """saves obj if the PUT changed one of its fields and returns its
+    response (see resource)
+
+    A PUT that changes nothing leaves updated_at and the store untouched,
+    so the ETag of obj stays valid.
+    """
+    if obj.changed_fields():
+        obj.save()
+    return resource(obj)
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+"""This module embeds the children of the listed objects in their
+dictionaries, as asked by the expand parameter"""
+
+import models
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.engine.query_planner import sort_key
+from flask import request
+
+# class name: {relationship: (child class, attribute of the child holding
+# the id of its parent, None for a many-to-many relationship)}
+relations = {"State": {"cities": (City, "state_id")},
+             "City": {"places": (Place, "city_id")},
+             "Place": {"reviews": (Review, "place_id"),
+                       "amenities": (Amenity, None)}}
+# (child class name, attribute): the HashIndex from parents to children
+indexes = {("City", "state_id"): "state_cities",
+           ("Place", "city_id"): "city_places",
+           ("Review", "place_id"): "place_reviews"}
+
+
+def parse_expand(expand, cls):
+    """returns the tree {relationship: subtree} of expand, a comma
+    separated list of dotted relationship paths such as
+    "cities.places.reviews", from the class named cls, or None if expand
+    is None
+
+    Raises ValueError if a relationship does not exist.
+    """
+    if expand is None:
+        return None
+    if isinstance(expand, list):
+        expand = ",".join(str(path) for path in expand)
+    if not isinstance(expand, str):
+        raise ValueError("Invalid expand")
+    tree = {}
+    for path in expand.split(','):
+        node = tree
+        parent = cls
+        for name in path.strip().split('.'):
+            if name not in relations.get(parent, {}):
+                raise ValueError("Invalid expand")
+            node = node.setdefault(name, {})
+            parent = relations[parent][name][0].__name__
+    return tree
+
+
+def request_expand(cls):
+    """returns the parsed expand query parameter of a GET request for the
+    objects of the class named cls, None for other methods
+
+    Raises ValueError if it is not valid.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    return parse_expand(request.args.get('expand'), cls)
+
+
+def dependencies(tree, cls):
+    """returns the sorted names of the classes whose writes change the
+    expansion tree of the objects of cls"""
+    names = set()
+    for name, subtree in (tree or {}).items():
+        child, attribute = relations[cls][name]
+        names.add(child.__name__)
+        if attribute is None:
+            # the many-to-many links are saved with the parent
+            names.add(cls)
+        names.update(dependencies(subtree, child.__name__))
+    return sorted(names)
+
+
+def scopes(expand):
+    """returns the (class name,) cache scopes of the classes whose writes
+    change the expansion of expand, whatever the class it starts from,
+    an empty list if it is not valid"""
+    for cls in relations:
+        try:
+            tree = parse_expand(expand, cls)
+        except ValueError:
+            continue
+        return [(name,) for name in dependencies(tree, cls)]
+    return []
+
+
+def version(tree, cls):
+    """returns the versions of the dependencies of tree, for the ETags"""
+    return ",".join(models.versions.version(name)
+                    for name in dependencies(tree, cls))
+
+
+def children(cls, name, objs):
+    """returns ({parent id: [child ids]}, children) for the relationship
+    name of the objects of the class named cls, loaded with a single
+    query whatever the number of objects"""
+    child, attribute = relations[cls][name]
+    ids = [obj.id for obj in objs]
+    grouped = {}
+    if attribute is None:
+        for parent_id, child_id in storage.links(cls, name, ids):
+            grouped.setdefault(parent_id, []).append(child_id)
+        child_ids = {i for group in grouped.values() for i in group}
+    else:
+        index = getattr(models, indexes[(child.__name__, attribute)])
+        child_ids = index.ids(ids)
+    found = sorted(storage.get_many(child, list(child_ids)),
+                   key=sort_key("created_at"))
+    if attribute is not None:
+        for obj in found:
+            grouped.setdefault(getattr(obj, attribute), []).append(obj.id)
+    return grouped, found
+
+
+def expand_dicts(objs, tree, fields=None):
+    """returns the dictionaries of objs, restricted to fields if given,
+    each holding under the relationships of tree the list of the
+    dictionaries of its children, themselves expanded by their subtree
+
+    The children of all objs are loaded at once for each relationship,
+    one query per level instead of one per object.
+    """
+    dicts = [obj.to_dict(fields=fields) for obj in objs]
+    if not objs or not tree:
+        return dicts
+    cls = objs[0].__class__.__name__
+    for name, subtree in tree.items():
+        grouped, found = children(cls, name, objs)
+        by_id = {child.id: child_dict for child, child_dict
+                 in zip(found, expand_dicts(found, subtree))}
+        for obj_dict, obj in zip(dicts, objs):
+            obj_dict[name] = [by_id[i] for i in grouped.get(obj.id, [])
+                              if i in by_id]
+    return dicts
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+"""This module parses the sparse fieldsets the responses are projected
+to"""
+
+from flask import request
+
+
+def parse_fields(fields):
+    """returns the list of the attribute names of fields, a comma separated
+    string or a list of strings, in order and without repeats, or None if
+    fields is None
+
+    Raises ValueError if one of the names is not a valid attribute name.
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    if not isinstance(fields, list) or \
+            not all(isinstance(name, str) for name in fields):
+        raise ValueError("Invalid fields")
+    names = []
+    for name in fields:
+        name = name.strip()
+        if not name.isidentifier():
+            raise ValueError("Invalid fields")
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def request_fields():
+    """returns the parsed fields query parameter of a GET request, None
+    for other methods
+
+    Raises ValueError if it is not valid.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    return parse_fields(request.args.get('fields'))
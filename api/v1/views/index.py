@@ -2,7 +2,8 @@
 """ index.py - index file for api/v1/views folder """
 
 from api.v1.views import app_views
-from flask import jsonify
+from flask import abort, jsonify, request
+import hmac
 import models
 from models.state import State
 from models.city import City
@@ -10,6 +11,8 @@ from models.amenity import Amenity
 from models.place import Place
 from models.review import Review
 from models.user import User
+from os import getenv
+from api.v1.views.caching import cached
 
 
 @app_views.route('/status', strict_slashes=False)
@@ -18,12 +21,82 @@ def status():
     return jsonify({"status": "OK"})
 
 
+# the header holding the secret of the admin endpoints, which are off
+# unless HBNB_ADMIN_SECRET is set
+admin_header = 'X-HBNB-Admin'
+admin_secret = getenv('HBNB_ADMIN_SECRET')
+
+# the /stats breakdowns: ?by=<key> counts the <name> objects of each
+# <parent>, by the attribute linking them to it
+breakdowns = {"state": ("cities", "City", "state_id"),
+              "city": ("places", "Place", "city_id"),
+              "place": ("reviews", "Review", "place_id")}
+
+
 @app_views.route('/stats', strict_slashes=False)
+@cached(("Amenity",), ("City",), ("Place",), ("Review",), ("State",),
+        ("User",))
 def stats():
-    """ Returns a JSON stats response """
-    return jsonify({"amenities": models.storage.count(Amenity),
-                    "cities": models.storage.count(City),
-                    "places": models.storage.count(Place),
-                    "reviews": models.storage.count(Review),
-                    "states": models.storage.count(State),
-                    "users": models.storage.count(User)}), 200
+    """ Returns a JSON stats response
+
+    The counts are read from models.counters. With ?by=state, ?by=city or
+    ?by=place the response also holds "by_<by>": {<id>: {<name>: count}}
+    with the cities of each state, the places of each city or the reviews
+    of each place, restricted to one parent with ?id=<id>.
+    """
+    counters = models.counters
+    result = {"amenities": counters.total(Amenity.__name__),
+              "cities": counters.total(City.__name__),
+              "places": counters.total(Place.__name__),
+              "reviews": counters.total(Review.__name__),
+              "states": counters.total(State.__name__),
+              "users": counters.total(User.__name__)}
+    by = request.args.get('by')
+    if by is not None:
+        if by not in breakdowns:
+            return jsonify({'error': "Invalid by"}), 400
+        name, cls, attribute = breakdowns[by]
+        parent_id = request.args.get('id')
+        if parent_id is not None:
+            counts = {parent_id: counters.count(cls, attribute, parent_id)}
+        else:
+            counts = counters.counts(cls, attribute)
+        result["by_" + by] = {parent_id: {name: count}
+                              for parent_id, count in counts.items()}
+    return jsonify(result), 200
+
+
+@app_views.route('/stats/rebuild', methods=['POST'], strict_slashes=False)
+def rebuild_stats():
+    """
+Recounts every object of storage into the counters served by /stats,
+fixing the wrong ones.
+
+Parameters:
+- X-HBNB-Admin (header): the secret of HBNB_ADMIN_SECRET
+
+Returns:
+- JSON response: {"fixed": <number of wrong counters>, "differences":
+[{"counter", "value", "kept", "actual"}]}, where counter is a class
+name for the totals and "<class>.<attribute>" for the breakdowns, and
+value the attribute value counted, null for the totals.
+
+Raises:
+- 404: If HBNB_ADMIN_SECRET is not set.
+- 403: If the header does not hold the secret.
+"""
+    if not admin_secret:
+        abort(404)
+    if not hmac.compare_digest(
+            request.headers.get(admin_header, '').encode(),
+            admin_secret.encode()):
+        abort(403)
+    differences = models.counters.verify()
+    if differences:
+        # the kept /stats responses hold the wrong counts
+        models.response_cache.store.clear()
+    return jsonify({"fixed": len(differences),
+                    "differences": [{"counter": name, "value": value,
+                                     "kept": kept, "actual": actual}
+                                    for name, value, kept, actual
+                                    in differences]}), 200
@@ -0,0 +1,251 @@
+#!/usr/bin/python3
+"""This module sorts and paginates the objects listed by the views"""
+
+import base64
+from datetime import datetime
+import json
+from models import storage
+from models.base_model import time
+from models.engine.query_planner import select, sort_key
+from api.v1.views.etags import collection_etag, not_modified
+from api.v1.views.fields import parse_fields
+from api.v1.views.expand import expand_dicts, parse_expand, version
+from flask import Response, jsonify, request, stream_with_context
+from flask import json as flask_json
+
+# the attributes holding datetimes, written as strings in the cursors
+datetimes = ('created_at', 'updated_at')
+# the attributes holding integers, the other ones holding strings
+integers = ('price_by_night', 'number_rooms', 'number_bathrooms',
+            'max_guest')
+
+# the content types a list can be streamed as
+JSON = 'application/json'
+NDJSON = 'application/x-ndjson'
+
+# the size in characters of the chunks a list is streamed by
+chunk_size = 16384
+# the number of objects whose children are loaded at once when expanded
+expand_size = 1000
+
+
+def parse_sort(sort, sortable):
+    """returns (attribute, descending) for a sort value such as "name" or
+    "-updated_at", (None, False) if sort is None
+
+    Raises ValueError if sort does not name one of the sortable
+    attributes.
+    """
+    if sort is None:
+        return None, False
+    if not isinstance(sort, str):
+        raise ValueError("Invalid sort")
+    attribute = sort.lstrip('-')
+    if attribute not in sortable:
+        raise ValueError("Invalid sort")
+    return attribute, sort.startswith('-')
+
+
+def parse_page(limit, offset):
+    """returns limit and offset as ints, limit staying None if not given
+
+    Raises ValueError if they are not non-negative integers.
+    """
+    try:
+        limit = None if limit is None else int(limit)
+        offset = int(offset or 0)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid limit or offset")
+    if (limit is not None and limit < 0) or offset < 0:
+        raise ValueError("Invalid limit or offset")
+    return limit, offset
+
+
+def encode_cursor(obj, order_by, descending):
+    """returns the opaque cursor of the page ending with obj"""
+    flag, value, obj_id = sort_key(order_by or 'created_at', descending)(obj)
+    if isinstance(value, datetime):
+        value = value.strftime(time)
+    data = json.dumps([order_by, descending, flag, value, obj_id])
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, order_by, descending):
+    """returns the select() key of the object ending the page of cursor
+
+    Raises ValueError if cursor is not valid or was made for another
+    order: its flag must be a bool, its id a string and its value one of
+    the type of order_by, or None only when the flag says the object
+    missed order_by.
+    """
+    if cursor is None:
+        return None
+    attribute = order_by or 'created_at'
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_order, cursor_desc, flag, value, obj_id = json.loads(data)
+        if attribute in datetimes and isinstance(value, str):
+            value = datetime.strptime(value, time)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if [cursor_order, cursor_desc] != [order_by, descending] or \
+            type(flag) is not bool or type(obj_id) is not str or \
+            (value is None) != (flag != descending):
+        raise ValueError("Invalid cursor")
+    if attribute in datetimes:
+        kind = datetime
+    else:
+        kind = int if attribute in integers else str
+    if value is not None and type(value) is not kind:
+        raise ValueError("Invalid cursor")
+    return (flag, value, obj_id)
+
+
+def parse_listing(args, sortable):
+    """returns (order_by, descending, limit, offset, after, fields) from
+    the sort, limit, offset, after and fields entries of args
+
+    Raises ValueError if one of them is not valid.
+    """
+    order_by, descending = parse_sort(args.get('sort'), sortable)
+    limit, offset = parse_page(args.get('limit'), args.get('offset'))
+    after = decode_cursor(args.get('after'), order_by, descending)
+    fields = parse_fields(args.get('fields'))
+    return order_by, descending, limit, offset, after, fields
+
+
+def needed(fields, order_by):
+    """returns the attributes to load from storage to list fields sorted
+    by order_by, None for all of them"""
+    if fields is None:
+        return None
+    return fields if order_by is None else fields + [order_by]
+
+
+def stream_format():
+    """returns the content type to stream a list as: NDJSON when asked by
+    ?format=ndjson or preferred by the Accept header, else JSON"""
+    fmt = request.args.get('format')
+    if fmt is not None:
+        return NDJSON if fmt == 'ndjson' else JSON
+    if request.accept_mimetypes.best_match([JSON, NDJSON]) == NDJSON:
+        return NDJSON
+    return JSON
+
+
+def dictionaries(objs, fields=None, expand=None):
+    """yields the dictionaries of objs, restricted to fields if given and
+    expanded by the expand tree by expand_size objects at a time"""
+    if not expand:
+        for obj in objs:
+            yield obj.to_dict(fields=fields)
+        return
+    objs = list(objs)
+    for i in range(0, len(objs), expand_size):
+        for obj_dict in expand_dicts(objs[i:i + expand_size], expand,
+                                     fields):
+            yield obj_dict
+
+
+def encode_stream(objs, mimetype=JSON, fields=None, expand=None):
+    """yields the dictionaries of objs, restricted to fields if given and
+    expanded by the expand tree if given, encoded as a JSON array, or one
+    per line for NDJSON, in chunks of about chunk_size characters
+
+    Each object is encoded when its turn comes, so neither the list of
+    dictionaries nor the whole document is ever held in memory.
+    """
+    ndjson = mimetype == NDJSON
+    parts = [] if ndjson else ['[']
+    size = 0
+    for i, obj_dict in enumerate(dictionaries(objs, fields, expand)):
+        text = flask_json.dumps(obj_dict)
+        if ndjson:
+            parts.append(text + '\n')
+        else:
+            parts.append(text if i == 0 else ',' + text)
+        size += len(text) + 1
+        if size >= chunk_size:
+            yield ''.join(parts)
+            parts = []
+            size = 0
+    if not ndjson:
+        parts.append(']\n')
+    if parts:
+        yield ''.join(parts)
+
+
+def page_response(objs, limit, order_by, descending, fields=None,
+                  expand=None):
+    """returns the streamed response listing the dictionaries of objs,
+    restricted to fields and expanded by the expand tree if given, where
+    objs hold up to limit + 1 objects:
+    when the extra one is there, it is left out and the cursor of the
+    next page is sent in the X-Next-Cursor header
+
+    The list is a JSON array, or NDJSON (one object per line) when asked
+    by stream_format(), sent with chunked transfer as it is encoded.
+    """
+    mimetype = stream_format()
+    response = Response(stream_with_context(
+        encode_stream(objs[:limit], mimetype, fields, expand)),
+        mimetype=mimetype)
+    if limit and len(objs) > limit:
+        response.headers['X-Next-Cursor'] = encode_cursor(
+            objs[limit - 1], order_by, descending)
+    return response, 200
+
+
+def listing(cls, sortable, ids=None, group=None):
+    """returns the JSON response listing the objects of cls, or only the
+    ones with the given ids, which are the ones whose attribute is value
+    when group is (attribute, value)
+
+    The objects are sorted by the sort query parameter, one of sortable
+    with a leading "-" for the descending order, by (created_at, id) when a
+    page or only the given ids are asked without sort, and paginated by the
+    limit and either the offset or the after ones. after is the cursor sent
+    in the X-Next-Cursor header of the previous page, so no object is
+    skipped or repeated when objects are added meanwhile; the whole class
+    listed in the default order is read from the ordered storage page(), so
+    each page costs the same. Otherwise only the listed objects are
+    selected, with a heap, instead of sorting them all. With the fields
+    query parameter, a comma separated list of attributes, only these are
+    loaded from storage and listed; with the expand one, e.g.
+    "cities.places", the objects hold their children (see expand_dicts).
+
+    The response has the ETag of the collection, from its version in
+    models.versions, and is 304 Not Modified without reading any object
+    when the If-None-Match header holds it.
+    """
+    try:
+        expand = parse_expand(request.args.get('expand'), cls.__name__)
+        order_by, descending, limit, offset, after, fields = parse_listing(
+            request.args, sortable)
+    except ValueError as error:
+        return jsonify({'error': str(error)}), 400
+    etag = collection_etag(cls, *(group or ()), variant=stream_format() +
+                           version(expand, cls.__name__))
+    response = not_modified(etag)
+    if response is not None:
+        return response
+    more = None if limit is None else offset + limit + 1
+    if ids is None and order_by is None and not descending and (
+            limit is not None or after is not None):
+        objs = storage.page(cls, None if after is None else after[1:],
+                            more, fields)[offset:]
+    else:
+        if ids is None:
+            objs = storage.all(cls, needed(fields, order_by)).values()
+            key = order_by
+        else:
+            objs = storage.get_many(cls, list(ids),
+                                    needed(fields, order_by))
+            # the ids come from an index set, in no particular order
+            key = order_by or 'created_at'
+        objs = select(objs, key, descending,
+                      None if more is None else more - offset, offset, after)
+    response, status = page_response(objs, limit, order_by, descending,
+                                     fields, expand)
+    response.set_etag(etag)
+    return response, status
@@ -2,23 +2,49 @@
 """This module creates a new view for user objects"""
 
 from api.v1.views import app_views
-from models import storage, storage_t
+from models import storage, place_locations, amenity_places
+from models import city_places, state_cities, place_ranges, place_columns
+from models.engine.query_planner import QueryPlanner, InPredicate
+from models.engine.query_planner import LinkedPredicate, RangePredicate
+from api.v1.views.listing import listing, parse_listing, page_response
+from api.v1.views.etags import check_if_match, resource, updated
+from api.v1.views.caching import cached
+from api.v1.views.expand import parse_expand
+from api.v1.views.bulk import bulk_create, bulk_update, bulk_delete
 from models.city import City
 from models.state import State
 from models.amenity import Amenity
 from models.user import User
 from models.place import Place
 from flask import jsonify, abort, request
+import math
+
+place_planner = QueryPlanner(storage, Place)
+# Place attributes the place listings can be sorted by
+sortable = ('name', 'price_by_night', 'number_rooms', 'number_bathrooms',
+            'max_guest', 'created_at', 'updated_at')
+# the (lower bound, upper bound) keys of the places_search range filters
+range_filters = {'price_by_night': ('price_min', 'price_max'),
+                 'max_guest': ('min_guests', 'max_guests'),
+                 'number_rooms': ('min_rooms', 'max_rooms'),
+                 'number_bathrooms': ('min_bathrooms', 'max_bathrooms')}
+# the places/stats group_by values and the columns they group by
+groupable = {'city': 'city_id', 'user': 'user_id'}
 
 
 @app_views.route('/cities/<city_id>/places', methods=['GET'],
                  strict_slashes=False)
+@cached(("City", "id", "city_id"), ("Place", "city_id", "city_id"))
 def get_places(city_id):
     """
 Retrieves the list of all Place objects for a given city.
 
 Parameters:
 - city_id (str): The ID of the city.
+- sort (str, query string): one of the sortable Place attributes, with a
+leading "-" to sort in descending order
+- limit, offset, after (query string): the page of places to list, after
+being the X-Next-Cursor header of the previous page
 
 Returns:
 - JSON response: A JSON response
@@ -31,8 +57,8 @@ Raises:
     city = storage.get(City, city_id)
     if city is None:
         abort(404)
-    places = [place.to_dict() for place in city.places]
-    return jsonify(places), 200
+    return listing(Place, sortable, city_places.ids([city_id]),
+                   ('city_id', city_id))
 
 
 @app_views.route('/places/<place_id>', methods=['GET'], strict_slashes=False)
@@ -52,7 +78,7 @@ Raises:
     place = storage.get(Place, place_id)
     if place is None:
         abort(404)
-    return jsonify(place.to_dict()), 200
+    return resource(place)
 
 
 @app_views.route('/places/<place_id>', methods=['DELETE'],
@@ -73,6 +99,7 @@ Raises:
     place = storage.get(Place, place_id)
     if place is None:
         abort(404)
+    check_if_match(place)
     storage.delete(place)
     storage.save()
     return jsonify({}), 200
@@ -135,23 +162,42 @@ Raises:
     place = storage.get(Place, place_id)
     if place is None:
         abort(404)
+    check_if_match(place)
     if not request.get_json():
         abort(400, description="Not a JSON")
     for key, value in request.get_json().items():
         if key not in ['id', 'user_id', 'city_id', 'created_at', 'updated_at']:
             setattr(place, key, value)
-    place.save()
-    return jsonify(place.to_dict()), 200
+    return updated(place)
 
 
 @app_views.route('/places_search', methods=['POST'],
                  strict_slashes=False)
+@cached(("Place",), ("City",), ("Amenity",))
 def places_search():
     """
 Retrieves all Place objects depending on search request.
 
 Parameters:
-- None
+- None (JSON body, every key is optional):
+  - states (list): State ids; places in one of their cities match
+  - cities (list): City ids; places in one of them match
+  - amenities (list): Amenity ids; places linked to all of them match
+  - price_min, price_max (int): bounds of price_by_night, included
+  - min_guests, max_guests (int): bounds of max_guest, included
+  - min_rooms, max_rooms (int): bounds of number_rooms, included
+  - min_bathrooms, max_bathrooms (int): bounds of number_bathrooms,
+    included
+  - sort (str): one of the sortable Place attributes, with a leading
+    "-" to sort in descending order; order_by is accepted as well
+  - limit (int): the maximum number of places returned
+  - offset (int): the number of places skipped (default 0)
+  - after (str): the X-Next-Cursor header of the previous page, to get
+    the places following it
+  - fields (list): the attributes to return, e.g. ["id", "name",
+    "price_by_night"]; only these are loaded from storage
+  - expand (str): "reviews", "amenities" or both comma separated, to
+    embed these children in each place
 
 Returns:
 - JSON response containing the search
@@ -165,49 +211,226 @@ places_search()
     if not search_request or not isinstance(search_request, dict):
         return jsonify({'error': "Not a JSON"}), 400
 
-    if not search_request or not any(search_request.values()):
-        places = []
-        for place in storage.all(Place).values():
-            places.append(place.to_dict())
-        return jsonify(places), 200
-
-    search_results = []
-    states = search_request.get('states', [])
-    cities = search_request.get('cities', [])
-    amenities = search_request.get('amenities', [])
-    all_places = []
-    all_cities = []
-    if states:
-        for state_id in states:
-            state = storage.get(State, state_id)
-            if state:
-                if storage_t == 'db':
-                    all_cities.extend(state.cities)
-                else:
-                    all_cities.extend(state.cities())
-
-    if cities:
-        for city_id in cities:
-            city = storage.get(City, city_id)
-            if city and city not in all_cities:
-                all_cities.append(city)
-
-    city_ids = [city.id for city in all_cities]
-    for place in storage.all(Place).values():
-        if place.city_id in city_ids:
-            all_places.append(place)
-
+    states = search_request.get('states') or []
+    cities = search_request.get('cities') or []
+    amenities = search_request.get('amenities') or []
+    predicates = []
+    if states or cities:
+        # states and cities select the union of their cities
+        city_ids = state_cities.ids(states) | set(cities)
+        predicates.append(InPredicate(city_places, city_ids))
     if amenities:
-        for place in all_places:
-            place_amenities = []    # store amenities in a place
-            if storage_t == 'db':
-                place_amenities.extend(place.amenities)
-            else:
-                place_amenities.extend(place.amenities())
-            if all(amenity in place_amenities for amenity in amenities):
-                search_results.append(place.to_dict())
-    else:
-        for place in all_places:
-            search_results.append(place.to_dict())
-
-    return jsonify(search_results), 200
+        predicates.append(LinkedPredicate(amenity_places, amenities))
+    try:
+        for attribute, keys in range_filters.items():
+            low, high = (search_request.get(key) for key in keys)
+            if low is not None or high is not None:
+                predicates.append(RangePredicate(
+                    attribute,
+                    None if low is None else int(low),
+                    None if high is None else int(high),
+                    place_ranges[attribute]))
+    except (TypeError, ValueError):
+        return jsonify({'error': "Invalid range"}), 400
+    page_args = dict(search_request)
+    page_args.setdefault('sort', search_request.get('order_by'))
+    try:
+        order_by, descending, limit, offset, after, fields = parse_listing(
+            page_args, sortable)
+        expand = parse_expand(search_request.get('expand'), "Place")
+    except ValueError as error:
+        return jsonify({'error': str(error)}), 400
+
+    total, places = place_planner.run(
+        predicates, order_by, descending,
+        None if limit is None else limit + 1, offset, after, fields)
+    return page_response(places, limit, order_by, descending, fields,
+                         expand)
+
+
+def location(lat, lon):
+    """returns lat and lon as floats, raising ValueError unless they are
+    finite and within [-90, 90] and [-180, 180]"""
+    lat, lon = float(lat), float(lon)
+    if not (math.isfinite(lat) and math.isfinite(lon)) or \
+            not -90 <= lat <= 90 or not -180 <= lon <= 180:
+        raise ValueError
+    return lat, lon
+
+
+@app_views.route('/places_nearby', methods=['POST'],
+                 strict_slashes=False)
+def places_nearby():
+    """
+Retrieves the Place objects near a point or inside a bounding box,
+nearest first.
+
+Parameters:
+- None (JSON body):
+  - latitude, longitude (float): the point to search around
+  - radius (float): the search radius in kilometers
+  - bbox (list): [min_latitude, min_longitude, max_latitude,
+    max_longitude], used instead of radius; results are ordered by
+    distance to the point if given, else to the center of the box
+  - limit (int): the maximum number of places returned (default 50)
+
+Returns:
+- JSON response containing the places, each with its distance in
+kilometers under "distance".
+
+Raises:
+- 400: If the request is not a JSON or the search area is not valid:
+  a non-finite or negative radius, or a latitude or longitude that is
+  not finite or out of range.
+"""
+    search_request = request.get_json(silent=True)
+    if not search_request or not isinstance(search_request, dict):
+        return jsonify({'error': "Not a JSON"}), 400
+    try:
+        limit = int(search_request.get('limit', 50))
+        lat = search_request.get('latitude')
+        lon = search_request.get('longitude')
+        if lat is not None and lon is not None:
+            lat, lon = location(lat, lon)
+        bbox = search_request.get('bbox')
+        if bbox is not None:
+            min_lat, min_lon, max_lat, max_lon = bbox
+            min_lat, min_lon = location(min_lat, min_lon)
+            max_lat, max_lon = location(max_lat, max_lon)
+            found = place_locations.within(min_lat, min_lon, max_lat,
+                                           max_lon, lat, lon, limit)
+        elif lat is not None and lon is not None and \
+                search_request.get('radius') is not None:
+            radius = float(search_request['radius'])
+            if not math.isfinite(radius) or radius < 0:
+                raise ValueError
+            found = place_locations.nearby(lat, lon, radius, limit)
+        else:
+            raise ValueError
+    except (TypeError, ValueError, OverflowError):
+        return jsonify({'error': "Missing or invalid search area"}), 400
+    distances = {}
+    for distance, place_id in found:
+        distances[place_id] = distance
+    results = []
+    for place in storage.get_many(Place, [pid for d, pid in found]):
+        place_dict = place.to_dict()
+        place_dict['distance'] = distances[place.id]
+        results.append(place_dict)
+    return jsonify(results), 200
+
+
+@app_views.route('/places/stats', methods=['GET'], strict_slashes=False)
+@cached(("Place",))
+def places_stats():
+    """
+Aggregates the numeric attributes of all Place objects, computed on the
+columnar copy of the places.
+
+Parameters (query string):
+- group_by (str): "city" or "user" to aggregate per city or per user
+- columns (str): comma separated numeric attributes to aggregate
+(default: price_by_night, number_rooms, number_bathrooms, max_guest,
+latitude and longitude)
+- histogram (str): a numeric attribute to also count in bins
+- bins (int): the number of histogram bins, 1 to 1000 (default 10)
+
+Returns:
+- JSON response: {"groups": [...]} where each group holds its "count",
+its city_id or user_id when grouped, and the sum, mean, min and max of
+each column; with histogram, also {"histogram": {"counts": [...],
+"edges": [...]}}.
+
+Raises:
+- 400: If group_by, columns, histogram or bins are not valid.
+- 501: If NumPy is not installed.
+"""
+    if not place_columns.enabled:
+        return jsonify({'error': "Not available without NumPy"}), 501
+    group_by = request.args.get('group_by')
+    if group_by is not None and group_by not in groupable:
+        return jsonify({'error': "Invalid group_by"}), 400
+    columns = request.args.get('columns')
+    if columns is not None:
+        columns = [name.strip() for name in columns.split(',')]
+        if not all(name in place_columns.numeric for name in columns):
+            return jsonify({'error': "Invalid columns"}), 400
+    histogram = request.args.get('histogram')
+    if histogram is not None and histogram not in place_columns.numeric:
+        return jsonify({'error': "Invalid histogram"}), 400
+    try:
+        bins = int(request.args.get('bins', 10))
+    except ValueError:
+        return jsonify({'error': "Invalid bins"}), 400
+    if not 1 <= bins <= 1000:
+        return jsonify({'error': "Invalid bins"}), 400
+
+    result = {"groups": place_columns.stats(groupable.get(group_by),
+                                            columns)}
+    if histogram is not None:
+        counts, edges = place_columns.histogram(histogram, bins)
+        result["histogram"] = {"counts": counts, "edges": edges}
+    return jsonify(result), 200
+
+
+@app_views.route('/places/bulk', methods=['POST'], strict_slashes=False)
+def create_places_bulk():
+    """
+Creates many Place objects in a single write.
+
+Parameters:
+- None (JSON body): a list of Place dictionaries, each with a
+"name", the "city_id" of an existing City and the "user_id" of an
+existing User.
+
+Returns:
+- A JSON response containing the list of the created Place objects and
+a status code of 201.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of them is not valid; nothing is created then, and the response
+lists the "errors" as {"index", "error"} dictionaries.
+"""
+    return bulk_create(Place, ['name', 'city_id', 'user_id'],
+                       {'city_id': City, 'user_id': User})
+
+
+@app_views.route('/places/bulk', methods=['PUT'], strict_slashes=False)
+def update_places_bulk():
+    """
+Updates many Place objects in a single write.
+
+Parameters:
+- None (JSON body): a list of dictionaries, each with the "id" of a
+Place and the attributes to update; the keys
+id, user_id, city_id, created_at, updated_at are ignored.
+
+Returns:
+- A JSON response containing the list of the updated Place objects and
+a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of the ids is not found; nothing is updated then.
+"""
+    return bulk_update(Place, ['id', 'user_id', 'city_id', 'created_at',
+                               'updated_at'])
+
+
+@app_views.route('/places/bulk', methods=['DELETE'], strict_slashes=False)
+def delete_places_bulk():
+    """
+Deletes many Place objects in a single write.
+
+Parameters:
+- None (JSON body): the list of the ids of the Place objects to delete.
+
+Returns:
+- An empty JSON response and a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of strings, or if one
+of the ids is not found; nothing is deleted then.
+"""
+    return bulk_delete(Place)
@@ -11,10 +11,12 @@ from models.user import User
 from models.place import Place
 from models.review import Review
 from models import storage_t
+from api.v1.views.caching import cached
 
 
 @app_views.route('/places/<place_id>/amenities', methods=['GET'],
                  strict_slashes=False)
+@cached(("Place", "id", "place_id"), ("Amenity",))
 def get_place_amenities(place_id):
     """
 Retrieves the list of all Amenity objects of a Place.
@@ -33,13 +35,8 @@ Raises:
     place = storage.get(Place, place_id)
     if place is None:
         abort(404)
-    amenities = []
     place_amenities = []
-    if storage_t == 'db':
-        amenities = place.amenities
-    else:
-        amenities = place.amenities()
-    for amenity in amenities:
+    for amenity in place.amenities:
         place_amenities.append(amenity.to_dict())
     return jsonify(place_amenities), 200
 
@@ -71,11 +68,13 @@ Raises:
             abort(404)
         place.amenities.remove(amenity)
     else:
-        if amenity not in place.amenities():
+        if amenity.id not in place.amenity_ids:
             abort(404)
-        place.amenities().remove(amenity)
-
-    storage.save()
+        place.amenity_ids = [amenity_id for amenity_id in place.amenity_ids
+                             if amenity_id != amenity.id]
+    # the write event of the place updates the amenity_places index, and
+    # its new updated_at its ETag
+    place.save()
     return jsonify({}), 200
 
 
@@ -101,14 +100,15 @@ Raises:
     amenity = storage.get(Amenity, amenity_id)
     if amenity is None:
         abort(404)
-    place_amenities = []
     if storage_t == 'db':
-        place_amenities = place.amenities
+        if amenity in place.amenities:
+            return jsonify(amenity.to_dict()), 200
+        place.amenities.append(amenity)
     else:
-        place_amenities = place.amenities()
-
-    if amenity in place_amenities:
-        return jsonify(amenity.to_dict()), 200
-    place_amenities.append(amenity)
-    storage.save()
+        if amenity.id in place.amenity_ids:
+            return jsonify(amenity.to_dict()), 200
+        place.amenity_ids = place.amenity_ids + [amenity.id]
+    # the write event of the place updates the amenity_places index, and
+    # its new updated_at its ETag
+    place.save()
     return jsonify(amenity.to_dict()), 201
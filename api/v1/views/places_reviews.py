@@ -2,7 +2,7 @@
 """This module creates new view for user objects"""
 
 from api.v1.views import app_views
-from models import storage
+from models import storage, place_reviews
 from models.city import City
 from models.state import State
 from models.amenity import Amenity
@@ -10,16 +10,29 @@ from models.user import User
 from models.place import Place
 from models.review import Review
 from flask import jsonify, abort, request
+from api.v1.views.listing import listing
+from api.v1.views.etags import check_if_match, resource, updated
+from api.v1.views.caching import cached
+from api.v1.views.bulk import bulk_create, bulk_update, bulk_delete
+
+# Review attributes the review listings can be sorted by
+sortable = ('text', 'user_id', 'created_at', 'updated_at')
 
 
 @app_views.route('/places/<place_id>/reviews', methods=['GET'],
                  strict_slashes=False)
+@cached(("Place", "id", "place_id"), ("Review", "place_id", "place_id"))
 def get_reviews(place_id):
     """
 Retrieves the list of all Review objects.
 
 Parameters:
 - place_id (str): The ID of the place to retrieve reviews for.
+- sort (str, query string): one of the sortable Review attributes, with
+a leading "-" to sort in descending order, e.g. -updated_at for the
+most recently updated reviews first
+- limit, offset, after (query string): the page of reviews to list,
+after being the X-Next-Cursor header of the previous page
 
 Returns:
 - tuple: A tuple containing the JSON
@@ -32,10 +45,8 @@ Raises:
     place = storage.get(Place, place_id)
     if place is None:
         abort(404)
-    reviews = []
-    for review in place.reviews:
-        reviews.append(review.to_dict())
-    return jsonify(reviews), 200
+    return listing(Review, sortable, place_reviews.ids([place_id]),
+                   ('place_id', place_id))
 
 
 @app_views.route('/reviews/<review_id>', methods=['GET'],
@@ -58,7 +69,7 @@ Raises:
     review = storage.get(Review, review_id)
     if review is None:
         abort(404)
-    return jsonify(review.to_dict()), 200
+    return resource(review)
 
 
 @app_views.route('/reviews/<review_id>', methods=['DELETE'],
@@ -80,6 +91,7 @@ Raises:
     review = storage.get(Review, review_id)
     if review is None:
         abort(404)
+    check_if_match(review)
     storage.delete(review)
     storage.save()
     return jsonify({}), 200
@@ -145,11 +157,74 @@ not exist.
     review = storage.get(Review, review_id)
     if review is None:
         abort(404)
+    check_if_match(review)
     if not request.get_json():
         abort(400, description="Not a JSON")
     for key, value in request.get_json().items():
         if key not in ['id', 'user_id', 'place_id', 'created_at',
                        'updated_at']:
             setattr(review, key, value)
-    review.save()
-    return jsonify(review.to_dict()), 200
+    return updated(review)
+
+
+@app_views.route('/reviews/bulk', methods=['POST'], strict_slashes=False)
+def create_reviews_bulk():
+    """
+Creates many Review objects in a single write.
+
+Parameters:
+- None (JSON body): a list of Review dictionaries, each with a
+"text", the "place_id" of an existing Place and the "user_id" of an
+existing User.
+
+Returns:
+- A JSON response containing the list of the created Review objects and
+a status code of 201.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of them is not valid; nothing is created then, and the response
+lists the "errors" as {"index", "error"} dictionaries.
+"""
+    return bulk_create(Review, ['text', 'place_id', 'user_id'],
+                       {'place_id': Place, 'user_id': User})
+
+
+@app_views.route('/reviews/bulk', methods=['PUT'], strict_slashes=False)
+def update_reviews_bulk():
+    """
+Updates many Review objects in a single write.
+
+Parameters:
+- None (JSON body): a list of dictionaries, each with the "id" of a
+Review and the attributes to update; the keys
+id, user_id, place_id, created_at, updated_at are ignored.
+
+Returns:
+- A JSON response containing the list of the updated Review objects and
+a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of the ids is not found; nothing is updated then.
+"""
+    return bulk_update(Review, ['id', 'user_id', 'place_id', 'created_at',
+                                'updated_at'])
+
+
+@app_views.route('/reviews/bulk', methods=['DELETE'], strict_slashes=False)
+def delete_reviews_bulk():
+    """
+Deletes many Review objects in a single write.
+
+Parameters:
+- None (JSON body): the list of the ids of the Review objects to delete.
+
+Returns:
+- An empty JSON response and a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of strings, or if one
+of the ids is not found; nothing is deleted then.
+"""
+    return bulk_delete(Review)
@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""This module creates the full-text search view over places and reviews"""
+
+from api.v1.views import app_views
+from models import storage, text_index
+from models.place import Place
+from models.review import Review
+from flask import jsonify, request
+from api.v1.views.caching import cached
+
+searchable = {"place": Place, "review": Review}
+
+
+@app_views.route('/search', methods=['GET'], strict_slashes=False)
+@cached(("Place",), ("Review",))
+def search():
+    """
+Ranked full-text search over Place names and descriptions and Review
+texts.
+
+Parameters (query string):
+- q (str): the search terms
+- type (str): "place" or "review" to search only one kind of object
+- limit (int): the page size, 1 to 100 (default 10)
+- offset (int): the number of results to skip (default 0)
+
+Returns:
+- JSON response: {"total": <number of matches>, "results": [...]} where
+each result is the object dictionary with its BM25 "score", best first.
+
+Raises:
+- 400: If q is missing or type, limit or offset are not valid.
+"""
+    query = request.args.get('q', '').strip()
+    kind = request.args.get('type')
+    try:
+        limit = int(request.args.get('limit', 10))
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        return jsonify({'error': "Invalid limit or offset"}), 400
+    if not query:
+        return jsonify({'error': "Missing q"}), 400
+    if kind is not None and kind not in searchable:
+        return jsonify({'error': "Invalid type"}), 400
+    if not 1 <= limit <= 100 or offset < 0:
+        return jsonify({'error': "Invalid limit or offset"}), 400
+    classes = [searchable[kind].__name__] if kind else None
+    total, hits = text_index.search(query, classes, limit, offset)
+    by_class = {}
+    for score, key in hits:
+        cls_name, obj_id = key.split('.', 1)
+        by_class.setdefault(cls_name, []).append(obj_id)
+    found = {}
+    for cls in searchable.values():
+        for obj in storage.get_many(cls, by_class.get(cls.__name__, [])):
+            found[cls.__name__ + '.' + obj.id] = obj
+    results = []
+    for score, key in hits:
+        if key in found:
+            obj_dict = found[key].to_dict()
+            obj_dict['score'] = score
+            results.append(obj_dict)
+    return jsonify({"total": total, "results": results}), 200
@@ -5,24 +5,34 @@ from api.v1.views import app_views
 from models import storage
 from models.state import State
 from flask import jsonify, abort, request
+from api.v1.views.listing import listing
+from api.v1.views.etags import check_if_match, resource, updated
+from api.v1.views.caching import cached
+from api.v1.views.bulk import bulk_create, bulk_update, bulk_delete
+
+# State attributes the state listings can be sorted by
+sortable = ('name', 'created_at', 'updated_at')
 
 
 @app_views.route('/states', methods=['GET'], strict_slashes=False)
+@cached(("State",))
 def get_states():
     """
 This function retrieves a list of all State objects.
 
 It defines a GET request to the endpoint /states.
 
+Parameters (query string):
+    sort (str): one of the sortable State attributes, with a leading "-"
+    to sort in descending order
+    limit, offset, after: the page of states to list, after being the
+    X-Next-Cursor header of the previous page
+
 Returns:
     A JSON response containing a list of all
     State objects and a status code of 200.
 """
-    states = storage.all(State)
-    state_list = []
-    for state in states.values():
-        state_list.append(state.to_dict())
-    return jsonify(state_list), 200
+    return listing(State, sortable)
 
 
 @app_views.route('/states/<state_id>', methods=['GET'], strict_slashes=False)
@@ -45,7 +55,7 @@ does not exist.
     state = storage.get(State, state_id)
     if state is None:
         abort(404)
-    return jsonify(state.to_dict()), 200
+    return resource(state)
 
 
 @app_views.route('/states/<state_id>', methods=['DELETE'],
@@ -57,6 +67,7 @@ def delete_state(state_id):
     state = storage.get(State, state_id)
     if state is None:
         abort(404)
+    check_if_match(state)
     storage.delete(state)
     storage.save()
     return jsonify({}), 200
@@ -120,8 +131,68 @@ given ID does not exist.
     state = storage.get(State, state_id)
     if state is None:
         abort(404)
+    check_if_match(state)
     for key, value in state_json.items():
         if key not in ['id', 'created_at', 'updated_at']:
             setattr(state, key, value)
-    storage.save()
-    return jsonify(state.to_dict()), 200
+    return updated(state)
+
+
+@app_views.route('/states/bulk', methods=['POST'], strict_slashes=False)
+def create_states_bulk():
+    """
+Creates many State objects in a single write.
+
+Parameters:
+- None (JSON body): a list of State dictionaries, each with a
+"name".
+
+Returns:
+- A JSON response containing the list of the created State objects and
+a status code of 201.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of them is not valid; nothing is created then, and the response
+lists the "errors" as {"index", "error"} dictionaries.
+"""
+    return bulk_create(State, ['name'])
+
+
+@app_views.route('/states/bulk', methods=['PUT'], strict_slashes=False)
+def update_states_bulk():
+    """
+Updates many State objects in a single write.
+
+Parameters:
+- None (JSON body): a list of dictionaries, each with the "id" of a
+State and the attributes to update; the keys
+id, created_at, updated_at are ignored.
+
+Returns:
+- A JSON response containing the list of the updated State objects and
+a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of the ids is not found; nothing is updated then.
+"""
+    return bulk_update(State, ['id', 'created_at', 'updated_at'])
+
+
+@app_views.route('/states/bulk', methods=['DELETE'], strict_slashes=False)
+def delete_states_bulk():
+    """
+Deletes many State objects in a single write.
+
+Parameters:
+- None (JSON body): the list of the ids of the State objects to delete.
+
+Returns:
+- An empty JSON response and a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of strings, or if one
+of the ids is not found; nothing is deleted then.
+"""
+    return bulk_delete(State)
@@ -8,24 +8,35 @@ from models.state import State
 from models.amenity import Amenity
 from models.user import User
 from flask import jsonify, abort, request
+from api.v1.views.listing import listing
+from api.v1.views.etags import check_if_match, resource, updated
+from api.v1.views.caching import cached
+from api.v1.views.bulk import bulk_create, bulk_update, bulk_delete
+
+# User attributes the user listings can be sorted by
+sortable = ('email', 'first_name', 'last_name', 'created_at', 'updated_at')
 
 
 @app_views.route('/users', methods=['GET'], strict_slashes=False)
+@cached(("User",))
 def get_users():
     """
 This function retrieves a list of all User objects.
 
 It defines a GET request to the endpoint /users.
 
+Parameters (query string):
+    sort (str): one of the sortable User attributes, with a leading "-"
+    to sort in descending order
+    limit, offset, after: the page of users to list, after being the
+    X-Next-Cursor header of the previous page
+
 Returns:
     A JSON response containing a list of User objects in dictionary format.
-    The HTTP status code 200 indicating a successful request.
+    The HTTP status code 200 indicating a successful request, or 400 if
+    sort, limit or offset are not valid.
 """
-    users = storage.all(User)
-    user_list = []
-    for user in users.values():
-        user_list.append(user.to_dict())
-    return jsonify(user_list), 200
+    return listing(User, sortable)
 
 
 @app_views.route('/users/<user_id>', methods=['GET'], strict_slashes=False)
@@ -45,7 +56,7 @@ Raises:
     user = storage.get(User, user_id)
     if user is None:
         abort(404)
-    return jsonify(user.to_dict()), 200
+    return resource(user)
 
 
 @app_views.route('/users/<user_id>', methods=['DELETE'],
@@ -55,6 +66,7 @@ def delete_user(user_id):
     user = storage.get(User, user_id)
     if user is None:
         abort(404)
+    check_if_match(user)
     storage.delete(user)
     storage.save()
     return jsonify({}), 200
@@ -119,9 +131,69 @@ specified ID does not exist.
     user = storage.get(User, user_id)
     if user is None:
         abort(404)
+    check_if_match(user)
     for key, value in user_json.items():
         # Ignoring keys: id, email, created_at and updated_at
         if key not in ['id', 'email', 'created_at', 'updated_at']:
             setattr(user, key, value)
-    storage.save()
-    return jsonify(user.to_dict()), 200
+    return updated(user)
+
+
+@app_views.route('/users/bulk', methods=['POST'], strict_slashes=False)
+def create_users_bulk():
+    """
+Creates many User objects in a single write.
+
+Parameters:
+- None (JSON body): a list of User dictionaries, each with an
+"email" and a "password".
+
+Returns:
+- A JSON response containing the list of the created User objects and
+a status code of 201.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of them is not valid; nothing is created then, and the response
+lists the "errors" as {"index", "error"} dictionaries.
+"""
+    return bulk_create(User, ['email', 'password'])
+
+
+@app_views.route('/users/bulk', methods=['PUT'], strict_slashes=False)
+def update_users_bulk():
+    """
+Updates many User objects in a single write.
+
+Parameters:
+- None (JSON body): a list of dictionaries, each with the "id" of a
+User and the attributes to update; the keys
+id, email, created_at, updated_at are ignored.
+
+Returns:
+- A JSON response containing the list of the updated User objects and
+a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of dictionaries, or if
+one of the ids is not found; nothing is updated then.
+"""
+    return bulk_update(User, ['id', 'email', 'created_at', 'updated_at'])
+
+
+@app_views.route('/users/bulk', methods=['DELETE'], strict_slashes=False)
+def delete_users_bulk():
+    """
+Deletes many User objects in a single write.
+
+Parameters:
+- None (JSON body): the list of the ids of the User objects to delete.
+
+Returns:
+- An empty JSON response and a status code of 200.
+
+Raises:
+- 400 Bad Request if the body is not a JSON list of strings, or if one
+of the ids is not found; nothing is deleted then.
+"""
+    return bulk_delete(User)
@@ -0,0 +1,2 @@
+#!/usr/bin/python3
+"""benchmarks of the storage indexes"""
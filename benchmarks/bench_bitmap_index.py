@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""
+Measures amenity filtering with the bitmap index against a full scan
+
+usage: python3 -m benchmarks.bench_bitmap_index [number of places]
+"""
+
+from models.engine.bitmap_index import BitmapIndex
+import random
+import sys
+import time
+
+
+class Place:
+    """stand-in for a stored Place"""
+    def __init__(self, i):
+        """keeps the id"""
+        self.id = str(i)
+
+
+class Store:
+    """stand-in storage holding places and their amenity links"""
+    def __init__(self, places, links):
+        """keeps the places by key and the (place id, amenity id) links"""
+        self.places = {"Place." + p.id: p for p in places}
+        self.pairs = links
+
+    def all(self, cls=None):
+        """returns the places"""
+        return self.places
+
+    def links(self, cls, relationship):
+        """returns the (place id, amenity id) links"""
+        return self.pairs
+
+    def subscribe(self, listener):
+        """ignores write listeners"""
+
+
+def main(n):
+    """indexes n places linked to 50 amenities and filters on 10"""
+    rnd = random.Random(0)
+    amenities = ["amenity{}".format(i) for i in range(50)]
+    # the first amenities are the common ones (wifi, kitchen...)
+    odds = [0.9 - 0.015 * i for i in range(len(amenities))]
+    places = [Place(i) for i in range(n)]
+    links = []
+    by_place = {}
+    for place in places:
+        linked = {a for a, p in zip(amenities, odds) if rnd.random() < p}
+        by_place[place.id] = linked
+        links.extend((place.id, a) for a in linked)
+    index = BitmapIndex(Store(places, links), "Place", "amenities",
+                        "Amenity")
+    start = time.perf_counter()
+    len(index)
+    print("build: {} places, {} links in {:.2f} s".format(
+        n, len(links), time.perf_counter() - start))
+    for filters in [amenities[:10], amenities[:3], amenities[20:30]]:
+        runs = 10
+        start = time.perf_counter()
+        for i in range(runs):
+            bitmap = index.bitmap(filters)
+        and_ms = (time.perf_counter() - start) / runs * 1000
+        start = time.perf_counter()
+        for i in range(runs):
+            found = index.linked_to_all(filters)
+        index_ms = (time.perf_counter() - start) / runs * 1000
+        wanted = set(filters)
+        start = time.perf_counter()
+        scanned = [p for p, linked in by_place.items() if wanted <= linked]
+        scan_ms = (time.perf_counter() - start) * 1000
+        assert sorted(found) == sorted(scanned)
+        print("{} amenities: {} matches, AND {:.2f} ms, with ids {:.2f} ms,"
+              " full scan {:.2f} ms".format(len(filters), len(found), and_ms,
+                                            index_ms, scan_ms))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Compares per city price stats on the column store with a loop over the
+objects
+
+usage: python3 -m benchmarks.bench_column_store [number of places]
+"""
+
+from models.engine.column_store import ColumnStore
+import random
+import sys
+import time
+
+
+class Place:
+    """stand-in for a stored Place"""
+    def __init__(self, i, city_id, price_by_night, max_guest):
+        """keeps the aggregated attributes"""
+        self.id = str(i)
+        self.city_id = city_id
+        self.price_by_night = price_by_night
+        self.max_guest = max_guest
+
+
+class Store:
+    """stand-in storage holding the places"""
+    def __init__(self, places):
+        """keeps the places by key"""
+        self.places = {"Place." + p.id: p for p in places}
+
+    def all(self, cls=None):
+        """returns the places"""
+        return self.places
+
+    def subscribe(self, listener):
+        """keeps the write listener"""
+        self.listener = listener
+
+
+def loop_stats(places):
+    """returns the count and price sum per city, one object at a time"""
+    stats = {}
+    for place in places:
+        count, total = stats.get(place.city_id, (0, 0))
+        stats[place.city_id] = (count + 1, total + place.price_by_night)
+    return stats
+
+
+def main(n):
+    """aggregates n places spread over 5000 cities"""
+    rnd = random.Random(0)
+    places = [Place(i, "city{}".format(rnd.randrange(5000)),
+                    rnd.randrange(20, 500), rnd.randrange(1, 10))
+              for i in range(n)]
+    store = Store(places)
+    columns = ColumnStore(store, "Place", ("price_by_night", "max_guest"),
+                          ("city_id",))
+    start = time.perf_counter()
+    len(columns)
+    print("build: {} places in {:.2f} s".format(n,
+                                                time.perf_counter() - start))
+    start = time.perf_counter()
+    for i in range(1000):
+        place = places[i]
+        place.price_by_night += 1
+        store.listener("save", place)
+    print("update: {:.1f} us per write".format(
+        (time.perf_counter() - start) * 1000))
+    for name, stats in [("loop", lambda: loop_stats(places)),
+                        ("columns", lambda: columns.stats(
+                            "city_id", ["price_by_night"]))]:
+        start = time.perf_counter()
+        stats()
+        print("{}: {:.1f} ms".format(name,
+                                     (time.perf_counter() - start) * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
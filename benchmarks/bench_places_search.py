@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+"""
+Measures places_search plans over the city, amenity and price indexes
+
+usage: python3 -m benchmarks.bench_places_search [number of places]
+"""
+
+from models.engine.bitmap_index import BitmapIndex
+from models.engine.hash_index import HashIndex
+from models.engine.sorted_index import SortedIndex
+from models.engine.query_planner import QueryPlanner, InPredicate
+from models.engine.query_planner import LinkedPredicate, RangePredicate
+import random
+import sys
+import time
+
+
+class Place:
+    """stand-in for a stored Place"""
+    def __init__(self, i, city_id, price_by_night):
+        """keeps the searched attributes"""
+        self.id = str(i)
+        self.city_id = city_id
+        self.price_by_night = price_by_night
+
+
+class Store:
+    """stand-in storage holding places and their amenity links"""
+    def __init__(self, places, links):
+        """keeps the places by id and the (place id, amenity id) links"""
+        self.places = {p.id: p for p in places}
+        self.pairs = links
+
+    def all(self, cls=None, fields=None):
+        """returns the places, whatever fields are asked"""
+        return self.places
+
+    def get_many(self, cls, ids, fields=None):
+        """returns the places with the given ids, whatever fields are
+        asked"""
+        return [self.places[i] for i in ids if i in self.places]
+
+    def count(self, cls=None):
+        """returns the number of places"""
+        return len(self.places)
+
+    def links(self, cls, relationship, ids=None):
+        """returns the (place id, amenity id) links, only of the places
+        with the given ids if any"""
+        if ids is None:
+            return self.pairs
+        ids = set(ids)
+        return [pair for pair in self.pairs if pair[0] in ids]
+
+    def subscribe(self, listener):
+        """ignores write listeners"""
+
+
+def main(n):
+    """searches n places spread over 5000 cities of 50 states"""
+    rnd = random.Random(0)
+    amenities = ["amenity{}".format(i) for i in range(50)]
+    odds = [0.9 - 0.015 * i for i in range(len(amenities))]
+    places = []
+    links = []
+    for i in range(n):
+        place = Place(i, "city{}".format(rnd.randrange(5000)),
+                      rnd.randrange(20, 500))
+        places.append(place)
+        links.extend((place.id, a) for a, p in zip(amenities, odds)
+                     if rnd.random() < p)
+    store = Store(places, links)
+    cities = HashIndex(store, "Place", "city_id")
+    amenity_places = BitmapIndex(store, "Place", "amenities", "Amenity")
+    prices = SortedIndex(store, "Place", "price_by_night")
+    planner = QueryPlanner(store, Place)
+    start = time.perf_counter()
+    len(cities), len(amenity_places), len(prices)
+    print("build: {} places in {:.2f} s".format(n,
+                                                time.perf_counter() - start))
+    # a state holds 100 cities
+    state = ["city{}".format(i) for i in range(100)]
+    searches = {
+        "1 city": [InPredicate(cities, ["city7"])],
+        "1 state, 3 amenities, price": [
+            InPredicate(cities, state),
+            LinkedPredicate(amenity_places, amenities[:3]),
+            RangePredicate("price_by_night", 100, 200, prices)],
+        "1 city, 10 amenities": [
+            InPredicate(cities, ["city7"]),
+            LinkedPredicate(amenity_places, amenities[:10])],
+        "price 100-101, 2 amenities": [
+            RangePredicate("price_by_night", 100, 101, prices),
+            LinkedPredicate(amenity_places, amenities[:2])],
+        "10 rare amenities": [
+            LinkedPredicate(amenity_places, amenities[40:50])],
+    }
+    for name, predicates in searches.items():
+        runs = 20
+        start = time.perf_counter()
+        for i in range(runs):
+            total, found = planner.run(predicates, "price_by_night",
+                                       limit=50)
+        ms = (time.perf_counter() - start) / runs * 1000
+        plan = ", ".join("{} {!r}".format(op, p)
+                         for op, p, rows in planner.plan(predicates))
+        print("{}: {} matches in {:.2f} ms ({})".format(
+            name, total, ms, plan))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
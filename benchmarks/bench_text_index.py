@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""
+Measures the build time and query latency of the full-text index
+
+usage: python3 -m benchmarks.bench_text_index [number of documents]
+"""
+
+from models.engine.text_index import TextIndex
+import random
+import sys
+import time
+
+
+class Place:
+    """stand-in for a stored Place with a name and a description"""
+    def __init__(self, i, name, description):
+        """keeps the id and text fields"""
+        self.id = str(i)
+        self.name = name
+        self.description = description
+
+
+class Store:
+    """stand-in storage holding the generated documents"""
+    def __init__(self, docs):
+        """keeps the documents by key"""
+        self.docs = {"Place." + d.id: d for d in docs}
+
+    def all(self, cls=None):
+        """returns the documents of cls"""
+        return self.docs if cls == "Place" else {}
+
+    def subscribe(self, listener):
+        """ignores write listeners"""
+
+
+def main(n):
+    """builds an index over n documents and times a few queries"""
+    rnd = random.Random(0)
+    vocab = ["word{}".format(i) for i in range(20000)]
+    weights = [1 / (i + 1) for i in range(len(vocab))]
+    docs = []
+    for i in range(n):
+        words = rnd.choices(vocab, weights, k=40)
+        docs.append(Place(i, " ".join(words[:4]), " ".join(words[4:])))
+    index = TextIndex(Store(docs), {"Place": {"name": 2, "description": 1}})
+    start = time.perf_counter()
+    index.build()
+    print("build: {} documents in {:.2f} s".format(
+        n, time.perf_counter() - start))
+    for query in ["word5000", "word500 word7000", "word50 word900",
+                  "word1 word2"]:
+        runs = 20
+        start = time.perf_counter()
+        for i in range(runs):
+            total, hits = index.search(query, limit=10)
+        print("query {!r}: {} matches, {:.2f} ms".format(
+            query, total, (time.perf_counter() - start) / runs * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
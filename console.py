@@ -3,6 +3,7 @@
 
 import cmd
 from datetime import datetime
+import json
 import models
 from models.amenity import Amenity
 from models.base_model import BaseModel
@@ -11,7 +12,9 @@ from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+from os import getenv
 import shlex  # for splitting the line along spaces except in double quotes
+import urllib.request
 
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
@@ -160,5 +163,31 @@ class HBNBCommand(cmd.Cmd):
         else:
             print("** class doesn't exist **")
 
+    def do_rebuild_counters(self, arg):
+        """Recounts all instances in the counters of the running API and
+        prints the counters that were wrong
+        Usage: rebuild_counters [API URL]
+        The URL defaults to the one of HBNB_API_HOST and HBNB_API_PORT and
+        the request carries the secret of HBNB_ADMIN_SECRET"""
+        url = arg.strip() or "http://{}:{}".format(
+            getenv("HBNB_API_HOST", "0.0.0.0"),
+            getenv("HBNB_API_PORT", "5000"))
+        request = urllib.request.Request(
+            url.rstrip("/") + "/api/v1/views/stats/rebuild", method="POST",
+            headers={"X-HBNB-Admin": getenv("HBNB_ADMIN_SECRET", "")})
+        try:
+            with urllib.request.urlopen(request) as response:
+                result = json.load(response)
+        except (OSError, ValueError) as error:
+            print("** cannot rebuild the counters: {} **".format(error))
+            return
+        for difference in result["differences"]:
+            name = difference["counter"]
+            if difference["value"] is not None:
+                name = "{}[{}]".format(name, difference["value"])
+            print("{}: {} -> {}".format(name, difference["kept"],
+                                        difference["actual"]))
+        print("{} counter(s) fixed".format(result["fixed"]))
+
 if __name__ == '__main__':
     HBNBCommand().cmdloop()
@@ -3,6 +3,18 @@
 initialize the models package
 """
 
+from models.engine.bitmap_index import BitmapIndex
+from models.engine.cache import Cache, LRUStore
+from models.engine.column_store import ColumnStore
+from models.engine.counters import Counters
+from models.engine.geo_index import GeoIndex
+from models.engine.hash_index import HashIndex
+from models.engine.metrics import Metrics, instrument
+from models.engine.prefix_index import PrefixIndex
+from models.engine.slow_log import SlowLog
+from models.engine.sorted_index import SortedIndex
+from models.engine.text_index import TextIndex
+from models.engine.versions import Versions
 from os import getenv
 
 
@@ -14,4 +26,46 @@ if storage_t == "db":
 else:
     from models.engine.file_storage import FileStorage
     storage = FileStorage()
+
+# request and storage metrics, exported at /metrics, and the log of the
+# storage operations and SQL statements of at least HBNB_SLOW_OP_MS ms
+metrics = Metrics()
+slow_log = SlowLog(float(getenv("HBNB_SLOW_OP_MS", "100")) / 1000)
+instrument(storage, metrics, slow_log)
+storage.subscribe_statements(slow_log.on_statement)
+
+# indexes kept in sync with the storage write events, built on first use
+place_locations = GeoIndex(storage, "Place")
+amenity_places = BitmapIndex(storage, "Place", "amenities", "Amenity")
+city_places = HashIndex(storage, "Place", "city_id")
+state_cities = HashIndex(storage, "City", "state_id")
+place_reviews = HashIndex(storage, "Review", "place_id")
+place_ranges = {attribute: SortedIndex(storage, "Place", attribute)
+                for attribute in ("price_by_night", "max_guest",
+                                  "number_rooms", "number_bathrooms")}
+place_columns = ColumnStore(storage, "Place",
+                            ("price_by_night", "number_rooms",
+                             "number_bathrooms", "max_guest", "latitude",
+                             "longitude"),
+                            ("city_id", "user_id"))
+# the counters are only persisted to the file named by HBNB_COUNTERS
+counters = Counters(storage,
+                    ("Amenity", "City", "Place", "Review", "State", "User"),
+                    {"City": ("state_id",), "Place": ("city_id",),
+                     "Review": ("place_id",)},
+                    getenv("HBNB_COUNTERS"))
+name_index = PrefixIndex(storage,
+                         {"State": "name", "City": "name", "Amenity": "name"})
+versions = Versions(storage, {"State": ("id",), "City": ("state_id", "id"),
+                              "Place": ("city_id", "id"),
+                              "Review": ("place_id",)})
+response_cache = Cache(versions,
+                       LRUStore(int(getenv("HBNB_CACHE_SIZE", "1024"))),
+                       int(getenv("HBNB_CACHE_TTL", "60")))
+# the text index is only persisted to the file named by HBNB_SEARCH_INDEX
+text_index = TextIndex(storage,
+                       {"Place": {"name": 2, "description": 1},
+                        "Review": {"text": 1}},
+                       getenv("HBNB_SEARCH_INDEX"))
+
 storage.reload()
@@ -5,14 +5,98 @@ Contains class BaseModel
 
 from datetime import datetime
 import models
+import os
 from os import getenv
 import sqlalchemy
 from sqlalchemy import Column, String, DateTime
 from sqlalchemy.ext.declarative import declarative_base
+import threading
+import time as _time
 import uuid
+import weakref
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
 
+# id generator used for new objects: "uuid4" (random) or "uuid7" (time-ordered)
+id_type = getenv("HBNB_ID_TYPE", "uuid4")
+
+_uuid7_lock = threading.Lock()
+_uuid7_last = [0, 0]    # [unix ms of the last id, 12 bit sequence counter]
+
+
+def _uuid7_clock(n):
+    """reserves n consecutive (ms, counter) slots, returns the first one"""
+    with _uuid7_lock:
+        ms = _time.time_ns() // 1000000
+        last_ms, counter = _uuid7_last
+        if ms <= last_ms:
+            ms, counter = last_ms, counter + 1
+        else:
+            counter = 0
+        # the counter keeps ids monotonic within one millisecond; when it
+        # runs out we borrow from the next millisecond instead of wrapping
+        end = counter + n - 1
+        _uuid7_last[0] = ms + (end >> 12)
+        _uuid7_last[1] = end & 0xfff
+        return ms, counter
+
+
+def _uuid7_format(ms, counter, rand):
+    """builds the 36 char string of a version 7 UUID"""
+    value = ((ms & 0xffffffffffff) << 80 | 0x7 << 76 | counter << 64 |
+             0x2 << 62 | rand & 0x3fffffffffffffff)
+    return str(uuid.UUID(int=value))
+
+
+def uuid7_batch(n):
+    """returns a list of n strictly increasing version 7 UUID strings"""
+    if n <= 0:
+        return []
+    ms, counter = _uuid7_clock(n)
+    rand = os.urandom(8 * n)
+    ids = []
+    for i in range(n):
+        ids.append(_uuid7_format(ms + (counter >> 12), counter & 0xfff,
+                                 int.from_bytes(rand[8 * i:8 * i + 8], "big")))
+        counter += 1
+    return ids
+
+
+def uuid7():
+    """returns a time-ordered version 7 UUID string"""
+    return uuid7_batch(1)[0]
+
+
+def uuid4_batch(n):
+    """returns a list of n random version 4 UUID strings"""
+    return [str(uuid.uuid4()) for i in range(n)]
+
+
+id_generators = {"uuid4": uuid4_batch, "uuid7": uuid7_batch}
+
+
+def new_ids(n):
+    """returns n fresh ids from the configured generator (HBNB_ID_TYPE)"""
+    if id_type not in id_generators:
+        raise ValueError("unknown HBNB_ID_TYPE: {}".format(id_type))
+    return id_generators[id_type](n)
+
+
+def new_id():
+    """returns one fresh id from the configured generator"""
+    return new_ids(1)[0]
+
+
+# names of the fields assigned since an object was loaded or last persisted,
+# keyed weakly by object so that to_dict() and __str__ stay unchanged
+_changes = weakref.WeakKeyDictionary()
+_missing = object()
+
+
+def changed_objects():
+    """returns the objects holding unpersisted field changes"""
+    return list(_changes.keys())
+
 if models.storage_t == "db":
     Base = declarative_base()
 else:
@@ -23,7 +107,7 @@ class BaseModel:
     """The BaseModel class from which future classes will be derived"""
     if models.storage_t == "db":
         id = Column(String(60), primary_key=True)
-        created_at = Column(DateTime, default=datetime.utcnow)
+        created_at = Column(DateTime, default=datetime.utcnow, index=True)
         updated_at = Column(DateTime, default=datetime.utcnow)
 
     def __init__(self, *args, **kwargs):
@@ -41,11 +125,28 @@ class BaseModel:
             else:
                 self.updated_at = datetime.utcnow()
             if kwargs.get("id", None) is None:
-                self.id = str(uuid.uuid4())
+                self.id = new_id()
         else:
-            self.id = str(uuid.uuid4())
+            self.id = new_id()
             self.created_at = datetime.utcnow()
             self.updated_at = self.created_at
+        self.clear_changes()
+
+    def __setattr__(self, name, value):
+        """sets an attribute, recording its name if the value changed"""
+        if not name.startswith('_'):
+            old = self.__dict__.get(name, _missing)
+            if old is _missing or old != value:
+                _changes.setdefault(self, set()).add(name)
+        super().__setattr__(name, value)
+
+    def changed_fields(self):
+        """returns the names of the fields changed since load or last save"""
+        return set(_changes.get(self, ()))
+
+    def clear_changes(self):
+        """marks the instance as matching its persisted state"""
+        _changes.pop(self, None)
 
     def __str__(self):
         """String representation of the BaseModel class"""
@@ -58,16 +159,24 @@ class BaseModel:
         models.storage.new(self)
         models.storage.save()
 
-    def to_dict(self, include_password=False):
-        """returns a dictionary containing all keys/values of the instance"""
-        new_dict = self.__dict__.copy()
+    def to_dict(self, include_password=False, fields=None):
+        """returns a dictionary containing all keys/values of the instance,
+        or only the ones of fields that it has"""
+        if fields is not None:
+            new_dict = {key: self.__dict__[key] for key in fields
+                        if key in self.__dict__}
+            if "__class__" in fields:
+                new_dict["__class__"] = self.__class__.__name__
+        else:
+            new_dict = self.__dict__.copy()
         if not include_password and 'password' in new_dict:
             del new_dict['password']
         if "created_at" in new_dict:
             new_dict["created_at"] = new_dict["created_at"].strftime(time)
         if "updated_at" in new_dict:
             new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
-        new_dict["__class__"] = self.__class__.__name__
+        if fields is None:
+            new_dict["__class__"] = self.__class__.__name__
         if "_sa_instance_state" in new_dict:
             del new_dict["_sa_instance_state"]
         return new_dict
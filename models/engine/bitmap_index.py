@@ -0,0 +1,220 @@
+#!/usr/bin/python3
+"""
+Contains the BitmapIndex class
+"""
+
+from array import array
+import sys
+from threading import RLock
+
+
+def popcount(bitmap):
+    """returns the number of set bits of an int"""
+    return bin(bitmap).count("1")
+
+
+if hasattr(int, "bit_count"):
+    # Python 3.10+ counts the bits without building a string
+    popcount = int.bit_count
+
+
+def bit_positions(bitmap):
+    """returns the positions of the set bits of an int, in increasing
+    order, reading it 64 bits at a time so empty words are skipped"""
+    if not bitmap:
+        return []
+    n_words = (bitmap.bit_length() + 63) // 64
+    words = array("Q", bitmap.to_bytes(n_words * 8, "little"))
+    if sys.byteorder != "little":
+        words.byteswap()
+    positions = []
+    base = 0
+    for word in words:
+        while word:
+            low = word & -word
+            positions.append(base + low.bit_length() - 1)
+            word ^= low
+        base += 64
+    return positions
+
+
+class BitmapIndex:
+    """bitmap index of a many-to-many relationship of one class
+
+    Every object of cls gets a dense ordinal; each related id maps to an
+    int whose bit <ordinal> is set when the object is linked to it, so
+    objects linked to all of several ids are found with a few bitwise ANDs.
+    The index is built from storage.links() on first use and kept up to
+    date from the storage write events.
+    """
+
+    def __init__(self, storage, cls, relationship, related):
+        """Instantiate a BitmapIndex over cls.<relationship>, whose
+        objects are of the class named related"""
+        self.storage = storage
+        self.cls = cls
+        self.relationship = relationship
+        self.related = related
+        self.__bitmaps = {}
+        self.__ordinals = {}
+        self.__ids = []
+        self.__free = []
+        self.__links = {}
+        self.__built = False
+        self.__lock = RLock()
+        storage.subscribe(self.on_write)
+
+    def __ordinal(self, obj_id):
+        """returns the ordinal of obj_id, assigning one if needed"""
+        ordinal = self.__ordinals.get(obj_id)
+        if ordinal is None:
+            if self.__free:
+                ordinal = self.__free.pop()
+                self.__ids[ordinal] = obj_id
+            else:
+                ordinal = len(self.__ids)
+                self.__ids.append(obj_id)
+            self.__ordinals[obj_id] = ordinal
+        return ordinal
+
+    def __set(self, obj_id, related_ids):
+        """links obj_id to exactly related_ids"""
+        old = self.__links.get(obj_id, frozenset())
+        new = frozenset(related_ids)
+        if old == new and obj_id in self.__ordinals:
+            return
+        ordinal = self.__ordinal(obj_id)
+        bit = 1 << ordinal
+        for related_id in old - new:
+            bitmap = self.__bitmaps[related_id] & ~bit
+            if bitmap:
+                self.__bitmaps[related_id] = bitmap
+            else:
+                del self.__bitmaps[related_id]
+        for related_id in new - old:
+            self.__bitmaps[related_id] = self.__bitmaps.get(related_id,
+                                                            0) | bit
+        self.__links[obj_id] = new
+
+    def __remove(self, obj_id):
+        """drops obj_id and its links from the index"""
+        if obj_id not in self.__ordinals:
+            return
+        self.__set(obj_id, ())
+        ordinal = self.__ordinals.pop(obj_id)
+        del self.__links[obj_id]
+        self.__ids[ordinal] = None
+        self.__free.append(ordinal)
+
+    def __ensure(self):
+        """builds the index from storage if it is not built yet"""
+        if self.__built:
+            return
+        self.__bitmaps = {}
+        self.__ordinals = {}
+        self.__ids = []
+        self.__free = []
+        self.__links = {}
+        for obj in self.storage.all(self.cls).values():
+            self.__ordinal(obj.id)
+        members = {}
+        for obj_id, related_id in self.storage.links(self.cls,
+                                                     self.relationship):
+            members.setdefault(obj_id, set()).add(related_id)
+        # setting the bits one at a time copies the whole int each time,
+        # so each bitmap is filled as bytes and converted once
+        buffers = {}
+        size = (len(self.__ids) + 7) // 8
+        for obj_id, ordinal in self.__ordinals.items():
+            related_ids = frozenset(members.get(obj_id, ()))
+            self.__links[obj_id] = related_ids
+            for related_id in related_ids:
+                buffer = buffers.get(related_id)
+                if buffer is None:
+                    buffer = buffers[related_id] = bytearray(size)
+                buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+        for related_id, buffer in buffers.items():
+            self.__bitmaps[related_id] = int.from_bytes(buffer, "little")
+        self.__built = True
+
+    def on_write(self, event, obj):
+        """storage listener keeping the index in sync with the writes"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+                return
+            if not self.__built:
+                return
+            name = obj.__class__.__name__
+            if name == self.cls:
+                if event == "delete":
+                    self.__remove(obj.id)
+                else:
+                    self.__set(obj.id, [related.id for related in
+                                        getattr(obj, self.relationship)])
+            elif name == self.related and event == "delete":
+                bitmap = self.__bitmaps.pop(obj.id, 0)
+                for ordinal in bit_positions(bitmap):
+                    obj_id = self.__ids[ordinal]
+                    self.__links[obj_id] = self.__links[obj_id] - {obj.id}
+
+    def __len__(self):
+        """returns the number of indexed objects"""
+        with self.__lock:
+            self.__ensure()
+            return len(self.__ordinals)
+
+    def bitmap(self, related_ids):
+        """returns the bitmap of the objects linked to all of related_ids,
+        or None if related_ids is empty"""
+        with self.__lock:
+            self.__ensure()
+            result = None
+            # the sparsest bitmaps first make the intermediate results small
+            for bitmap in sorted((self.__bitmaps.get(related_id, 0)
+                                  for related_id in set(related_ids)),
+                                 key=popcount):
+                result = bitmap if result is None else result & bitmap
+                if not result:
+                    return 0
+            return result
+
+    def count(self, related_ids):
+        """returns the number of objects linked to all of related_ids"""
+        with self.__lock:
+            bitmap = self.bitmap(related_ids)
+            if bitmap is None:
+                return len(self.__ordinals)
+            return popcount(bitmap)
+
+    def filter(self, obj_ids, related_ids):
+        """returns the ids of obj_ids linked to every id of related_ids,
+        checking the links of each object instead of decoding a bitmap"""
+        with self.__lock:
+            self.__ensure()
+            wanted = frozenset(related_ids)
+            links = self.__links
+            return [obj_id for obj_id in obj_ids
+                    if wanted <= links.get(obj_id, frozenset())]
+
+    def ids(self, bitmap):
+        """returns the ids of the objects whose bits are set in bitmap"""
+        with self.__lock:
+            ids = self.__ids
+            return [ids[ordinal] for ordinal in bit_positions(bitmap)
+                    if ordinal < len(ids) and ids[ordinal] is not None]
+
+    def linked_to_all(self, related_ids):
+        """returns the ids of the objects linked to every id of
+        related_ids"""
+        with self.__lock:
+            bitmap = self.bitmap(related_ids)
+            if bitmap is None:
+                return list(id for id in self.__ids if id is not None)
+            return self.ids(bitmap)
+
+    def links_of(self, obj_id):
+        """returns the related ids linked to obj_id"""
+        with self.__lock:
+            self.__ensure()
+            return set(self.__links.get(obj_id, ()))
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+"""
+Contains the LRUStore and Cache classes
+"""
+
+from collections import OrderedDict
+from threading import Event, Lock, RLock
+import time
+
+# the cacheable flag of a compute() whose value is kept later, by put()
+later = object()
+
+
+class LRUStore:
+    """in-process store of up to max_entries values, each expiring ttl
+    seconds after it is set, evicting the least recently used ones
+
+    Another store can be given to Cache instead, e.g. one shared by the
+    processes of a host, as long as it has the same get() and set().
+    """
+
+    def __init__(self, max_entries=1024):
+        """Instantiate an empty LRUStore"""
+        self.max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self):
+        """returns the number of kept values, expired ones included"""
+        return len(self.__entries)
+
+    def get(self, key):
+        """returns the value of key, or None if missing or expired"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        """keeps value under key for ttl seconds"""
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """drops every value"""
+        with self.__lock:
+            self.__entries.clear()
+
+
+class Cache:
+    """cache of computed values, invalidated by the storage writes
+
+    A value is kept under its key and the versions, in a Versions, of the
+    scopes it was computed from: (class name,) for all the objects of a
+    class, or (class name, attribute, value) for only some of them. A
+    write bumps the versions of the scopes it changes, so the values
+    computed from them are never found again and age out of the store.
+    Concurrent misses of the same key compute it once: the other callers
+    wait for its value, up to timeout seconds before computing it too.
+    """
+
+    def __init__(self, versions, store=None, ttl=60, timeout=30):
+        """Instantiate a Cache over versions, keeping the values in store
+        (an LRUStore by default) for ttl seconds, or not at all if ttl
+        is 0"""
+        self.versions = versions
+        self.store = LRUStore() if store is None else store
+        self.ttl = ttl
+        self.timeout = timeout
+        self.__pending = {}
+        self.__lock = RLock()
+
+    def key(self, key, scopes):
+        """returns key extended with the current versions of scopes"""
+        return (key,) + tuple(self.versions.version(*scope)
+                              for scope in scopes)
+
+    def put(self, key, value=None):
+        """keeps value under key, as extended by key(), unless it is None,
+        and wakes the callers waiting for it: for a value computed outside
+        of get(), e.g. once it is fully produced"""
+        if self.ttl and value is not None:
+            self.store.set(key, value, self.ttl)
+        with self.__lock:
+            pending = self.__pending.pop(key, None)
+        if pending is not None:
+            pending.set()
+
+    def get(self, key, scopes, compute):
+        """returns the value of key in scopes, from the store or else
+        from compute() (see lookup)"""
+        return self.lookup(self.key(key, scopes), compute)
+
+    def lookup(self, key, compute):
+        """returns the value of key, as extended by key(), from the store
+        or else from compute(), a (value, cacheable) pair telling if the
+        value may be kept
+
+        When cacheable is later, the value is only produced after
+        compute() returns: the other callers keep waiting until put() is
+        called with key.
+        """
+        if not self.ttl:
+            return compute()[0]
+        while True:
+            value = self.store.get(key)
+            if value is not None:
+                return value
+            with self.__lock:
+                pending = self.__pending.get(key)
+                if pending is None:
+                    self.__pending[key] = Event()
+                    break
+            if not pending.wait(self.timeout):
+                return compute()[0]
+        cacheable = False
+        try:
+            value, cacheable = compute()
+            if cacheable is True:
+                self.store.set(key, value, self.ttl)
+            return value
+        finally:
+            if cacheable is not later:
+                self.put(key)
@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+"""
+Contains the ColumnStore class
+"""
+
+from models.engine.sorted_index import as_number
+from threading import RLock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class ColumnStore:
+    """columnar copy of some attributes of the objects of one class
+
+    Each numeric attribute is a float NumPy array (NaN when missing) and
+    each categorical one an int array of codes into the list of its
+    distinct values, all indexed by a row per object. Deleted rows are
+    reused, and the arrays double in size when full, so the writes update
+    rows in place. The store is built from storage on first use and kept
+    up to date from the storage write events. It needs NumPy, and does
+    nothing when NumPy is not installed.
+    """
+    enabled = numpy is not None
+
+    def __init__(self, storage, cls, numeric, categorical=()):
+        """Instantiate a ColumnStore over the numeric and categorical
+        attributes of the objects of the class named cls"""
+        self.storage = storage
+        self.cls = cls
+        self.numeric = tuple(numeric)
+        self.categorical = tuple(categorical)
+        self.__rows = {}
+        self.__free = []
+        self.__size = 0
+        self.__columns = {}
+        self.__values = {}
+        self.__codes = {}
+        self.__valid = None
+        self.__built = False
+        self.__lock = RLock()
+        storage.subscribe(self.on_write)
+
+    def __allocate(self, capacity):
+        """returns empty arrays for capacity rows"""
+        columns = {name: numpy.full(capacity, numpy.nan)
+                   for name in self.numeric}
+        columns.update((name, numpy.zeros(capacity, numpy.int32))
+                       for name in self.categorical)
+        return columns, numpy.zeros(capacity, bool)
+
+    def __grow(self):
+        """doubles the capacity of the arrays"""
+        columns, valid = self.__allocate(2 * len(self.__valid))
+        size = self.__size
+        for name, column in self.__columns.items():
+            columns[name][:size] = column[:size]
+        valid[:size] = self.__valid[:size]
+        self.__columns = columns
+        self.__valid = valid
+
+    def __encode(self, name, value):
+        """returns the code of a categorical value, adding it if new"""
+        codes = self.__codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self.__values[name])
+            self.__values[name].append(value)
+        return code
+
+    def __set(self, obj):
+        """writes the attributes of obj in its row"""
+        row = self.__rows.get(obj.id)
+        if row is None:
+            if self.__free:
+                row = self.__free.pop()
+            else:
+                if self.__size == len(self.__valid):
+                    self.__grow()
+                row = self.__size
+                self.__size += 1
+            self.__rows[obj.id] = row
+        for name in self.numeric:
+            value = as_number(getattr(obj, name, None))
+            self.__columns[name][row] = numpy.nan if value is None else value
+        for name in self.categorical:
+            self.__columns[name][row] = self.__encode(
+                name, getattr(obj, name, None))
+        self.__valid[row] = True
+
+    def __remove(self, obj_id):
+        """frees the row of obj_id"""
+        row = self.__rows.pop(obj_id, None)
+        if row is not None:
+            self.__valid[row] = False
+            self.__free.append(row)
+
+    def __ensure(self):
+        """builds the columns from storage if they are not built yet"""
+        if self.__built:
+            return
+        objs = list(self.storage.all(self.cls).values())
+        size = len(objs)
+        self.__columns, self.__valid = self.__allocate(max(size, 1024))
+        self.__values = {name: [] for name in self.categorical}
+        self.__codes = {name: {} for name in self.categorical}
+        for name in self.numeric:
+            numbers = (as_number(getattr(obj, name, None)) for obj in objs)
+            self.__columns[name][:size] = numpy.fromiter(
+                (numpy.nan if value is None else value for value in numbers),
+                float, size)
+        for name in self.categorical:
+            self.__columns[name][:size] = numpy.fromiter(
+                (self.__encode(name, getattr(obj, name, None))
+                 for obj in objs), numpy.int32, size)
+        self.__valid[:size] = True
+        self.__rows = {obj.id: row for row, obj in enumerate(objs)}
+        self.__free = []
+        self.__size = size
+        self.__built = True
+
+    def on_write(self, event, obj):
+        """storage listener keeping the columns in sync with the writes"""
+        if not self.enabled:
+            return
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+            elif not self.__built or obj.__class__.__name__ != self.cls:
+                return
+            elif event == "delete":
+                self.__remove(obj.id)
+            else:
+                self.__set(obj)
+
+    def __len__(self):
+        """returns the number of stored objects"""
+        if not self.enabled:
+            return 0
+        with self.__lock:
+            self.__ensure()
+            return len(self.__rows)
+
+    def __require(self):
+        """raises RuntimeError when NumPy is not installed"""
+        if not self.enabled:
+            raise RuntimeError("NumPy is required for the column store")
+
+    def stats(self, group_by=None, columns=None):
+        """returns the count of objects and the sum, mean, min and max of
+        each numeric column (all by default), as a list of dictionaries,
+        one per distinct value of the categorical column group_by or a
+        single one if group_by is None; missing values are left out"""
+        self.__require()
+        with self.__lock:
+            self.__ensure()
+            valid = self.__valid[:self.__size]
+            if group_by is None:
+                codes = numpy.zeros(numpy.count_nonzero(valid), numpy.intp)
+                groups = [None]
+            else:
+                codes = self.__columns[group_by][:self.__size][valid]
+                groups = self.__values[group_by]
+            n_groups = len(groups)
+            counts = numpy.bincount(codes, minlength=n_groups)
+            results = [{"count": int(count)} for count in counts]
+            if group_by is not None:
+                for result, value in zip(results, groups):
+                    result[group_by] = value
+            for name in columns or self.numeric:
+                values = self.__columns[name][:self.__size][valid]
+                present = ~numpy.isnan(values)
+                values = values[present]
+                in_group = codes[present]
+                found = numpy.bincount(in_group, minlength=n_groups)
+                sums = numpy.bincount(in_group, values, n_groups)
+                lows = numpy.full(n_groups, numpy.inf)
+                highs = numpy.full(n_groups, -numpy.inf)
+                numpy.minimum.at(lows, in_group, values)
+                numpy.maximum.at(highs, in_group, values)
+                for i, result in enumerate(results):
+                    if found[i]:
+                        result[name] = {"sum": float(sums[i]),
+                                        "mean": float(sums[i] / found[i]),
+                                        "min": float(lows[i]),
+                                        "max": float(highs[i])}
+                    else:
+                        result[name] = {"sum": 0.0, "mean": None,
+                                        "min": None, "max": None}
+            return [result for result in results if result["count"]]
+
+    def histogram(self, name, bins=10, low=None, high=None):
+        """returns (counts, edges) of the values of a numeric column in
+        bins of equal width between low and high, which default to the
+        smallest and largest values"""
+        self.__require()
+        with self.__lock:
+            self.__ensure()
+            values = self.__columns[name][:self.__size]
+            values = values[self.__valid[:self.__size] & ~numpy.isnan(values)]
+            if low is None:
+                low = float(values.min()) if len(values) else 0.0
+            if high is None:
+                high = float(values.max()) if len(values) else 0.0
+            counts, edges = numpy.histogram(values, bins, (low, high))
+            return counts.tolist(), edges.tolist()
@@ -0,0 +1,250 @@
+#!/usr/bin/python3
+"""
+Contains the Counters class
+"""
+
+import atexit
+import json
+import os
+from threading import Lock, RLock, Thread
+import time
+
+
+class Counters:
+    """counts of the stored objects, per class and per value of some of
+    their attributes, e.g. the places of each city
+
+    groups maps a class name to the attributes its objects are counted by;
+    objects without a value for an attribute are left out of its counts.
+    Every object keeps its counted values so it is moved between counts
+    when a write changes them. The counts are built on first use, from
+    the snapshot at path when its totals match storage.count() or else
+    from a full scan, and kept up to date from the storage write events.
+    A write seen before the counts are built makes the snapshot stale:
+    it is not used anymore and the next persist() removes it. verify()
+    checks the counts against a full scan.
+    """
+
+    def __init__(self, storage, classes, groups, path=None,
+                 persist_interval=60):
+        """Instantiate Counters over the classes named in classes
+
+        The counts are written to path (if any) by a background thread
+        every persist_interval seconds if they changed, and at exit, so
+        the writes reaching on_write never wait for the file.
+        """
+        self.storage = storage
+        self.classes = tuple(classes)
+        self.groups = {cls: tuple(attributes)
+                       for cls, attributes in groups.items()}
+        self.path = path
+        self.persist_interval = persist_interval
+        self.__totals = {}
+        self.__counts = {}
+        self.__members = {}
+        self.__built = False
+        self.__dirty = False
+        self.__stale = False
+        self.__lock = RLock()
+        self.__file_lock = Lock()
+        storage.subscribe(self.on_write)
+        if path:
+            atexit.register(self.persist)
+            Thread(target=self.__persist_every, daemon=True).start()
+
+    def __reset(self):
+        """empties every count"""
+        self.__totals = {cls: 0 for cls in self.classes}
+        self.__counts = {cls + "." + attribute: {}
+                         for cls, attributes in self.groups.items()
+                         for attribute in attributes}
+        self.__members = {}
+
+    def __move(self, cls, values, step):
+        """adds step to the counts of the values of an object of cls"""
+        for attribute, value in zip(self.groups.get(cls, ()), values):
+            if value is None:
+                continue
+            counts = self.__counts[cls + "." + attribute]
+            count = counts.get(value, 0) + step
+            if count:
+                counts[value] = count
+            else:
+                counts.pop(value, None)
+
+    def __add(self, obj):
+        """counts obj, moving it if its counted values changed"""
+        cls = obj.__class__.__name__
+        key = cls + "." + obj.id
+        values = [getattr(obj, attribute, None)
+                  for attribute in self.groups.get(cls, ())]
+        old = self.__members.get(key)
+        if old is None:
+            self.__totals[cls] += 1
+        elif old == values:
+            return False
+        else:
+            self.__move(cls, old, -1)
+        self.__move(cls, values, 1)
+        self.__members[key] = values
+        return True
+
+    def __remove(self, obj):
+        """stops counting obj"""
+        cls = obj.__class__.__name__
+        old = self.__members.pop(cls + "." + obj.id, None)
+        if old is None:
+            return False
+        self.__totals[cls] -= 1
+        self.__move(cls, old, -1)
+        return True
+
+    def __scan(self):
+        """counts every object of storage from scratch"""
+        self.__reset()
+        for cls in self.classes:
+            for obj in self.storage.all(cls).values():
+                self.__add(obj)
+
+    def __load(self):
+        """takes the counts from the snapshot at path, returns False if
+        there is none, it is stale or its totals do not match storage"""
+        if not self.path or self.__stale:
+            return False
+        try:
+            with open(self.path, "r") as f:
+                snapshot = json.load(f)
+            totals = snapshot["totals"]
+            if any(totals.get(cls) != self.storage.count(cls)
+                   for cls in self.classes):
+                return False
+            self.__reset()
+            self.__totals.update(totals)
+            for name, counts in snapshot["counts"].items():
+                if name in self.__counts:
+                    self.__counts[name] = counts
+            self.__members = snapshot["members"]
+        except (OSError, ValueError, KeyError, AttributeError, TypeError):
+            return False
+        return True
+
+    def __ensure(self):
+        """builds the counts if they are not built yet"""
+        if self.__built:
+            return
+        loaded = self.__load()
+        if not loaded:
+            self.__scan()
+        self.__built = True
+        self.__dirty = not loaded
+
+    def persist(self):
+        """writes the counts to path if they changed since last written,
+        or removes the snapshot there if it is stale and the counts are
+        not built
+
+        The counts are copied under the counters lock and written without
+        it, so the counts and writes go on meanwhile.
+        """
+        with self.__file_lock:
+            with self.__lock:
+                if not self.path:
+                    return
+                if self.__built and self.__dirty:
+                    snapshot = {"totals": dict(self.__totals),
+                                "counts": {name: dict(counts) for name, counts
+                                           in self.__counts.items()},
+                                "members": dict(self.__members)}
+                elif self.__stale and not self.__built:
+                    snapshot = None
+                else:
+                    return
+                dirty, stale = self.__dirty, self.__stale
+                self.__dirty = self.__stale = False
+            try:
+                if snapshot is None:
+                    if os.path.exists(self.path):
+                        os.remove(self.path)
+                else:
+                    tmp = self.path + ".tmp"
+                    with open(tmp, "w") as f:
+                        json.dump(snapshot, f)
+                    os.replace(tmp, self.path)
+            except BaseException:
+                self.__dirty = self.__dirty or dirty
+                self.__stale = self.__stale or stale
+                raise
+
+    def __persist_every(self):
+        """persists the counts every persist_interval seconds, trying
+        again at the next one when the file cannot be written"""
+        while True:
+            time.sleep(self.persist_interval)
+            try:
+                self.persist()
+            except OSError:
+                pass
+
+    def on_write(self, event, obj):
+        """storage listener keeping the counts in sync with the writes"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+                return
+            if not self.__built:
+                # the snapshot misses this write and could still match
+                # the totals, so it must not be used anymore
+                self.__stale = bool(self.path)
+                return
+            if obj.__class__.__name__ not in self.__totals:
+                return
+            if event == "delete":
+                changed = self.__remove(obj)
+            else:
+                changed = self.__add(obj)
+            if changed:
+                self.__dirty = True
+
+    def total(self, cls):
+        """returns the number of objects of the class named cls"""
+        with self.__lock:
+            self.__ensure()
+            return self.__totals.get(cls, 0)
+
+    def count(self, cls, attribute, value):
+        """returns the number of objects of cls whose attribute is value"""
+        with self.__lock:
+            self.__ensure()
+            return self.__counts[cls + "." + attribute].get(value, 0)
+
+    def counts(self, cls, attribute):
+        """returns a copy of {value: number of objects} for the objects
+        of cls grouped by attribute"""
+        with self.__lock:
+            self.__ensure()
+            return dict(self.__counts[cls + "." + attribute])
+
+    def verify(self):
+        """recounts every object of storage, keeps the new counts and
+        returns the differences found as a list of
+        (name, value, kept count, actual count), where name is a class
+        name for the totals and "<class>.<attribute>" for the groups"""
+        with self.__lock:
+            self.__ensure()
+            totals = self.__totals
+            counts = self.__counts
+            self.__scan()
+            differences = []
+            for cls in self.classes:
+                if totals.get(cls, 0) != self.__totals[cls]:
+                    differences.append((cls, None, totals.get(cls, 0),
+                                        self.__totals[cls]))
+            for name, actual in self.__counts.items():
+                kept = counts.get(name, {})
+                for value in sorted(set(kept) | set(actual), key=str):
+                    if kept.get(value, 0) != actual.get(value, 0):
+                        differences.append((name, value, kept.get(value, 0),
+                                            actual.get(value, 0)))
+            self.__dirty = True
+        self.persist()
+        return differences
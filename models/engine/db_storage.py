@@ -3,6 +3,7 @@
 Contains the class DBStorage
 """
 
+from contextlib import contextmanager
 import models
 from models.amenity import Amenity
 from models.base_model import BaseModel, Base
@@ -13,8 +14,9 @@ from models.state import State
 from models.user import User
 from os import getenv
 import sqlalchemy
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import and_, create_engine, event, func, or_
+from sqlalchemy.orm import load_only, scoped_session, sessionmaker
+import time
 
 classes = {"Amenity": Amenity, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
@@ -24,6 +26,10 @@ class DBStorage:
     """interaacts with the MySQL database"""
     __engine = None
     __session = None
+    # list - callables notified of every object written or deleted
+    __listeners = []
+    # list - callables notified of every SQL statement executed
+    __statement_listeners = []
 
     def __init__(self):
         """Instantiate a DBStorage object"""
@@ -37,15 +43,37 @@ class DBStorage:
                                              HBNB_MYSQL_PWD,
                                              HBNB_MYSQL_HOST,
                                              HBNB_MYSQL_DB))
+        event.listen(self.__engine, "before_cursor_execute",
+                     self.__before_execute)
+        event.listen(self.__engine, "after_cursor_execute",
+                     self.__after_execute)
         if HBNB_ENV == "test":
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
-        """query on the current database session"""
+    def __query(self, cls, fields=None):
+        """returns a query of the objects of cls, loading only their id,
+        created_at, updated_at and fields columns if fields is given
+
+        The partial objects are loaded by the current session: the
+        objects it already holds keep their loaded columns, and the
+        columns a partial object did not load are loaded on first access.
+        """
+        query = self.__session.query(cls)
+        if fields is None:
+            return query
+        columns = cls.__table__.columns
+        names = {"id", "created_at", "updated_at"}
+        names.update(name for name in fields if name in columns)
+        return query.options(
+            load_only(*(getattr(cls, name) for name in names)))
+
+    def all(self, cls=None, fields=None):
+        """query on the current database session, loading only the fields
+        columns (see get_many) if given"""
         new_dict = {}
         for clss in classes:
             if cls is None or cls is classes[clss] or cls is clss:
-                objs = self.__session.query(classes[clss]).all()
+                objs = self.__query(classes[clss], fields).all()
                 for obj in objs:
                     key = obj.__class__.__name__ + '.' + obj.id
                     new_dict[key] = obj
@@ -55,36 +83,205 @@ class DBStorage:
         """add the object to the current database session"""
         self.__session.add(obj)
 
+    def new_many(self, objs):
+        """add each of objs to the current database session"""
+        self.__session.add_all(objs)
+
     def save(self):
-        """commit all changes of the current database session"""
-        self.__session.commit()
+        """commit all changes of the current database session
+
+        The unit of work only issues UPDATE statements for the columns
+        whose values changed; committed objects are then marked clean.
+        In a batch() the changes are only flushed, and committed once at
+        its end: the objects are marked clean and their writes notified
+        only then.
+        """
+        session = self.__session()
+        if session.info.get("batch"):
+            session.flush()
+            return
+        session.commit()
+        for event, key in (("save", "written"), ("delete", "deleted")):
+            # an object flushed many times is notified once
+            for obj in {id(obj): obj
+                        for obj in session.info.pop(key, [])}.values():
+                obj.clear_changes()
+                self.notify(event, obj)
+
+    @contextmanager
+    def batch(self):
+        """runs its block as one unit of work: the save() calls in it
+        flush their writes, and the transaction is committed once, by the
+        save() run when the outermost block ends, or rolled back if it
+        raises
+
+        The depth of the blocks is kept in the session of the thread, so
+        the save() calls of the other threads still commit.
+        """
+        session = self.__session()
+        depth = session.info.get("batch", 0)
+        session.info["batch"] = depth + 1
+        try:
+            yield self
+        except BaseException:
+            if not depth:
+                session.info["batch"] = 0
+                self.__rollback(session)
+            raise
+        finally:
+            session.info["batch"] = depth
+        if not depth:
+            self.save()
+
+    @contextmanager
+    def savepoint(self):
+        """runs its block in a SAVEPOINT of the current transaction: if it
+        raises, the writes it flushed are rolled back and never notified,
+        and the ones before it are kept"""
+        session = self.__session()
+        nested = session.begin_nested()
+        marks = {key: len(session.info.setdefault(key, []))
+                 for key in ("written", "deleted")}
+        try:
+            yield self
+        except BaseException:
+            nested.rollback()
+            for key, mark in marks.items():
+                del session.info[key][mark:]
+            raise
+        if nested.is_active:
+            nested.commit()
+
+    @staticmethod
+    def __rollback(session):
+        """rolls back the transaction of session and forgets its writes"""
+        session.rollback()
+        session.info.pop("written", None)
+        session.info.pop("deleted", None)
+
+    def subscribe(self, listener):
+        """registers listener(event, obj), called after each commit with
+        ("save", obj) for every object written, ("delete", obj) for every
+        object removed, and with ("reload", None) on reload()"""
+        self.__listeners.append(listener)
+
+    def notify(self, event, obj):
+        """calls the registered listeners with event and obj"""
+        for listener in self.__listeners:
+            listener(event, obj)
+
+    def subscribe_statements(self, listener):
+        """registers listener(statement, parameters, duration), called
+        after each SQL statement is executed, in the thread executing it,
+        with the seconds it took"""
+        self.__statement_listeners.append(listener)
+
+    @staticmethod
+    def __before_execute(conn, cursor, statement, parameters, context,
+                         executemany):
+        """starts the timer of the statement, kept on its execution
+        context so a statement that raises leaves nothing behind"""
+        if context is not None:
+            context._hbnb_start = time.perf_counter()
+
+    def __after_execute(self, conn, cursor, statement, parameters, context,
+                        executemany):
+        """calls the statement listeners with statement, parameters and
+        its duration"""
+        started = getattr(context, "_hbnb_start", None)
+        if started is None:
+            return
+        duration = time.perf_counter() - started
+        for listener in self.__statement_listeners:
+            listener(statement, parameters, duration)
 
     def delete(self, obj=None):
         """delete from the current database session obj if not None"""
         if obj is not None:
             self.__session.delete(obj)
 
+    def delete_many(self, objs):
+        """delete each of objs from the current database session"""
+        for obj in objs:
+            self.__session.delete(obj)
+
     def reload(self):
         """reloads data from the database"""
         Base.metadata.create_all(self.__engine)
         sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
+        event.listen(sess_factory, "after_flush", self.__after_flush)
         Session = scoped_session(sess_factory)
         self.__session = Session
+        self.notify("reload", None)
+
+    @staticmethod
+    def __after_flush(session, flush_context):
+        """records the objects written by a flush until they are committed"""
+        written = session.info.setdefault("written", [])
+        written.extend(session.new)
+        written.extend(session.dirty)
+        session.info.setdefault("deleted", []).extend(session.deleted)
 
     def close(self):
         """call remove() method on the private session attribute"""
         self.__session.remove()
 
-    def get(self, cls, id):
+    def get(self, cls, id, fields=None):
         """
         method to retrieve one object
         cls: string representing the class name
         id: string representing the object ID
+        fields: the attributes needed, to load only their columns
         """
         if cls not in classes.values():
             return None
         else:
-            return self.__session.query(cls).filter(cls.id == id).first()
+            return self.__query(cls, fields).filter(cls.id == id).first()
+
+    def get_many(self, cls, ids, fields=None):
+        """retrieves the objects of cls with the given ids, in that order,
+        skipping the ids that do not exist, with a single query
+
+        With fields, the attributes the caller needs, only their columns
+        and id, created_at and updated_at are selected for the objects
+        the current session does not hold yet; their other columns are
+        loaded on first access.
+        """
+        if cls not in classes.values() or not ids:
+            return []
+        found = {}
+        for obj in self.__query(cls, fields).filter(cls.id.in_(ids)):
+            found[obj.id] = obj
+        return [found[id] for id in ids if id in found]
+
+    def page(self, cls, after=None, limit=None, fields=None):
+        """returns the objects of cls ordered by (created_at, id), from the
+        first one whose (created_at, id) is greater than after, and at
+        most limit of them, with a single keyset query loading only the
+        fields columns (see get_many) if given"""
+        cls = classes.get(cls, cls)
+        query = self.__query(cls, fields)
+        if after is not None:
+            created_at, id = after
+            query = query.filter(or_(cls.created_at > created_at,
+                                     and_(cls.created_at == created_at,
+                                          cls.id > id)))
+        query = query.order_by(cls.created_at, cls.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    def links(self, cls, relationship, ids=None):
+        """returns the (id, related id) pairs of a many-to-many relationship
+        of cls, e.g. links(Place, "amenities"), only for the objects with
+        the given ids if any, with a single query"""
+        cls = classes.get(cls, cls)
+        attr = getattr(cls, relationship)
+        related = attr.property.mapper.class_
+        query = self.__session.query(cls.id, related.id).join(attr)
+        if ids is not None:
+            query = query.filter(cls.id.in_(ids))
+        return query
 
     def count(self, cls=None):
         """
@@ -92,6 +289,6 @@ class DBStorage:
         cls: string representing the class name
         """
         if cls is None:
-            return len(self.all())
-        else:
-            return len(self.all(cls))
+            return sum(self.count(clss) for clss in classes)
+        cls = classes.get(cls, cls)
+        return self.__session.query(func.count(cls.id)).scalar()
@@ -3,7 +3,12 @@
 Contains the FileStorage class
 """
 
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
 import json
+import models
+import os
+import threading
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
@@ -19,13 +24,41 @@ classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
 class FileStorage:
     """serializes instances to a JSON file & deserializes back to instances"""
 
-    # string - path to the JSON file
-    __file_path = "file.json"
+    # string - path to the JSON file, file.json unless HBNB_FILE_PATH is set
+    __file_path = os.getenv("HBNB_FILE_PATH", "file.json")
     # dictionary - empty but will store all objects by <class name>.id
     __objects = {}
+    # dictionary - <class name>.id: [object, its JSON text as last written]
+    __saved = {}
+    # (mtime, size) of the JSON file when it was last read or written
+    __file_sig = None
+    # True when new() or delete() ran since the last save
+    __pending = False
+    # list - callables notified of every object written or deleted
+    __listeners = []
+    # dictionary - class name: sorted list of the (created_at, id) of its
+    # objects, built by page() and kept up to date by new() and delete()
+    __order = {}
+    # thread-local - batch: depth of the batch() blocks run by the thread
+    __local = threading.local()
+    # True when a save() in a batch() left the JSON file to write
+    __unwritten = False
 
-    def all(self, cls=None):
-        """returns the dictionary __objects"""
+    def all(self, cls=None, fields=None):
+        """returns the dictionary __objects
+
+        fields, the attributes a caller needs, only matters to DBStorage:
+        the objects are already in memory. The same goes for get(),
+        get_many() and page().
+        """
+        return self.__all(cls)
+
+    def __all(self, cls=None):
+        """returns __objects, or the dictionary of its objects of cls
+
+        The other methods use it rather than all(), which the metrics
+        wrap, so they are not recorded as one more operation each.
+        """
         if cls is not None:
             new_dict = {}
             for key, value in self.__objects.items():
@@ -38,25 +71,157 @@ class FileStorage:
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
             key = obj.__class__.__name__ + "." + obj.id
+            order = self.__order.get(obj.__class__.__name__)
+            if order is not None and self.__objects.get(key) is not obj:
+                insort(order, (obj.created_at, obj.id))
+            self.__objects[key] = obj
+            self.__pending = True
+
+    def new_many(self, objs):
+        """sets in __objects each of objs, like new() but sorting the
+        (created_at, id) order of their classes once"""
+        added = {}
+        for obj in objs:
+            key = obj.__class__.__name__ + "." + obj.id
+            if self.__objects.get(key) is not obj:
+                added.setdefault(obj.__class__.__name__, []).append(
+                    (obj.created_at, obj.id))
             self.__objects[key] = obj
+            self.__pending = True
+        for cls, entries in added.items():
+            order = self.__order.get(cls)
+            if order is not None:
+                order.extend(entries)
+                order.sort()
 
     def save(self):
-        """serializes __objects to the JSON file (path: __file_path)"""
-        json_objects = {}
-        for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict()
+        """serializes __objects to the JSON file (path: __file_path)
+
+        Only objects that are new or have changed fields since the last
+        save are re-encoded; the file is not written at all when nothing
+        changed, and only once at the end of a batch().
+        """
+        saved = self.__saved
+        dirty = set(id(obj) for obj in models.base_model.changed_objects())
+        written = []
+        for key, obj in self.__objects.items():
+            entry = saved.get(key)
+            if entry is None or entry[0] is not obj or id(obj) in dirty:
+                saved[key] = [obj, json.dumps(obj.to_dict())]
+                written.append(obj)
+        deleted = []
+        if len(saved) > len(self.__objects):
+            for key in set(saved) - set(self.__objects):
+                deleted.append(saved.pop(key)[0])
+        self.__pending = False
+        if not written and not deleted and self.__file_sig is not None:
+            return
+        if getattr(self.__local, "batch", 0):
+            self.__unwritten = True
+        else:
+            self.__write()
+        for obj in written:
+            obj.clear_changes()
+            self.notify("save", obj)
+        for obj in deleted:
+            self.notify("delete", obj)
+
+    def __write(self):
+        """writes the last saved JSON text of every object to the file"""
+        parts = []
+        for key, entry in self.__saved.items():
+            if type(entry[1]) is not str:
+                entry[1] = json.dumps(entry[1])
+            parts.append(json.dumps(key) + ": " + entry[1])
         with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
+            f.write("{" + ", ".join(parts) + "}")
+        self.__file_sig = self.__stat()
+        self.__unwritten = False
+
+    @contextmanager
+    def batch(self):
+        """runs its block as one unit of work: the save() calls in it
+        notify their writes as usual but the JSON file is written once,
+        by the save() run when the outermost block ends
+
+        The depth of the blocks is kept per thread, so the save() calls
+        of the other threads still write the file.
+        """
+        depth = getattr(self.__local, "batch", 0)
+        self.__local.batch = depth + 1
+        try:
+            yield self
+        finally:
+            self.__local.batch = depth
+            if not depth:
+                self.save()
+                if self.__unwritten:
+                    self.__write()
+
+    @contextmanager
+    def savepoint(self):
+        """runs its block: FileStorage has no transaction to roll back, so
+        the objects a failed block changed in memory stay changed"""
+        yield self
+
+    def subscribe(self, listener):
+        """registers listener(event, obj), called after each save() with
+        ("save", obj) for every object written, ("delete", obj) for every
+        object removed, and with ("reload", None) when the objects are
+        rebuilt from the JSON file"""
+        self.__listeners.append(listener)
+
+    def notify(self, event, obj):
+        """calls the registered listeners with event and obj"""
+        for listener in self.__listeners:
+            listener(event, obj)
+
+    def subscribe_statements(self, listener):
+        """does nothing: FileStorage executes no SQL statements, so
+        listener(statement, parameters, duration) would never be called"""
+
+    def __stat(self):
+        """returns the (mtime, size) signature of the JSON file"""
+        try:
+            st = os.stat(self.__file_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def __unsaved(self):
+        """tells if the in-memory objects differ from the last save"""
+        if self.__pending or len(self.__objects) != len(self.__saved):
+            return True
+        for obj in models.base_model.changed_objects():
+            key = obj.__class__.__name__ + "." + str(getattr(obj, "id", ""))
+            entry = self.__saved.get(key)
+            if entry is not None and entry[0] is obj:
+                return True
+        return False
 
     def reload(self):
-        """deserializes the JSON file to __objects"""
+        """deserializes the JSON file to __objects
+
+        The file is only parsed again if it changed on disk or in-memory
+        objects hold changes that were never saved.
+        """
+        sig = self.__stat()
+        if sig is None or (sig == self.__file_sig and not self.__unsaved()):
+            return
         try:
             with open(self.__file_path, 'r') as f:
                 jo = json.load(f)
             for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
+                obj = classes[jo[key]["__class__"]](**jo[key])
+                self.__objects[key] = obj
+                # encoded lazily by the next save() that writes the file
+                self.__saved[key] = [obj, jo[key]]
+            self.__file_sig = sig
+            self.__pending = False
+            self.__order.clear()
         except FileNotFoundError:
-            pass
+            return
+        self.notify("reload", None)
 
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
@@ -64,22 +229,95 @@ class FileStorage:
             key = obj.__class__.__name__ + '.' + obj.id
             if key in self.__objects:
                 del self.__objects[key]
+                self.__pending = True
+                order = self.__order.get(obj.__class__.__name__)
+                if order is not None:
+                    entry = (obj.created_at, obj.id)
+                    i = bisect_left(order, entry)
+                    if i < len(order) and order[i] == entry:
+                        del order[i]
+
+    def delete_many(self, objs):
+        """deletes each of objs from __objects, like delete() but
+        filtering the (created_at, id) order of their classes once"""
+        removed = {}
+        for obj in objs:
+            key = obj.__class__.__name__ + '.' + obj.id
+            if key in self.__objects:
+                del self.__objects[key]
+                self.__pending = True
+                removed.setdefault(obj.__class__.__name__, set()).add(
+                    (obj.created_at, obj.id))
+        for cls, entries in removed.items():
+            order = self.__order.get(cls)
+            if order is not None:
+                order[:] = [entry for entry in order
+                            if entry not in entries]
 
     def close(self):
         """call reload() method for deserializing the JSON file to objects"""
         self.reload()
 
-    def get(self, cls, id):
+    def get(self, cls, id, fields=None):
         """A method to retrieve one object"""
         if cls is None or id is None:
             return None
-        for obj in self.all(cls).values():
-            if obj.id == id:
-                return obj
-        return None
+        if type(cls) is not str:
+            cls = cls.__name__
+        return self.__objects.get("{}.{}".format(cls, id))
+
+    def get_many(self, cls, ids, fields=None):
+        """retrieves the objects of cls with the given ids, in that order,
+        skipping the ids that do not exist"""
+        if cls is None:
+            return []
+        if type(cls) is not str:
+            cls = cls.__name__
+        objects = self.__objects
+        objs = []
+        for id in ids:
+            obj = objects.get("{}.{}".format(cls, id))
+            if obj is not None:
+                objs.append(obj)
+        return objs
+
+    def page(self, cls, after=None, limit=None, fields=None):
+        """returns the objects of cls ordered by (created_at, id), from the
+        first one whose (created_at, id) is greater than after, and at
+        most limit of them; the cost does not depend on how far after is
+
+        Entries left over by objects removed without delete() are
+        skipped.
+        """
+        if type(cls) is not str:
+            cls = cls.__name__
+        order = self.__order.get(cls)
+        if order is None:
+            order = sorted((obj.created_at, obj.id)
+                           for obj in self.__all(cls).values())
+            self.__order[cls] = order
+        start = 0 if after is None else bisect_right(order, tuple(after))
+        objs = []
+        for i in range(start, len(order)):
+            if limit is not None and len(objs) >= limit:
+                break
+            created_at, id = order[i]
+            obj = self.__objects.get(cls + "." + id)
+            if obj is not None and obj.created_at == created_at:
+                objs.append(obj)
+        return objs
+
+    def links(self, cls, relationship, ids=None):
+        """yields the (id, related id) pairs of a relationship of cls, only
+        for the objects with the given ids if any"""
+        if ids is None:
+            objs = self.all(cls).values()
+        else:
+            objs = self.get_many(cls, ids)
+        for obj in objs:
+            for related in getattr(obj, relationship):
+                yield obj.id, related.id
 
     def count(self, cls=None):
         """A method to count the number of objects in storage"""
-        if cls is None:
-            return len(self.all())
-        return len(self.all(cls))
+        return len(self.__all(cls))
@@ -0,0 +1,224 @@
+#!/usr/bin/python3
+"""
+Contains the GeoIndex class
+"""
+
+import heapq
+import math
+from threading import RLock
+
+# mean earth radius in kilometers
+EARTH_RADIUS = 6371.0088
+# kilometers per degree of latitude
+KM_PER_DEG = math.pi * EARTH_RADIUS / 180
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """returns the great-circle distance between two points in kilometers"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GeoIndex:
+    """grid index over the latitude/longitude of the objects of one class
+
+    The globe is cut into cells of cell_size degrees; each cell maps object
+    ids to their coordinates. The index is built from storage on first use
+    and then kept up to date from the storage write events.
+    """
+
+    def __init__(self, storage, cls, cell_size=0.1):
+        """Instantiate a GeoIndex over the objects of the class named cls"""
+        self.storage = storage
+        self.cls = cls
+        self.cell_size = cell_size
+        self.__rows = int(math.ceil(180 / cell_size))
+        self.__cols = int(math.ceil(360 / cell_size))
+        self.__cells = {}
+        self.__points = {}
+        self.__built = False
+        self.__lock = RLock()
+        storage.subscribe(self.on_write)
+
+    def __cell(self, lat, lon):
+        """returns the (row, col) of the cell holding a point"""
+        row = min(int((lat + 90) / self.cell_size), self.__rows - 1)
+        col = int(((lon + 180) % 360) / self.cell_size) % self.__cols
+        return (row, col)
+
+    def __add(self, obj):
+        """indexes obj, replacing its previous position if any"""
+        self.__remove(obj.id)
+        lat = getattr(obj, "latitude", None)
+        lon = getattr(obj, "longitude", None)
+        if lat is None or lon is None:
+            return
+        lat, lon = float(lat), float(lon)
+        if not -90 <= lat <= 90:
+            return
+        cell = self.__cell(lat, lon)
+        self.__cells.setdefault(cell, {})[obj.id] = (lat, lon)
+        self.__points[obj.id] = cell
+
+    def __remove(self, obj_id):
+        """drops obj_id from the index"""
+        cell = self.__points.pop(obj_id, None)
+        if cell is not None:
+            bucket = self.__cells[cell]
+            del bucket[obj_id]
+            if not bucket:
+                del self.__cells[cell]
+
+    def __ensure(self):
+        """builds the index from storage if it is not built yet"""
+        if not self.__built:
+            self.__cells = {}
+            self.__points = {}
+            for obj in self.storage.all(self.cls).values():
+                self.__add(obj)
+            self.__built = True
+
+    def on_write(self, event, obj):
+        """storage listener keeping the index in sync with the writes"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+            elif not self.__built or obj.__class__.__name__ != self.cls:
+                return
+            elif event == "delete":
+                self.__remove(obj.id)
+            else:
+                self.__add(obj)
+
+    def __len__(self):
+        """returns the number of indexed points"""
+        with self.__lock:
+            self.__ensure()
+            return len(self.__points)
+
+    def __all_points(self):
+        """yields (id, lat, lon) of every indexed point"""
+        for bucket in self.__cells.values():
+            for obj_id, (lat, lon) in bucket.items():
+                yield obj_id, lat, lon
+
+    def __scan(self, rows, cols):
+        """yields (id, lat, lon) of the points in the given cells
+
+        Falls back to a full scan when there are more cells than points.
+        """
+        if len(rows) * len(cols) > len(self.__points):
+            yield from self.__all_points()
+            return
+        for row in rows:
+            for col in cols:
+                bucket = self.__cells.get((row, col))
+                if bucket:
+                    for obj_id, (lat, lon) in bucket.items():
+                        yield obj_id, lat, lon
+
+    def __col_range(self, min_lon, max_lon):
+        """returns the column indexes covering a longitude span"""
+        if max_lon - min_lon >= 360:
+            return range(self.__cols)
+        first = self.__cell(0, min_lon)[1]
+        last = self.__cell(0, max_lon)[1]
+        if last >= first:
+            return range(first, last + 1)
+        return list(range(first, self.__cols)) + list(range(last + 1))
+
+    def nearby(self, lat, lon, radius, limit=None):
+        """returns [(distance, id)] of the points within radius km of a
+        point, nearest first
+
+        Cells are visited in rings around the point, so a limited query
+        stops as soon as no unvisited cell can hold a nearer point.
+        """
+        with self.__lock:
+            self.__ensure()
+            if limit is not None and limit <= 0:
+                return []
+            # km covered by one cell, along a parallel at the most poleward
+            # latitude the search can reach, which is the narrowest cell
+            scale = KM_PER_DEG * self.cell_size * max(1e-6, math.cos(
+                math.radians(min(90.0, abs(lat) + radius / KM_PER_DEG))))
+            max_ring = min(int(math.ceil(radius / scale)) + 1, self.__cols)
+            found = []
+            if (2 * max_ring + 1) ** 2 > len(self.__points):
+                for obj_id, p_lat, p_lon in self.__all_points():
+                    dist = haversine(lat, lon, p_lat, p_lon)
+                    if dist <= radius:
+                        found.append((dist, obj_id))
+                return self.__nearest(found, limit)
+            row, col = self.__cell(lat, lon)
+            seen = set()
+            for ring in range(max_ring + 1):
+                for r in range(max(0, row - ring),
+                               min(self.__rows, row + ring + 1)):
+                    if r in (row - ring, row + ring):
+                        cols = range(col - ring, col + ring + 1)
+                    else:
+                        cols = (col - ring, col + ring)
+                    for c in cols:
+                        cell = (r, c % self.__cols)
+                        if cell in seen:
+                            continue
+                        seen.add(cell)
+                        bucket = self.__cells.get(cell)
+                        if not bucket:
+                            continue
+                        for obj_id, (p_lat, p_lon) in bucket.items():
+                            dist = haversine(lat, lon, p_lat, p_lon)
+                            if dist <= radius:
+                                found.append((dist, obj_id))
+                # every cell not visited yet is at least ring cells away
+                bound = ring * scale
+                if bound > radius:
+                    break
+                if limit is not None and len(found) >= limit:
+                    best = heapq.nsmallest(limit, found)
+                    if best[-1][0] <= bound:
+                        return best
+            return self.__nearest(found, limit)
+
+    @staticmethod
+    def __nearest(found, limit):
+        """returns the limit smallest (distance, id) pairs, sorted"""
+        if limit is None:
+            return sorted(found)
+        return heapq.nsmallest(limit, found)
+
+    def within(self, min_lat, min_lon, max_lat, max_lon, lat=None, lon=None,
+               limit=None):
+        """returns [(distance, id)] of the points inside a bounding box,
+        nearest first to (lat, lon) or to the center of the box
+
+        A box with min_lon greater than max_lon crosses the antimeridian.
+        """
+        with self.__lock:
+            self.__ensure()
+            if limit is not None and limit <= 0:
+                return []
+            if lat is None or lon is None:
+                lat = (min_lat + max_lat) / 2
+                span = (max_lon - min_lon) % 360
+                lon = (min_lon + span / 2 + 180) % 360 - 180
+            first = self.__cell(max(-90, min_lat), 0)[0]
+            last = self.__cell(min(90, max_lat), 0)[0]
+            wraps = min_lon > max_lon
+            cols = self.__col_range(min_lon, max_lon + 360 if wraps
+                                    else max_lon)
+            found = []
+            for obj_id, p_lat, p_lon in self.__scan(range(first, last + 1),
+                                                    cols):
+                if not min_lat <= p_lat <= max_lat:
+                    continue
+                if wraps:
+                    if max_lon < p_lon < min_lon:
+                        continue
+                elif not min_lon <= p_lon <= max_lon:
+                    continue
+                found.append((haversine(lat, lon, p_lat, p_lon), obj_id))
+            return self.__nearest(found, limit)
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+"""
+Contains the HashIndex class
+"""
+
+from threading import RLock
+
+
+class HashIndex:
+    """hash index over one attribute of the objects of one class
+
+    Each attribute value maps to the set of ids of the objects holding it,
+    e.g. a City id to the ids of its places. The index is built from
+    storage on first use and kept up to date from the storage write events.
+    """
+
+    def __init__(self, storage, cls, attribute):
+        """Instantiate a HashIndex over cls.<attribute>"""
+        self.storage = storage
+        self.cls = cls
+        self.attribute = attribute
+        self.__ids = {}
+        self.__values = {}
+        self.__built = False
+        self.__lock = RLock()
+        storage.subscribe(self.on_write)
+
+    def __add(self, obj_id, value):
+        """indexes obj_id under value, replacing its previous value"""
+        old = self.__values.get(obj_id)
+        if obj_id in self.__values:
+            if old == value:
+                return
+            self.__remove(obj_id)
+        self.__values[obj_id] = value
+        self.__ids.setdefault(value, set()).add(obj_id)
+
+    def __remove(self, obj_id):
+        """drops obj_id from the index"""
+        if obj_id not in self.__values:
+            return
+        value = self.__values.pop(obj_id)
+        bucket = self.__ids[value]
+        bucket.discard(obj_id)
+        if not bucket:
+            del self.__ids[value]
+
+    def __ensure(self):
+        """builds the index from storage if it is not built yet"""
+        if not self.__built:
+            self.__ids = {}
+            self.__values = {}
+            for obj in self.storage.all(self.cls).values():
+                self.__add(obj.id, getattr(obj, self.attribute, None))
+            self.__built = True
+
+    def on_write(self, event, obj):
+        """storage listener keeping the index in sync with the writes"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+            elif not self.__built or obj.__class__.__name__ != self.cls:
+                return
+            elif event == "delete":
+                self.__remove(obj.id)
+            else:
+                self.__add(obj.id, getattr(obj, self.attribute, None))
+
+    def __len__(self):
+        """returns the number of indexed objects"""
+        with self.__lock:
+            self.__ensure()
+            return len(self.__values)
+
+    def count(self, values):
+        """returns the number of objects holding one of values"""
+        with self.__lock:
+            self.__ensure()
+            return sum(len(self.__ids.get(value, ()))
+                       for value in set(values))
+
+    def ids(self, values):
+        """returns the set of ids of the objects holding one of values"""
+        with self.__lock:
+            self.__ensure()
+            found = set()
+            for value in set(values):
+                found.update(self.__ids.get(value, ()))
+            return found
+
+    def filter(self, obj_ids, values):
+        """returns the ids of obj_ids whose objects hold one of values"""
+        with self.__lock:
+            self.__ensure()
+            wanted = set(values)
+            indexed = self.__values
+            return [obj_id for obj_id in obj_ids
+                    if obj_id in indexed and indexed[obj_id] in wanted]
+
+    def value_of(self, obj_id):
+        """returns the indexed value of obj_id, None if not indexed"""
+        with self.__lock:
+            self.__ensure()
+            return self.__values.get(obj_id)
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""
+Contains the Limiter class
+"""
+
+from threading import Lock, Semaphore
+
+
+class Limiter:
+    """concurrency limit with a bounded queue
+
+    At most concurrency callers hold a slot at once. When all are taken,
+    up to queue more callers wait for one, each for at most timeout
+    seconds (or as long as it takes if None); the callers beyond the
+    queue are rejected at once, so an overload is turned away quickly
+    instead of slowing down every caller.
+    """
+
+    def __init__(self, concurrency, queue=0, timeout=None):
+        """Instantiate a Limiter of concurrency slots and queue waiters"""
+        self.concurrency = concurrency
+        self.queue = queue
+        self.timeout = timeout
+        self.__slots = Semaphore(concurrency)
+        self.__active = 0
+        self.__waiting = 0
+        self.__lock = Lock()
+
+    @property
+    def active(self):
+        """the number of slots held"""
+        return self.__active
+
+    @property
+    def waiting(self):
+        """the number of callers waiting for a slot"""
+        return self.__waiting
+
+    def acquire(self):
+        """takes a slot, waiting for one if the queue has room, and tells
+        if one was taken; a caller given True must call release()"""
+        if not self.__slots.acquire(blocking=False):
+            with self.__lock:
+                if self.__waiting >= self.queue:
+                    return False
+                self.__waiting += 1
+            try:
+                if not self.__slots.acquire(timeout=self.timeout):
+                    return False
+            finally:
+                with self.__lock:
+                    self.__waiting -= 1
+        with self.__lock:
+            self.__active += 1
+        return True
+
+    def release(self):
+        """gives back a slot taken by acquire()"""
+        with self.__lock:
+            self.__active -= 1
+        self.__slots.release()
@@ -0,0 +1,234 @@
+#!/usr/bin/python3
+"""
+Contains the Metrics class
+"""
+
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock, local
+import time
+
+# the default upper bounds, in seconds, of the histogram buckets
+latency_buckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0)
+# the storage methods timed by instrument()
+storage_operations = ("all", "get", "get_many", "page", "count", "save",
+                      "delete", "reload")
+
+
+def escape(value):
+    """returns value as a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"') \
+        .replace('\n', '\\n')
+
+
+def number(value):
+    """returns value in the Prometheus text format"""
+    if value == float('inf'):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metrics:
+    """registry of counters, gauges and histograms, each with one series
+    per set of label values, exported in the Prometheus text format
+
+    A metric is declared once with counter(), gauge() or histogram(), then
+    updated with inc() or observe() and the label values of the series,
+    e.g. metrics.inc("requests_total", method="GET"). An update only takes
+    a lock and a few additions, histograms keeping per-bucket counts that
+    render() accumulates.
+    """
+
+    def __init__(self, prefix="hbnb_"):
+        """Instantiate an empty Metrics naming its metrics prefix + name"""
+        self.prefix = prefix
+        self.__metrics = {}
+        self.__lock = Lock()
+
+    def __declare(self, name, kind, help, buckets=None):
+        """declares the metric name, if not already"""
+        with self.__lock:
+            self.__metrics.setdefault(name, (kind, help, buckets, {}))
+
+    def counter(self, name, help):
+        """declares the counter name"""
+        self.__declare(name, "counter", help)
+
+    def gauge(self, name, help):
+        """declares the gauge name"""
+        self.__declare(name, "gauge", help)
+
+    def histogram(self, name, help, buckets=latency_buckets):
+        """declares the histogram name, counting the observed values up to
+        each of the sorted upper bounds of buckets"""
+        self.__declare(name, "histogram", help, tuple(buckets))
+
+    def inc(self, name, amount=1, **labels):
+        """adds amount, possibly negative for a gauge, to the series of
+        the counter or gauge name with labels"""
+        key = tuple(sorted(labels.items()))
+        series = self.__metrics[name][3]
+        with self.__lock:
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        """records value in the series of the histogram name with
+        labels"""
+        key = tuple(sorted(labels.items()))
+        kind, help, buckets, series = self.__metrics[name]
+        with self.__lock:
+            counts = series.get(key)
+            if counts is None:
+                counts = series[key] = [0] * (len(buckets) + 1) + [0]
+            counts[bisect_left(buckets, value)] += 1
+            counts[-1] += value
+
+    def value(self, name, **labels):
+        """returns the value of the series of the counter or gauge name
+        with labels, or the number of values observed by the histogram"""
+        kind, help, buckets, series = self.__metrics[name]
+        with self.__lock:
+            found = series.get(tuple(sorted(labels.items())))
+            if found is None:
+                return 0
+            return sum(found[:-1]) if kind == "histogram" else found
+
+    def render(self):
+        """returns every metric in the Prometheus text format"""
+        lines = []
+        with self.__lock:
+            metrics = sorted(
+                (name, kind, help, buckets,
+                 {key: list(value) if buckets else value
+                  for key, value in series.items()})
+                for name, (kind, help, buckets, series)
+                in self.__metrics.items())
+        for name, kind, help, buckets, series in metrics:
+            name = self.prefix + name
+            lines.append("# HELP {} {}".format(name, help))
+            lines.append("# TYPE {} {}".format(name, kind))
+            for key, value in sorted(series.items()):
+                labels = ['{}="{}"'.format(label, escape(label_value))
+                          for label, label_value in key]
+                if kind != "histogram":
+                    lines.append(self.__line(name, labels, value))
+                    continue
+                total = 0
+                for bound, count in zip(buckets + (float('inf'),), value):
+                    total += count
+                    lines.append(self.__line(
+                        name + "_bucket",
+                        labels + ['le="{}"'.format(number(bound))], total))
+                lines.append(self.__line(name + "_sum", labels, value[-1]))
+                lines.append(self.__line(name + "_count", labels, total))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def __line(name, labels, value):
+        """returns the sample line of name with labels"""
+        if labels:
+            name += "{" + ",".join(labels) + "}"
+        return "{} {}".format(name, number(value))
+
+
+def instrument(storage, metrics, slow_log=None,
+               operations=storage_operations):
+    """counts and times the calls to the operations methods of storage
+    in metrics, under storage_operations_total and
+    storage_operation_duration_seconds, and hands them to slow_log, a
+    SlowLog, if given
+
+    An operation called by another one, e.g. a get() run by get_many(),
+    is part of it and not recorded on its own.
+    """
+    metrics.counter("storage_operations_total",
+                    "Storage operations, by operation.")
+    metrics.histogram("storage_operation_duration_seconds",
+                      "Time spent in storage operations, by operation.")
+
+    # the depth of the operations running in each thread: only the
+    # outermost one is recorded, not the ones it calls itself
+    calls = local()
+
+    def timed(operation, method):
+        """returns method counted and timed as operation"""
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            """calls method, recording its count and duration unless it
+            is called by another operation"""
+            if getattr(calls, "depth", 0):
+                return method(*args, **kwargs)
+            calls.depth = 1
+            start = time.perf_counter()
+            result = None
+            try:
+                result = method(*args, **kwargs)
+                return result
+            finally:
+                calls.depth = 0
+                duration = time.perf_counter() - start
+                metrics.observe("storage_operation_duration_seconds",
+                                duration, operation=operation)
+                metrics.inc("storage_operations_total", operation=operation)
+                if slow_log is not None:
+                    slow_log.operation(operation, duration, args, kwargs,
+                                       result)
+        return wrapper
+
+    for operation in operations:
+        method = getattr(storage, operation, None)
+        if method is not None:
+            setattr(storage, operation, timed(operation, method))
+
+
+def init_app(app, metrics, path="/metrics"):
+    """records the request counts, latencies and in-flight requests of
+    the Flask app in metrics, by endpoint (the URL rule of the request),
+    and exports metrics at path"""
+    from flask import Response, request
+
+    metrics.counter("http_requests_total",
+                    "HTTP requests, by method, endpoint and status.")
+    metrics.histogram("http_request_duration_seconds",
+                      "HTTP request latency, by method and endpoint.")
+    metrics.gauge("http_requests_in_flight",
+                  "HTTP requests being served.")
+
+    # kept in the WSGI environ of the request rather than in flask.g, which
+    # is shared with the requests run inside it such as /batch operations
+    @app.before_request
+    def start_request():
+        """starts the timer of the request"""
+        request.environ["hbnb.metrics_start"] = time.perf_counter()
+        metrics.inc("http_requests_in_flight")
+
+    @app.after_request
+    def record_status(response):
+        """keeps the status of the response for end_request"""
+        request.environ["hbnb.metrics_status"] = response.status_code
+        return response
+
+    @app.teardown_request
+    def end_request(error=None):
+        """records the request, once its response is sent"""
+        start = request.environ.pop("hbnb.metrics_start", None)
+        if start is None:
+            return
+        metrics.inc("http_requests_in_flight", -1)
+        status = request.environ.pop("hbnb.metrics_status", 500)
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe("http_request_duration_seconds",
+                        time.perf_counter() - start,
+                        method=request.method, endpoint=endpoint)
+        metrics.inc("http_requests_total", method=request.method,
+                    endpoint=endpoint, status=status)
+
+    def export():
+        """returns the metrics in the Prometheus text format"""
+        return Response(metrics.render(),
+                        mimetype="text/plain; version=0.0.4")
+
+    app.add_url_rule(path, "metrics", export)
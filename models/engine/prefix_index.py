@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+"""
+Contains the PrefixIndex class
+"""
+
+from bisect import bisect_left, insort
+import heapq
+from threading import RLock
+import unicodedata
+
+
+def normalize(text):
+    """returns text in lowercase without accents, for matching"""
+    text = unicodedata.normalize("NFKD", str(text))
+    return "".join(c for c in text
+                   if not unicodedata.combining(c)).casefold().strip()
+
+
+def terms(name):
+    """returns the normalized name from the start of each of its words,
+    e.g. "new york" and "york" for "New York\""""
+    name = normalize(name)
+    words = name.split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class PrefixIndex:
+    """sorted index of the names of stored objects for autocompletion
+
+    fields maps a class name to the attribute holding the name of its
+    objects. Each class keeps a sorted list of (term, name, id) entries,
+    one per word of the name, so the names with a word starting with a
+    prefix are next to each other and found with a bisection. The index
+    is built from storage on first use and kept up to date from the
+    storage write events.
+    """
+
+    def __init__(self, storage, fields):
+        """Instantiate a PrefixIndex over the given class fields"""
+        self.storage = storage
+        self.fields = dict(fields)
+        self.__entries = {}
+        self.__objs = {}
+        self.__built = False
+        self.__lock = RLock()
+        storage.subscribe(self.on_write)
+
+    def __remove(self, cls, obj_id):
+        """drops the entries of an object"""
+        entries = self.__entries[cls]
+        for entry in self.__objs.pop(cls + "." + obj_id, ()):
+            i = bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+
+    def __add(self, obj):
+        """indexes the name of obj, replacing its previous one"""
+        cls = obj.__class__.__name__
+        name = getattr(obj, self.fields[cls], None)
+        key = cls + "." + obj.id
+        old = self.__objs.get(key)
+        if old and old[0][1] == name:
+            return
+        self.__remove(cls, obj.id)
+        if not name:
+            return
+        new = [(term, name, obj.id) for term in terms(name)]
+        for entry in new:
+            insort(self.__entries[cls], entry)
+        self.__objs[key] = new
+
+    def __ensure(self):
+        """builds the index from storage if it is not built yet"""
+        if self.__built:
+            return
+        self.__objs = {}
+        for cls, field in self.fields.items():
+            entries = []
+            for obj in self.storage.all(cls).values():
+                name = getattr(obj, field, None)
+                if name:
+                    new = [(term, name, obj.id) for term in terms(name)]
+                    entries.extend(new)
+                    self.__objs[cls + "." + obj.id] = new
+            entries.sort()
+            self.__entries[cls] = entries
+        self.__built = True
+
+    def on_write(self, event, obj):
+        """storage listener keeping the index in sync with the writes"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+            elif not self.__built or obj.__class__.__name__ not in self.fields:
+                return
+            elif event == "delete":
+                self.__remove(obj.__class__.__name__, obj.id)
+            else:
+                self.__add(obj)
+
+    def __len__(self):
+        """returns the number of indexed names"""
+        with self.__lock:
+            self.__ensure()
+            return len(self.__objs)
+
+    def __matches(self, cls, prefix):
+        """yields the (term, name, id, cls) entries of cls whose term
+        starts with prefix, in order"""
+        entries = self.__entries[cls]
+        for i in range(bisect_left(entries, (prefix,)), len(entries)):
+            term, name, obj_id = entries[i]
+            if not term.startswith(prefix):
+                return
+            yield term, name, obj_id, cls
+
+    def complete(self, prefix, classes=None, limit=10):
+        """returns up to limit (class name, id, name) tuples for the
+        objects with a word of their name starting with prefix, sorted
+        by the matched part of the name, each object listed once
+
+        classes restricts the objects to the given class names.
+        """
+        prefix = normalize(prefix)
+        with self.__lock:
+            self.__ensure()
+            sources = [self.__matches(cls, prefix)
+                       for cls in (classes or self.fields)]
+            found = []
+            seen = set()
+            for term, name, obj_id, cls in heapq.merge(*sources):
+                if len(found) >= limit:
+                    break
+                if (cls, obj_id) not in seen:
+                    seen.add((cls, obj_id))
+                    found.append((cls, obj_id, name))
+            return found
@@ -0,0 +1,234 @@
+#!/usr/bin/python3
+"""
+Contains the QueryPlanner class, the predicates it combines and the
+select function ordering and paginating its results
+"""
+
+import heapq
+
+
+def sort_key(order_by, descending=False):
+    """returns the function giving the sort key of an object for select:
+    its attribute order_by, missing values last, then its id"""
+    def key(obj):
+        """sorts missing values last, then by id"""
+        value = getattr(obj, order_by, None)
+        return ((value is None) != descending, value, obj.id)
+    return key
+
+
+def select(objs, order_by=None, descending=False, limit=None, offset=0,
+           after=None):
+    """returns the list of objs sorted by their attribute order_by, by
+    created_at when only limit, offset or after are given, without the
+    first offset ones and at most limit of them
+
+    Objects missing order_by come last, and ties are broken by id. after
+    is the sort_key of the object ending the previous page: only the
+    objects coming after it are kept. With a limit, only the first
+    offset + limit objects are selected with a heap instead of sorting
+    them all.
+    """
+    if order_by is None and limit is None and not offset and after is None:
+        return list(objs)
+    key = sort_key(order_by or "created_at", descending)
+    if after is not None:
+        after = tuple(after)
+        if descending:
+            objs = [obj for obj in objs if key(obj) < after]
+        else:
+            objs = [obj for obj in objs if key(obj) > after]
+    if limit is None:
+        objs = sorted(objs, key=key, reverse=descending)
+    elif descending:
+        objs = heapq.nlargest(offset + limit, objs, key=key)
+    else:
+        objs = heapq.nsmallest(offset + limit, objs, key=key)
+    return objs[offset:]
+
+
+class InPredicate:
+    """objects whose attribute holds one of values, backed by a HashIndex"""
+
+    def __init__(self, index, values):
+        """Instantiate an InPredicate over a HashIndex"""
+        self.index = index
+        self.values = set(values)
+
+    def __repr__(self):
+        """returns the predicate as shown in a plan"""
+        return "{} in {} values".format(self.index.attribute,
+                                        len(self.values))
+
+    def estimate(self):
+        """returns the number of matching objects"""
+        return self.index.count(self.values)
+
+    def ids(self):
+        """returns the set of ids of the matching objects"""
+        return self.index.ids(self.values)
+
+    def filter(self, obj_ids):
+        """returns the matching ids of obj_ids"""
+        return self.index.filter(obj_ids, self.values)
+
+
+class LinkedPredicate:
+    """objects linked to all of related_ids, backed by a BitmapIndex"""
+
+    def __init__(self, index, related_ids):
+        """Instantiate a LinkedPredicate over a BitmapIndex"""
+        self.index = index
+        self.related_ids = set(related_ids)
+
+    def __repr__(self):
+        """returns the predicate as shown in a plan"""
+        return "{} has all of {} ids".format(self.index.relationship,
+                                             len(self.related_ids))
+
+    def estimate(self):
+        """returns the number of matching objects"""
+        return self.index.count(self.related_ids)
+
+    def ids(self):
+        """returns the set of ids of the matching objects"""
+        return set(self.index.linked_to_all(self.related_ids))
+
+    def filter(self, obj_ids):
+        """returns the matching ids of obj_ids"""
+        return self.index.filter(obj_ids, self.related_ids)
+
+
+class RangePredicate:
+    """objects whose attribute is between low and high, both included;
+    a bound left to None is open. Backed by a SortedIndex if one is given,
+    else checked on the loaded objects"""
+
+    def __init__(self, attribute, low=None, high=None, index=None):
+        """Instantiate a RangePredicate over an attribute"""
+        self.attribute = attribute
+        self.low = low
+        self.high = high
+        self.index = index
+
+    def __repr__(self):
+        """returns the predicate as shown in a plan"""
+        return "{} <= {} <= {}".format(self.low, self.attribute, self.high)
+
+    def estimate(self):
+        """returns the number of matching objects, None without an index
+        as the cost is then unknown"""
+        if self.index is None:
+            return None
+        return self.index.count(self.low, self.high)
+
+    def ids(self):
+        """returns the set of ids of the matching objects"""
+        return self.index.ids(self.low, self.high)
+
+    def filter(self, obj_ids):
+        """returns the matching ids of obj_ids"""
+        return self.index.filter(obj_ids, self.low, self.high)
+
+    def matches(self, obj):
+        """tells if obj satisfies the predicate"""
+        value = getattr(obj, self.attribute, None)
+        if value is None:
+            return False
+        if self.low is not None and value < self.low:
+            return False
+        if self.high is not None and value > self.high:
+            return False
+        return True
+
+
+class QueryPlanner:
+    """runs conjunctions of predicates over the objects of one class
+
+    The predicates with an index are ordered by their estimated number of
+    matches: the most selective one fetches the candidate ids, and each
+    next one either intersects its own ids with them or checks them one
+    by one, whichever touches fewer ids. Only the remaining candidates are
+    loaded from storage and checked against the predicates without index.
+    """
+
+    def __init__(self, storage, cls):
+        """Instantiate a QueryPlanner over the objects of cls"""
+        self.storage = storage
+        self.cls = cls
+
+    def plan(self, predicates):
+        """returns the steps to run predicates as a list of
+        (operation, predicate, estimated rows) tuples, where operation is
+        "lookup", "intersect", "probe", "scan" or "filter"
+        """
+        indexed = []
+        residual = []
+        for predicate in predicates:
+            estimate = predicate.estimate()
+            if estimate is None:
+                residual.append(predicate)
+            else:
+                indexed.append((estimate, predicate))
+        indexed.sort(key=lambda step: step[0])
+        steps = []
+        rows = None
+        for estimate, predicate in indexed:
+            if rows is None:
+                steps.append(("lookup", predicate, estimate))
+                rows = estimate
+            else:
+                operation = "intersect" if estimate < rows else "probe"
+                steps.append((operation, predicate, estimate))
+                rows = min(rows, estimate)
+        if rows is None:
+            steps.append(("scan", None, self.storage.count(self.cls)))
+        for predicate in residual:
+            steps.append(("filter", predicate, None))
+        return steps
+
+    def __candidates(self, steps):
+        """returns the ids kept by the index steps, or None to scan"""
+        ids = None
+        for operation, predicate, estimate in steps:
+            if operation == "lookup":
+                ids = predicate.ids()
+            elif operation == "intersect":
+                ids = ids & predicate.ids()
+            elif operation == "probe":
+                ids = set(predicate.filter(ids))
+            else:
+                continue
+            if not ids:
+                return set()
+        return ids
+
+    def run(self, predicates, order_by=None, descending=False, limit=None,
+            offset=0, after=None, fields=None):
+        """returns (total, objects) where total is the number of objects
+        matching all predicates and objects the matches sorted and
+        paginated by select()
+
+        fields, the attributes the caller needs, is passed to storage
+        along with order_by and the attributes of the predicates without
+        index, so only those are loaded.
+        """
+        steps = self.plan(predicates)
+        ids = self.__candidates(steps)
+        residual = [step[1] for step in steps if step[0] == "filter"]
+        if fields is not None:
+            fields = set(fields)
+            fields.update(predicate.attribute for predicate in residual)
+            if order_by is not None:
+                fields.add(order_by)
+        if ids is None:
+            objs = self.storage.all(self.cls, fields).values()
+        else:
+            objs = self.storage.get_many(self.cls, list(ids), fields)
+        if residual:
+            objs = [obj for obj in objs
+                    if all(predicate.matches(obj) for predicate in residual)]
+        else:
+            objs = list(objs)
+        return len(objs), select(objs, order_by, descending, limit, offset,
+                                 after)
@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""
+Contains the QueryLog and QueryTracker classes
+"""
+
+import re
+import threading
+
+# a list of two or more placeholders, e.g. the values of an IN clause
+placeholders = re.compile(r"\(\s*(\?|%s|%\(\w+\)s|:\w+)"
+                          r"(\s*,\s*(\?|%s|%\(\w+\)s|:\w+))+\s*\)")
+
+
+def shape(statement):
+    """returns statement without its layout and with its lists of
+    placeholders reduced to one, so the statements only differing by
+    the number of values they are given have the same shape"""
+    statement = " ".join(statement.split())
+    return placeholders.sub("(?)", statement)
+
+
+class QueryLog:
+    """the count, duration and shapes of the SQL statements executed
+    during one unit of work, such as a request"""
+
+    def __init__(self):
+        """Instantiate an empty QueryLog"""
+        self.count = 0
+        self.duration = 0.0
+        # shape: [number of statements, their duration]
+        self.shapes = {}
+
+    def record(self, statement, duration):
+        """adds statement, executed in duration seconds"""
+        self.count += 1
+        self.duration += duration
+        entry = self.shapes.setdefault(shape(statement), [0, 0.0])
+        entry[0] += 1
+        entry[1] += duration
+
+    def repeated(self, threshold):
+        """returns the (shape, count, duration) of the shapes executed at
+        least threshold times, the most executed first: the likely N+1
+        queries, one per object instead of one for all of them"""
+        found = [(text, count, duration)
+                 for text, (count, duration) in self.shapes.items()
+                 if count >= threshold]
+        return sorted(found, key=lambda entry: (-entry[1], entry[0]))
+
+
+class QueryTracker:
+    """records the SQL statements executed by storage in the QueryLog
+    of each unit of work started in the thread executing them
+
+    The units of work of a thread nest: a statement is recorded by every
+    one started and not yet stopped, e.g. by a /batch request and by the
+    operation of it being run.
+    """
+
+    def __init__(self, storage):
+        """Instantiate a QueryTracker of the statements of storage"""
+        self.__local = threading.local()
+        storage.subscribe_statements(self.on_statement)
+
+    def __logs(self):
+        """returns the QueryLogs being filled by the current thread"""
+        logs = getattr(self.__local, "logs", None)
+        if logs is None:
+            logs = self.__local.logs = []
+        return logs
+
+    def start(self):
+        """starts a unit of work in the current thread, returning its
+        QueryLog"""
+        log = QueryLog()
+        self.__logs().append(log)
+        return log
+
+    def stop(self, log):
+        """ends the unit of work of log"""
+        logs = self.__logs()
+        if log in logs:
+            logs.remove(log)
+
+    def on_statement(self, statement, parameters, duration):
+        """records statement in the QueryLogs of the current thread"""
+        for log in getattr(self.__local, "logs", ()):
+            log.record(statement, duration)
@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""
+Contains the SlowLog class
+"""
+
+import json
+import logging
+
+# the storage methods returning no objects, logged without a result size
+writes = ("save", "reload", "delete", "delete_many", "new", "new_many")
+
+
+def class_name(cls):
+    """returns the name of cls, a class or a class name, or None"""
+    if cls is None or isinstance(cls, str):
+        return cls
+    return getattr(cls, "__name__", str(cls))
+
+
+def result_size(result):
+    """returns the number of objects in result, a collection, a single
+    object or None"""
+    if result is None:
+        return 0
+    try:
+        return len(result)
+    except TypeError:
+        return 1
+
+
+def request_endpoint():
+    """returns "<method> <URL rule>" of the Flask request being served by
+    the current thread, None outside of a request"""
+    try:
+        from flask import has_request_context, request
+    except ImportError:
+        return None
+    if not has_request_context():
+        return None
+    rule = request.url_rule.rule if request.url_rule else request.path
+    return "{} {}".format(request.method, rule)
+
+
+class SlowLog:
+    """logs the storage operations and SQL statements slower than
+    threshold seconds as one JSON object per line, with their duration,
+    class, result size and the endpoint of the request running them
+
+    Each record is also given the logged fields as its hbnb attribute,
+    for the handlers formatting them in their own way.
+    """
+
+    def __init__(self, threshold, logger=None, endpoint=request_endpoint):
+        """Instantiate a SlowLog of the operations of at least threshold
+        seconds, logged by logger (hbnb.storage by default) with the
+        calling endpoint told by endpoint()"""
+        self.threshold = threshold
+        self.logger = logging.getLogger("hbnb.storage") \
+            if logger is None else logger
+        self.endpoint = endpoint
+
+    def log(self, fields):
+        """logs fields, with the calling endpoint"""
+        fields["endpoint"] = self.endpoint()
+        self.logger.warning(json.dumps(fields, sort_keys=True, default=str),
+                            extra={"hbnb": fields})
+
+    def operation(self, operation, duration, args, kwargs, result):
+        """logs the call of the storage method operation with args and
+        kwargs, returning result, if it took duration seconds or more"""
+        if duration < self.threshold:
+            return
+        cls = args[0] if args and operation not in writes \
+            else kwargs.get("cls")
+        self.log({"event": "slow_storage_operation",
+                  "operation": operation,
+                  "duration_ms": round(duration * 1000, 3),
+                  "class": class_name(cls),
+                  "result_size": None if operation in writes
+                  else result_size(result)})
+
+    def on_statement(self, statement, parameters, duration):
+        """logs statement if it took duration seconds or more"""
+        if duration < self.threshold:
+            return
+        self.log({"event": "slow_query",
+                  "statement": " ".join(statement.split()),
+                  "duration_ms": round(duration * 1000, 3)})
@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+"""
+Contains the SortedIndex class
+"""
+
+from bisect import bisect_left, bisect_right
+from threading import RLock
+
+
+def as_number(value):
+    """returns value as an int or a float, None if it is not a number"""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class SortedIndex:
+    """sorted index over one numeric attribute of the objects of one class
+
+    The attribute values are kept in increasing order in one list and the
+    ids of their objects at the same positions in another, so the objects
+    with a value in a range are found with two bisections. Objects without
+    a numeric value are not indexed. The index is built from storage on
+    first use and kept up to date from the storage write events.
+    """
+
+    def __init__(self, storage, cls, attribute):
+        """Instantiate a SortedIndex over cls.<attribute>"""
+        self.storage = storage
+        self.cls = cls
+        self.attribute = attribute
+        self.__keys = []
+        self.__ids = []
+        self.__values = {}
+        self.__built = False
+        self.__lock = RLock()
+        storage.subscribe(self.on_write)
+
+    def __add(self, obj_id, value):
+        """indexes obj_id under value, replacing its previous value"""
+        value = as_number(value)
+        if obj_id in self.__values:
+            if self.__values[obj_id] == value:
+                return
+            self.__remove(obj_id)
+        if value is None:
+            return
+        position = bisect_right(self.__keys, value)
+        self.__keys.insert(position, value)
+        self.__ids.insert(position, obj_id)
+        self.__values[obj_id] = value
+
+    def __remove(self, obj_id):
+        """drops obj_id from the index"""
+        if obj_id not in self.__values:
+            return
+        value = self.__values.pop(obj_id)
+        position = self.__ids.index(obj_id,
+                                    bisect_left(self.__keys, value),
+                                    bisect_right(self.__keys, value))
+        del self.__keys[position]
+        del self.__ids[position]
+
+    def __ensure(self):
+        """builds the index from storage if it is not built yet"""
+        if self.__built:
+            return
+        entries = []
+        for obj in self.storage.all(self.cls).values():
+            value = as_number(getattr(obj, self.attribute, None))
+            if value is not None:
+                entries.append((value, obj.id))
+        entries.sort()
+        self.__keys = [value for value, obj_id in entries]
+        self.__ids = [obj_id for value, obj_id in entries]
+        self.__values = {obj_id: value for value, obj_id in entries}
+        self.__built = True
+
+    def on_write(self, event, obj):
+        """storage listener keeping the index in sync with the writes"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+            elif not self.__built or obj.__class__.__name__ != self.cls:
+                return
+            elif event == "delete":
+                self.__remove(obj.id)
+            else:
+                self.__add(obj.id, getattr(obj, self.attribute, None))
+
+    def __len__(self):
+        """returns the number of indexed objects"""
+        with self.__lock:
+            self.__ensure()
+            return len(self.__ids)
+
+    def __bounds(self, low, high):
+        """returns the positions delimiting the values between low and
+        high, both included; a bound left to None is open"""
+        start = 0 if low is None else bisect_left(self.__keys, low)
+        end = (len(self.__keys) if high is None
+               else bisect_right(self.__keys, high))
+        return start, max(start, end)
+
+    def count(self, low=None, high=None):
+        """returns the number of objects with a value in the range"""
+        with self.__lock:
+            self.__ensure()
+            start, end = self.__bounds(low, high)
+            return end - start
+
+    def ids(self, low=None, high=None):
+        """returns the set of ids of the objects with a value in the
+        range"""
+        with self.__lock:
+            self.__ensure()
+            start, end = self.__bounds(low, high)
+            return set(self.__ids[start:end])
+
+    def filter(self, obj_ids, low=None, high=None):
+        """returns the ids of obj_ids whose objects have a value in the
+        range"""
+        with self.__lock:
+            self.__ensure()
+            values = self.__values
+            found = []
+            for obj_id in obj_ids:
+                value = values.get(obj_id)
+                if value is None:
+                    continue
+                if low is not None and value < low:
+                    continue
+                if high is not None and value > high:
+                    continue
+                found.append(obj_id)
+            return found
+
+    def value_of(self, obj_id):
+        """returns the indexed value of obj_id, None if not indexed"""
+        with self.__lock:
+            self.__ensure()
+            return self.__values.get(obj_id)
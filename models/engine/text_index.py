@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+"""
+Contains the TextIndex class
+"""
+
+import atexit
+import heapq
+import json
+import math
+import os
+import re
+from threading import Lock, RLock, Thread
+import time
+import zlib
+
+token_re = re.compile(r"\w+", re.UNICODE)
+stop_words = frozenset("""a an and are as at be but by for from has have in
+is it its of on or that the this to was were will with""".split())
+
+
+def tokenize(text):
+    """splits text into lowercase terms, leaving out stop words"""
+    if not text:
+        return []
+    return [t for t in token_re.findall(str(text).lower())
+            if t not in stop_words]
+
+
+class TextIndex:
+    """inverted index with BM25 ranking over text fields of stored objects
+
+    fields maps a class name to {attribute: weight}; a term found in an
+    attribute counts weight times in the document. Every document keeps its
+    term frequencies so it can be re-indexed in place on each write event,
+    and a checksum of its text so a persisted snapshot can be reused for
+    the documents that did not change since it was written.
+    """
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, storage, fields, path=None, persist_interval=60):
+        """Instantiate a TextIndex over the given class fields of storage
+
+        The index is written to path (if any) by a background thread
+        every persist_interval seconds if it changed, and at exit, so the
+        writes reaching on_write never wait for the file.
+        """
+        self.storage = storage
+        self.fields = fields
+        self.path = path
+        self.persist_interval = persist_interval
+        self.__docs = {}
+        self.__postings = {}
+        self.__total_len = 0
+        self.__built = False
+        self.__dirty = False
+        self.__lock = RLock()
+        self.__file_lock = Lock()
+        storage.subscribe(self.on_write)
+        if path:
+            atexit.register(self.persist)
+            Thread(target=self.__persist_every, daemon=True).start()
+
+    def __text(self, obj):
+        """returns the weighted text fields of obj"""
+        return [(getattr(obj, name, None) or "", weight) for name, weight
+                in self.fields[obj.__class__.__name__].items()]
+
+    @staticmethod
+    def __checksum(texts):
+        """returns a checksum of the text fields of a document"""
+        crc = 0
+        for text, weight in texts:
+            crc = zlib.crc32(str(text).encode("utf-8", "replace") + b"\0",
+                             crc)
+        return crc
+
+    def __remove(self, key):
+        """drops document key from the index"""
+        doc = self.__docs.pop(key, None)
+        if doc is None:
+            return
+        self.__total_len -= doc[1]
+        for term in doc[2]:
+            posting = self.__postings[term]
+            del posting[key]
+            if not posting:
+                del self.__postings[term]
+
+    def __insert(self, key, crc, length, freqs):
+        """adds a document with its term frequencies to the index"""
+        self.__docs[key] = (crc, length, freqs)
+        self.__total_len += length
+        for term, tf in freqs.items():
+            self.__postings.setdefault(term, {})[key] = tf
+
+    def __add(self, obj, snapshot=None):
+        """indexes obj, replacing its previous version if any
+
+        Returns True if the document was taken from snapshot unchanged.
+        """
+        key = obj.__class__.__name__ + "." + obj.id
+        self.__remove(key)
+        texts = self.__text(obj)
+        crc = self.__checksum(texts)
+        if snapshot and key in snapshot and snapshot[key][0] == crc:
+            self.__insert(key, crc, snapshot[key][1], snapshot[key][2])
+            return True
+        freqs = {}
+        length = 0
+        for text, weight in texts:
+            for term in tokenize(text):
+                freqs[term] = freqs.get(term, 0) + weight
+                length += weight
+        self.__insert(key, crc, length, freqs)
+        return False
+
+    def __load(self):
+        """returns the persisted documents, or None"""
+        if not self.path:
+            return None
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f).get("docs")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def __ensure(self):
+        """builds the index from storage if it is not built yet"""
+        if self.__built:
+            return
+        snapshot = self.__load()
+        self.__docs = {}
+        self.__postings = {}
+        self.__total_len = 0
+        reused = 0
+        for cls in self.fields:
+            for obj in self.storage.all(cls).values():
+                reused += self.__add(obj, snapshot)
+        self.__built = True
+        self.__dirty = not snapshot or reused != len(snapshot)
+
+    def build(self):
+        """(re)builds the index from storage and returns its size"""
+        with self.__lock:
+            self.__built = False
+            self.__ensure()
+            return len(self.__docs)
+
+    def persist(self):
+        """writes the index to its path if it changed since last written
+
+        The documents are copied under the index lock and written
+        without it, so searches and writes go on meanwhile.
+        """
+        with self.__file_lock:
+            with self.__lock:
+                if not self.path or not self.__built or not self.__dirty:
+                    return
+                docs = dict(self.__docs)
+                self.__dirty = False
+            try:
+                tmp = self.path + ".tmp"
+                with open(tmp, "w") as f:
+                    json.dump({"docs": docs}, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                self.__dirty = True
+                raise
+
+    def __persist_every(self):
+        """persists the index every persist_interval seconds, trying
+        again at the next one when the file cannot be written"""
+        while True:
+            time.sleep(self.persist_interval)
+            try:
+                self.persist()
+            except OSError:
+                pass
+
+    def on_write(self, event, obj):
+        """storage listener keeping the index in sync with the writes"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+                return
+            if not self.__built or obj.__class__.__name__ not in self.fields:
+                return
+            if event == "delete":
+                self.__remove(obj.__class__.__name__ + "." + obj.id)
+            else:
+                self.__add(obj)
+            self.__dirty = True
+
+    def __len__(self):
+        """returns the number of indexed documents"""
+        with self.__lock:
+            self.__ensure()
+            return len(self.__docs)
+
+    def search(self, query, classes=None, limit=10, offset=0):
+        """returns (total, [(score, key)]) for the documents matching any
+        term of query, best BM25 score first
+
+        classes restricts the documents to the given class names; limit
+        and offset select the page of results.
+        """
+        with self.__lock:
+            self.__ensure()
+            terms = set(tokenize(query))
+            n_docs = len(self.__docs)
+            if not terms or not n_docs:
+                return 0, []
+            avg_len = self.__total_len / n_docs or 1
+            k1, b = self.k1, self.b
+            docs = self.__docs
+            scores = {}
+            for term in terms:
+                posting = self.__postings.get(term)
+                if not posting:
+                    continue
+                df = len(posting)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                top = idf * (k1 + 1)
+                base = k1 * (1 - b)
+                scale = k1 * b / avg_len
+                get = scores.get
+                for key, tf in posting.items():
+                    scores[key] = get(key, 0) + top * tf / (
+                        tf + base + scale * docs[key][1])
+            if classes:
+                prefixes = tuple(cls + "." for cls in classes)
+                scores = {k: v for k, v in scores.items()
+                          if k.startswith(prefixes)}
+            page = heapq.nlargest(offset + limit, scores.items(),
+                                  key=lambda item: (item[1], item[0]))
+            return len(scores), [(s, k) for k, s in page[offset:]]
@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+"""
+Contains the Versions class
+"""
+
+from threading import RLock
+import uuid
+
+
+class Versions:
+    """version counters of the stored collections, per class and per value
+    of some of their attributes, e.g. the reviews of each place
+
+    groups maps a class name to the attributes its objects are grouped
+    by. A write of an object bumps the version of its class and of its
+    groups, both the old and the new one when it moves. A version is
+    "<epoch>.<counter>", the epoch being drawn anew each time the versions
+    are built, so a version never comes back after a restart or reload.
+    The versions are built on first use and kept up to date from the
+    storage write events.
+    """
+
+    def __init__(self, storage, groups):
+        """Instantiate Versions over the given class groups"""
+        self.storage = storage
+        self.groups = {cls: tuple(attributes)
+                       for cls, attributes in groups.items()}
+        self.__epoch = None
+        self.__counters = {}
+        self.__members = {}
+        self.__built = False
+        self.__lock = RLock()
+        storage.subscribe(self.on_write)
+
+    def __ensure(self):
+        """builds the versions if they are not built yet"""
+        if self.__built:
+            return
+        self.__epoch = uuid.uuid4().hex[:12]
+        self.__counters = {}
+        self.__members = {}
+        for cls, attributes in self.groups.items():
+            for obj in self.storage.all(cls).values():
+                self.__members[cls + "." + obj.id] = [
+                    getattr(obj, attribute, None) for attribute in attributes]
+        self.__built = True
+
+    def __bump(self, cls, values):
+        """bumps the version of cls and of the given group values"""
+        self.__counters[cls] = self.__counters.get(cls, 0) + 1
+        for attribute, value in zip(self.groups.get(cls, ()), values):
+            if value is not None:
+                key = (cls, attribute, value)
+                self.__counters[key] = self.__counters.get(key, 0) + 1
+
+    def on_write(self, event, obj):
+        """storage listener bumping the versions the writes change"""
+        with self.__lock:
+            if event == "reload":
+                self.__built = False
+                return
+            if not self.__built:
+                return
+            cls = obj.__class__.__name__
+            key = cls + "." + obj.id
+            old = self.__members.pop(key, None)
+            if old is not None:
+                self.__bump(cls, old)
+            if event == "delete":
+                return
+            values = [getattr(obj, attribute, None)
+                      for attribute in self.groups.get(cls, ())]
+            if cls in self.groups:
+                self.__members[key] = values
+            if old != values:
+                self.__bump(cls, values)
+
+    def version(self, cls, attribute=None, value=None):
+        """returns the version of the objects of cls, or only of the ones
+        whose attribute is value"""
+        key = cls if attribute is None else (cls, attribute, value)
+        with self.__lock:
+            self.__ensure()
+            return "{}.{}".format(self.__epoch, self.__counters.get(key, 0))
@@ -0,0 +1,20 @@
+#!/usr/bin/python3
+"""
+Makes the FileStorage of the tests write its JSON file to a temporary
+directory, removed at exit, instead of the working directory
+"""
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+if "HBNB_FILE_PATH" not in os.environ:
+    _data_dir = tempfile.mkdtemp(prefix="hbnb-tests-")
+    atexit.register(shutil.rmtree, _data_dir, True)
+    os.environ["HBNB_FILE_PATH"] = os.path.join(_data_dir, "file.json")
+# a test runner may import the models before this package
+if "models.engine.file_storage" in sys.modules:
+    sys.modules["models.engine.file_storage"].FileStorage.\
+        _FileStorage__file_path = os.environ["HBNB_FILE_PATH"]
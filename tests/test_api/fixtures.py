@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+"""
+Contains the populate function saving the objects the API tests run on
+"""
+
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+from types import SimpleNamespace
+
+
+def populate(name):
+    """saves new objects named after name and returns them as attributes:
+    state, its two cities, user, two amenities, places, the first three
+    in the first city costing 50, 100 and 150 with 1, 2 and 3 rooms, the
+    first one with both amenities and the second one with the first
+    amenity, and the fourth in the second city, and review, of the first
+    place"""
+    state = State(name=name)
+    state.save()
+    cities = [City(state_id=state.id, name="{} {}".format(name, i))
+              for i in range(2)]
+    for city in cities:
+        city.save()
+    user = User(email="{}@hbnb.io".format(name.lower()), password="pwd")
+    user.save()
+    amenities = [Amenity(name="{} {}".format(name, i)) for i in range(2)]
+    for amenity in amenities:
+        amenity.save()
+    places = []
+    for i in range(4):
+        place = Place(city_id=cities[i // 3].id, user_id=user.id,
+                      name="{} {}".format(name, i),
+                      price_by_night=50 * (i + 1), number_rooms=i + 1,
+                      latitude=10.0 + i, longitude=20.0 + i)
+        place.amenities = amenities[:max(0, 2 - i)]
+        place.save()
+        places.append(place)
+    review = Review(place_id=places[0].id, user_id=user.id,
+                    text="{} review".format(name))
+    review.save()
+    return SimpleNamespace(state=state, cities=cities, user=user,
+                           amenities=amenities, places=places,
+                           review=review)
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""
+Contains the TestAdmissionDocs and TestAdmission classes
+"""
+
+from api.v1 import admission
+from api.v1.app import app
+import inspect
+from models.engine.limiter import Limiter
+import pep8
+import unittest
+from unittest import mock
+
+
+class TestAdmissionDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the admission
+    module"""
+    def test_pep8_conformance(self):
+        """Test that admission.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/admission.py',
+                                    'tests/test_api/test_admission.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(admission.__doc__) > 1)
+        for name, func in inspect.getmembers(admission, inspect.isfunction):
+            if func.__module__ == admission.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestAdmission(unittest.TestCase):
+    """Test that the requests beyond their budget are turned away"""
+    def setUp(self):
+        """gives each budget a single slot and no queue"""
+        self.budgets = {"read": Limiter(1), "expensive": Limiter(1)}
+        patcher = mock.patch.object(admission, 'budgets', self.budgets)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = app.test_client()
+
+    def test_full_budget(self):
+        """Test that a request is turned away with 503 while its budget
+        is full, and admitted once a slot is free"""
+        read = self.budgets["read"]
+        self.assertTrue(read.acquire())
+        try:
+            response = self.client.get('/api/v1/views/states')
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers["Retry-After"],
+                             admission.retry_after)
+            response = self.client.post('/api/v1/views/places_search',
+                                        json={"limit": 1})
+            self.assertEqual(response.status_code, 200)
+            response.get_data()
+        finally:
+            read.release()
+        response = self.client.get('/api/v1/views/states')
+        self.assertEqual(response.status_code, 200)
+        response.get_data()
+        self.assertEqual(read.active, 0)
+
+    def test_expensive(self):
+        """Test that the writes and the searches share their own budget"""
+        expensive = self.budgets["expensive"]
+        self.assertTrue(expensive.acquire())
+        try:
+            for method, url in (('post', '/api/v1/views/states'),
+                                ('post', '/api/v1/views/places_search'),
+                                ('post', '/api/v1/views/batch')):
+                with self.subTest(url=url):
+                    response = getattr(self.client, method)(url, json={})
+                    self.assertEqual(response.status_code, 503)
+            response = self.client.get('/api/v1/views/states')
+            self.assertEqual(response.status_code, 200)
+            response.get_data()
+        finally:
+            expensive.release()
+
+    def test_exempt(self):
+        """Test that the status endpoint answers with every budget full"""
+        for limit in self.budgets.values():
+            self.assertTrue(limit.acquire())
+        try:
+            response = self.client.get('/api/v1/views/status')
+            self.assertEqual(response.status_code, 200)
+        finally:
+            for limit in self.budgets.values():
+                limit.release()
+
+    def test_batch_operations(self):
+        """Test that the operations of a batch use the slot of the batch"""
+        response = self.client.post('/api/v1/views/batch', json=[
+            {"method": "GET", "path": "/states"},
+            {"method": "POST", "path": "/states", "body": {"name": "Slot"}}])
+        self.assertEqual([result["status"]
+                          for result in response.get_json()], [200, 201])
+        self.assertEqual(self.budgets["expensive"].active, 0)
+        self.assertEqual(self.budgets["read"].active, 0)
@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+"""
+Contains the TestBatchDocs and TestBatch classes
+"""
+
+from api.v1.app import app
+import inspect
+import models
+from models.state import State
+import pep8
+import sys
+import unittest
+from unittest import mock
+batch = sys.modules['api.v1.views.batch']
+
+
+class TestBatchDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the batch module"""
+    def test_pep8_conformance(self):
+        """Test that batch.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/batch.py',
+                                    'tests/test_api/test_batch.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(batch.__doc__) > 1)
+        for name, func in inspect.getmembers(batch, inspect.isfunction):
+            if func.__module__ == batch.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestBatch(unittest.TestCase):
+    """Test the POST /batch view"""
+    url = '/api/v1/views/batch'
+
+    def setUp(self):
+        """saves a state and makes a client of the app"""
+        self.state = State(name="Batch")
+        self.state.save()
+        self.client = app.test_client()
+
+    def run_batch(self, operations):
+        """returns the results of the operations run in one batch"""
+        response = self.client.post(self.url, json=operations)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_operations(self):
+        """Test that the operations run in order, a failed one not
+        stopping the next ones"""
+        results = self.run_batch([
+            {"method": "POST", "path": "/states",
+             "body": {"name": "Batch created"}},
+            {"method": "GET", "path": "/states/unknown"},
+            {"method": "PUT", "path": "/states/" + self.state.id,
+             "body": {"name": "Batch updated"}},
+            {"method": "GET",
+             "path": "/api/v1/views/states/" + self.state.id}])
+        self.assertEqual([result["status"] for result in results],
+                         [201, 404, 200, 200])
+        self.assertEqual(results[0]["body"]["name"], "Batch created")
+        self.assertEqual(results[3]["body"]["name"], "Batch updated")
+        self.assertIn("ETag", results[3]["headers"])
+        self.assertIsNotNone(models.storage.get(
+            State, results[0]["body"]["id"]))
+
+    @unittest.skipIf(models.storage_t == 'db', 'file storage only')
+    def test_written_once(self):
+        """Test that the writes of a batch are written to the file once"""
+        storage = models.storage
+        with mock.patch.object(storage, '_FileStorage__write',
+                               wraps=storage._FileStorage__write) as write:
+            self.run_batch([{"method": "POST", "path": "/states",
+                             "body": {"name": "Batch {}".format(i)}}
+                            for i in range(3)])
+        self.assertEqual(write.call_count, 1)
+
+    def test_cache_bypassed(self):
+        """Test that a GET of a batch sees the writes made before it in
+        the batch, even when the response is cached"""
+        url = '/api/v1/views/states/{}/cities'.format(self.state.id)
+        self.client.get(url).get_data()
+        self.assertEqual(self.client.get(url).headers["X-Cache"], "HIT")
+        results = self.run_batch([
+            {"method": "POST", "path": url, "body": {"name": "In batch"}},
+            {"method": "GET", "path": url}])
+        self.assertEqual([city["name"] for city in results[1]["body"]],
+                         ["In batch"])
+
+    def test_invalid(self):
+        """Test that a body that is not a list of operations is refused
+        and that a batch cannot be nested"""
+        for body in ({"method": "GET"}, [{"method": "PATCH", "path": "/"}],
+                     [{"method": "GET"}]):
+            with self.subTest(body=body):
+                response = self.client.post(self.url, json=body)
+                self.assertEqual(response.status_code, 400)
+        with mock.patch.object(batch, 'max_operations', 1):
+            response = self.client.post(self.url, json=[
+                {"method": "GET", "path": "/status"}] * 2)
+            self.assertEqual(response.status_code, 400)
+        results = self.run_batch([{"method": "POST", "path": "/batch",
+                                   "body": []}])
+        self.assertEqual(results, [{"status": 400,
+                                    "body": {"error": "Nested batch"}}])
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""
+Contains the TestBulkDocs and TestBulk classes
+"""
+
+from api.v1.app import app
+from api.v1.views import bulk
+import inspect
+import models
+from models.state import State
+import pep8
+import unittest
+from unittest import mock
+
+
+class TestBulkDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the bulk module"""
+    def test_pep8_conformance(self):
+        """Test that bulk.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/bulk.py',
+                                    'tests/test_api/test_bulk.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(bulk.__doc__) > 1)
+        for name, func in inspect.getmembers(bulk, inspect.isfunction):
+            if func.__module__ == bulk.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestBulk(unittest.TestCase):
+    """Test the bulk endpoints"""
+    url = '/api/v1/views/states/bulk'
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def test_create(self):
+        """Test that the states are created with ids drawn at once"""
+        with mock.patch.object(bulk, 'new_ids',
+                               wraps=bulk.new_ids) as new_ids:
+            response = self.client.post(
+                self.url, json=[{"name": "Bulk {}".format(i)}
+                                for i in range(5)])
+        self.assertEqual(response.status_code, 201)
+        new_ids.assert_called_once_with(5)
+        states = response.get_json()
+        self.assertEqual([state["name"] for state in states],
+                         ["Bulk {}".format(i) for i in range(5)])
+        for state in states:
+            self.assertIsNotNone(models.storage.get(State, state["id"]))
+
+    def test_create_invalid(self):
+        """Test that nothing is created when one item is not valid"""
+        count = models.storage.count(State)
+        response = self.client.post(self.url, json=[{"name": "Valid"}, {}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["errors"],
+                         [{"index": 1, "error": "Missing name"}])
+        self.assertEqual(models.storage.count(State), count)
+        response = self.client.post(self.url, json={"name": "Not a list"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_update_delete(self):
+        """Test that the states are updated and deleted by id"""
+        states = [State(name="Old {}".format(i)) for i in range(3)]
+        for state in states:
+            state.save()
+        response = self.client.put(self.url, json=[
+            {"id": state.id, "name": "New"} for state in states])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({state["name"] for state in response.get_json()},
+                         {"New"})
+        response = self.client.delete(
+            self.url, json=[states[0].id, "unknown"])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["errors"],
+                         [{"index": 1, "error": "Not found: id"}])
+        response = self.client.delete(
+            self.url, json=[state.id for state in states])
+        self.assertEqual(response.status_code, 200)
+        for state in states:
+            self.assertIsNone(models.storage.get(State, state.id))
+
+    def test_lookups_chunked(self):
+        """Test that the ids are looked up lookup_size at a time"""
+        states = [State(name="Chunked {}".format(i)) for i in range(5)]
+        for state in states:
+            state.save()
+        body = [{"id": state.id, "name": "Chunked"} for state in states]
+        with mock.patch.object(bulk, 'lookup_size', 2), \
+                mock.patch.object(models.storage, 'get_many',
+                                  wraps=models.storage.get_many) as get_many:
+            response = self.client.put(self.url, json=body)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([len(call.args[1])
+                          for call in get_many.call_args_list], [2, 2, 1])
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""
+Contains the TestCompressionDocs and TestCompression classes
+"""
+
+from api.v1 import compression
+from api.v1.app import app
+import gzip
+import inspect
+import json
+from models.state import State
+import pep8
+import unittest
+
+
+class TestCompressionDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the compression
+    module"""
+    def test_pep8_conformance(self):
+        """Test that compression.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/compression.py',
+                                    'tests/test_api/test_compression.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(compression.__doc__) > 1)
+        for name, func in inspect.getmembers(compression,
+                                             inspect.isfunction):
+            if func.__module__ == compression.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestCompression(unittest.TestCase):
+    """Test the compression of the responses"""
+    url = '/api/v1/views/states?sort=name'
+
+    @classmethod
+    def setUpClass(cls):
+        """saves enough states for a listing worth compressing"""
+        for i in range(20):
+            State(name="Compressed {}".format(i)).save()
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def get(self, url, **headers):
+        """returns the response of a GET of url with headers, with its
+        streamed body read"""
+        response = self.client.get(url, headers=headers)
+        response.get_data()
+        return response
+
+    def test_gzip(self):
+        """Test that a listing is gzipped when the client accepts it"""
+        plain = self.get(self.url)
+        self.assertNotIn("Content-Encoding", plain.headers)
+        response = self.get(self.url, **{"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(json.loads(gzip.decompress(response.get_data())),
+                         plain.get_json())
+
+    def test_etag(self):
+        """Test that a compressed response has an ETag of its own, which
+        a conditional request may send back"""
+        etag = self.get(self.url).headers["ETag"]
+        response = self.get(self.url, **{"Accept-Encoding": "gzip"})
+        gzip_etag = response.headers["ETag"]
+        self.assertEqual(gzip_etag, etag[:-1] + '-gzip"')
+        for tag in (etag, gzip_etag):
+            with self.subTest(etag=tag):
+                response = self.get(self.url, **{"Accept-Encoding": "gzip",
+                                                 "If-None-Match": tag})
+                self.assertEqual(response.status_code, 304)
+
+    def test_small(self):
+        """Test that a small response is sent as it is"""
+        response = self.get('/api/v1/views/status',
+                            **{"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(response.get_json(), {"status": "OK"})
+
+    def test_not_accepted(self):
+        """Test that nothing is compressed for a client refusing gzip"""
+        response = self.get(self.url, **{"Accept-Encoding": "gzip;q=0"})
+        self.assertNotIn("Content-Encoding", response.headers)
@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+"""
+Contains the TestEtagsDocs, TestResourceEtags and TestCollectionEtags
+classes
+"""
+
+from api.v1.app import app
+from api.v1.views import etags
+import inspect
+from models.state import State
+import pep8
+import unittest
+
+
+class TestEtagsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the etags module"""
+    def test_pep8_conformance(self):
+        """Test that etags.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/etags.py',
+                                    'tests/test_api/test_etags.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(etags.__doc__) > 1)
+        for name, func in inspect.getmembers(etags, inspect.isfunction):
+            if func.__module__ == etags.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestResourceEtags(unittest.TestCase):
+    """Test the ETags of one object and the conditional requests on it"""
+    def setUp(self):
+        """saves a state and makes a client of the app"""
+        self.state = State(name="Etag")
+        self.state.save()
+        self.url = '/api/v1/views/states/' + self.state.id
+        self.client = app.test_client()
+
+    def etag(self):
+        """returns the ETag of the state"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response.headers["ETag"]
+
+    def test_not_modified(self):
+        """Test that a GET with the ETag in If-None-Match gets a 304"""
+        etag = self.etag()
+        response = self.client.get(self.url,
+                                   headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        response = self.client.get(self.url,
+                                   headers={"If-None-Match": '"other"'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_match(self):
+        """Test that a PUT is only applied if If-Match holds the ETag"""
+        etag = self.etag()
+        response = self.client.put(self.url, json={"name": "Lost"},
+                                   headers={"If-Match": '"other"'})
+        self.assertEqual(response.status_code, 412)
+        self.assertEqual(self.client.get(self.url).get_json()["name"],
+                         "Etag")
+        response = self.client.put(self.url, json={"name": "Kept"},
+                                   headers={"If-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "Kept")
+        self.assertNotEqual(response.headers["ETag"], etag)
+        response = self.client.put(self.url, json={"name": "Late"},
+                                   headers={"If-Match": etag})
+        self.assertEqual(response.status_code, 412)
+
+    def test_no_op_put(self):
+        """Test that a PUT changing nothing keeps the ETag"""
+        etag = self.etag()
+        response = self.client.put(self.url, json={"name": "Etag"},
+                                   headers={"If-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(self.etag(), etag)
+
+    def test_if_match_delete(self):
+        """Test that a DELETE is only applied if If-Match holds the
+        ETag"""
+        response = self.client.delete(self.url,
+                                      headers={"If-Match": '"other"'})
+        self.assertEqual(response.status_code, 412)
+        response = self.client.delete(self.url,
+                                      headers={"If-Match": self.etag()})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+
+class TestCollectionEtags(unittest.TestCase):
+    """Test the ETags of the listings"""
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def get(self, url, etag=None):
+        """returns the response of a GET of url, if not modified since
+        etag, with its streamed body read"""
+        headers = {} if etag is None else {"If-None-Match": etag}
+        response = self.client.get(url, headers=headers)
+        response.get_data()
+        return response
+
+    def test_changed_by_write(self):
+        """Test that a listing is not modified until one of its objects
+        is written"""
+        url = '/api/v1/views/states'
+        etag = self.get(url).headers["ETag"]
+        self.assertEqual(self.get(url, etag).status_code, 304)
+        State(name="Etag listing").save()
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_query_string(self):
+        """Test that each query string gets its own ETag"""
+        etag = self.get('/api/v1/views/states').headers["ETag"]
+        response = self.get('/api/v1/views/states?sort=name', etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+"""
+Contains the TestExpandDocs and TestExpand classes
+"""
+
+from api.v1.app import app
+from api.v1.views import expand
+import inspect
+from models.city import City
+import pep8
+from tests.test_api.fixtures import populate
+import unittest
+
+
+class TestExpandDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the expand module"""
+    def test_pep8_conformance(self):
+        """Test that expand.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/expand.py',
+                                    'tests/test_api/test_expand.py',
+                                    'tests/test_api/fixtures.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(expand.__doc__) > 1)
+        for name, func in inspect.getmembers(expand, inspect.isfunction):
+            if func.__module__ == expand.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestExpand(unittest.TestCase):
+    """Test the children embedded by the expand query parameter"""
+    @classmethod
+    def setUpClass(cls):
+        """saves the objects expanded"""
+        cls.world = populate("Expand")
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def get(self, url):
+        """returns the response of a GET of url, with its streamed body
+        read"""
+        response = self.client.get('/api/v1/views' + url)
+        response.get_data()
+        return response
+
+    def test_resource(self):
+        """Test that a state holds its cities, their places and their
+        reviews"""
+        response = self.get('/states/{}?expand=cities.places.reviews'.format(
+            self.world.state.id))
+        self.assertEqual(response.status_code, 200)
+        cities = response.get_json()["cities"]
+        self.assertEqual(sorted((city["name"], len(city["places"]))
+                                for city in cities),
+                         [("Expand 0", 3), ("Expand 1", 1)])
+        reviews = {place["name"]: [review["text"]
+                                   for review in place["reviews"]]
+                   for city in cities for place in city["places"]}
+        self.assertEqual(reviews, {"Expand 0": ["Expand review"],
+                                   "Expand 1": [], "Expand 2": [],
+                                   "Expand 3": []})
+
+    def test_listing(self):
+        """Test that each listed object holds its children"""
+        response = self.get('/cities/{}/places?expand=amenities,reviews'
+                            .format(self.world.cities[0].id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(place["name"], len(place["amenities"]),
+                           len(place["reviews"]))
+                          for place in response.get_json()],
+                         [("Expand 0", 2, 1), ("Expand 1", 1, 0),
+                          ("Expand 2", 0, 0)])
+
+    def test_invalid(self):
+        """Test that an unknown relationship is refused"""
+        for query in ("expand=unknown", "expand=cities.unknown",
+                      "expand=places"):
+            with self.subTest(query=query):
+                response = self.get('/states/{}?{}'.format(
+                    self.world.state.id, query))
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json(),
+                                 {"error": "Invalid expand"})
+
+    def test_etag(self):
+        """Test that writing a child changes the ETag of its expanded
+        parent"""
+        state = populate("Expand etag").state
+        url = '/states/{}?expand=cities'.format(state.id)
+        etag = self.get(url).headers["ETag"]
+        self.assertNotEqual(etag, self.get('/states/{}'.format(
+            state.id)).headers["ETag"])
+        City(state_id=state.id, name="Expand new").save()
+        response = self.client.get('/api/v1/views' + url,
+                                   headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()["cities"]), 3)
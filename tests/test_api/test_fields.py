@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+"""
+Contains the TestFieldsDocs and TestFields classes
+"""
+
+from api.v1.app import app
+from api.v1.views import fields
+import inspect
+import pep8
+from tests.test_api.fixtures import populate
+import unittest
+
+
+class TestFieldsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the fields module"""
+    def test_pep8_conformance(self):
+        """Test that fields.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/fields.py',
+                                    'tests/test_api/test_fields.py',
+                                    'tests/test_api/fixtures.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(fields.__doc__) > 1)
+        for name, func in inspect.getmembers(fields, inspect.isfunction):
+            if func.__module__ == fields.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestFields(unittest.TestCase):
+    """Test the attributes restricted by the fields query parameter"""
+    @classmethod
+    def setUpClass(cls):
+        """saves the objects listed"""
+        cls.world = populate("Fields")
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def get(self, url):
+        """returns the response of a GET of url, with its streamed body
+        read"""
+        response = self.client.get('/api/v1/views' + url)
+        response.get_data()
+        return response
+
+    def test_resource(self):
+        """Test that only the fields of an object are returned, under an
+        ETag of their own"""
+        url = '/places/' + self.world.places[0].id
+        response = self.get(url + '?fields=name,price_by_night')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(),
+                         {"name": "Fields 0", "price_by_night": 50})
+        self.assertNotEqual(response.headers["ETag"],
+                            self.get(url).headers["ETag"])
+
+    def test_listing(self):
+        """Test that only the fields of the listed objects are returned,
+        sorted by an attribute left out"""
+        response = self.get('/cities/{}/places?fields=name'
+                            '&sort=-price_by_night'.format(
+                                self.world.cities[0].id))
+        self.assertEqual(response.get_json(), [{"name": "Fields 2"},
+                                               {"name": "Fields 1"},
+                                               {"name": "Fields 0"}])
+
+    def test_unknown(self):
+        """Test that an unknown attribute is left out"""
+        response = self.get('/users/{}?fields=email,password,unknown'
+                            .format(self.world.user.id))
+        self.assertEqual(response.get_json(),
+                         {"email": "fields@hbnb.io"})
+
+    def test_invalid(self):
+        """Test that a name that is not an attribute name is refused"""
+        for query in ("fields=na-me", "fields=name,,id"):
+            with self.subTest(query=query):
+                response = self.get('/places/{}?{}'.format(
+                    self.world.places[0].id, query))
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json(),
+                                 {"error": "Invalid fields"})
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+Contains the TestIndexDocs and TestRebuildStats classes
+"""
+
+from api.v1.app import app
+from api.v1.views import index
+import models
+from models.state import State
+import pep8
+import unittest
+from unittest import mock
+
+
+class TestIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the index views"""
+    def test_pep8_conformance(self):
+        """Test that index.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/index.py',
+                                    'tests/test_api/test_index.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(index.__doc__) > 1)
+        for func in (index.stats, index.rebuild_stats):
+            with self.subTest(function=func.__name__):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestRebuildStats(unittest.TestCase):
+    """Test the POST /stats/rebuild admin endpoint"""
+    url = '/api/v1/views/stats/rebuild'
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def test_off_without_secret(self):
+        """Test that the endpoint is not found without HBNB_ADMIN_SECRET"""
+        with mock.patch.object(index, 'admin_secret', None):
+            response = self.client.post(self.url,
+                                        headers={'X-HBNB-Admin': ''})
+        self.assertEqual(response.status_code, 404)
+
+    def test_wrong_secret(self):
+        """Test that a wrong or missing secret is forbidden"""
+        with mock.patch.object(index, 'admin_secret', 'secret'):
+            self.assertEqual(self.client.post(self.url).status_code, 403)
+            response = self.client.post(self.url,
+                                        headers={'X-HBNB-Admin': 'wrong'})
+            self.assertEqual(response.status_code, 403)
+
+    def test_rebuild(self):
+        """Test that a rebuild fixes the counts served by /stats"""
+        State(name="Rebuilt").save()
+        states = self.client.get('/api/v1/views/stats').get_json()["states"]
+        totals = models.counters._Counters__totals
+        with mock.patch.dict(totals, {"State": states + 5}):
+            with mock.patch.object(index, 'admin_secret', 'secret'):
+                response = self.client.post(
+                    self.url, headers={'X-HBNB-Admin': 'secret'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {
+            "fixed": 1,
+            "differences": [{"counter": "State", "value": None,
+                             "kept": states + 5, "actual": states}]})
+        self.assertEqual(
+            self.client.get('/api/v1/views/stats').get_json()["states"],
+            states)
@@ -0,0 +1,142 @@
+#!/usr/bin/python3
+"""
+Contains the TestListingDocs, TestCursors and TestGroupedListing classes
+"""
+
+from api.v1.app import app
+from datetime import timedelta
+import inspect
+import json
+from models.city import City
+from models.state import State
+import pep8
+import sys
+import unittest
+listing = sys.modules['api.v1.views.listing']
+
+
+class TestListingDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the listing module"""
+    def test_pep8_conformance(self):
+        """Test that listing.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/listing.py',
+                                    'tests/test_api/test_listing.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(listing.__doc__) > 1)
+        for name, func in inspect.getmembers(listing, inspect.isfunction):
+            if func.__module__ == listing.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestCursors(unittest.TestCase):
+    """Test the sorting and paging of the listings"""
+    @classmethod
+    def setUpClass(cls):
+        """saves 7 states"""
+        cls.states = [State(name="Cursor {}".format(i)) for i in range(7)]
+        for state in cls.states:
+            state.save()
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def pages(self, url, limit):
+        """returns the ids of the pages of url, following the cursors"""
+        pages = []
+        after = ""
+        while after is not None:
+            response = self.client.get(url + "&limit={}{}".format(
+                limit, after and "&after=" + after))
+            self.assertEqual(response.status_code, 200)
+            pages.append([obj["id"] for obj in response.get_json()])
+            after = response.headers.get("X-Next-Cursor")
+        return pages
+
+    def test_default_order(self):
+        """Test that the pages of a class list it by (created_at, id)"""
+        listed = self.client.get('/api/v1/views/states').get_json()
+        expected = [state["id"] for state in sorted(
+            listed, key=lambda state: (state["created_at"], state["id"]))]
+        pages = self.pages('/api/v1/views/states?', 3)
+        self.assertTrue(all(len(page) == 3 for page in pages[:-1]))
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_sorted(self):
+        """Test that the pages follow the sort, descending with a -"""
+        pages = self.pages('/api/v1/views/states?sort=-name', 2)
+        ids = [state_id for page in pages for state_id in page
+               if state_id in {state.id for state in self.states}]
+        self.assertEqual(ids, [state.id for state in self.states[::-1]])
+
+    def test_added_between_pages(self):
+        """Test that an object added between two pages is not listed
+        twice"""
+        response = self.client.get('/api/v1/views/states?limit=2')
+        first = [state["id"] for state in response.get_json()]
+        State(name="Cursor added").save()
+        response = self.client.get('/api/v1/views/states?limit=2&after=' +
+                                   response.headers["X-Next-Cursor"])
+        second = [state["id"] for state in response.get_json()]
+        self.assertFalse(set(first) & set(second))
+
+    def test_offset(self):
+        """Test that offset skips the first objects"""
+        listed = self.client.get('/api/v1/views/states?limit=4').get_json()
+        response = self.client.get('/api/v1/views/states?limit=2&offset=2')
+        self.assertEqual(response.get_json(), listed[2:])
+
+    def test_invalid(self):
+        """Test that an invalid sort, page or cursor is refused"""
+        response = self.client.get('/api/v1/views/states?limit=1&sort=name')
+        cursor = response.headers["X-Next-Cursor"]
+        for query in ("sort=unknown", "limit=-1", "offset=x", "after=bad",
+                      "after=" + cursor, "limit=1&sort=-name&after=" +
+                      cursor):
+            with self.subTest(query=query):
+                response = self.client.get('/api/v1/views/states?' + query)
+                self.assertEqual(response.status_code, 400)
+
+    def test_ndjson(self):
+        """Test that a listing is sent as NDJSON when asked"""
+        response = self.client.get('/api/v1/views/states?format=ndjson')
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = response.get_data(as_text=True).splitlines()
+        self.assertEqual([json.loads(line) for line in lines],
+                         self.client.get('/api/v1/views/states').get_json())
+
+
+class TestGroupedListing(unittest.TestCase):
+    """Test the listings of the objects of one parent"""
+    @classmethod
+    def setUpClass(cls):
+        """saves a state with 30 cities, each created before the
+        previous one"""
+        cls.state = State(name="Grouped")
+        cls.state.save()
+        cls.cities = []
+        for i in range(30):
+            city = City(state_id=cls.state.id, name="City {}".format(i))
+            city.created_at -= timedelta(minutes=i)
+            city.save()
+            cls.cities.append(city)
+        cls.url = '/api/v1/views/states/{}/cities'.format(cls.state.id)
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def test_default_order(self):
+        """Test that the cities come by (created_at, id) without sort"""
+        expected = [city.id for city in sorted(
+            self.cities, key=lambda city: (city.created_at, city.id))]
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([city["id"] for city in response.get_json()],
+                         expected)
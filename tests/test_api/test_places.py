@@ -0,0 +1,199 @@
+#!/usr/bin/python3
+"""
+Contains the TestPlacesDocs, TestPlacesSearch and TestPlacesNearby classes
+"""
+
+from api.v1.app import app
+from api.v1.views import places
+import inspect
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+import pep8
+from tests.test_api.fixtures import populate
+import unittest
+
+
+class TestPlacesDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the places views"""
+    def test_pep8_conformance(self):
+        """Test that places.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/places.py',
+                                    'tests/test_api/test_places.py',
+                                    'tests/test_api/fixtures.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(places.__doc__) > 1)
+        for name, func in inspect.getmembers(places, inspect.isfunction):
+            if func.__module__ == places.__name__:
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestPlacesSearch(unittest.TestCase):
+    """Test the POST /places_search view"""
+    url = '/api/v1/views/places_search'
+
+    @classmethod
+    def setUpClass(cls):
+        """saves the places searched"""
+        cls.world = populate("Search")
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def search(self, **body):
+        """returns the names of the places found for body"""
+        response = self.client.post(self.url, json=body)
+        self.assertEqual(response.status_code, 200)
+        return [place["name"] for place in response.get_json()]
+
+    def test_states_and_cities(self):
+        """Test that the places of the states and cities are found"""
+        world = self.world
+        self.assertEqual(sorted(self.search(states=[world.state.id])),
+                         ["Search 0", "Search 1", "Search 2", "Search 3"])
+        self.assertEqual(sorted(self.search(cities=[world.cities[1].id])),
+                         ["Search 3"])
+
+    def test_amenities(self):
+        """Test that only the places with all the amenities are found"""
+        world = self.world
+        self.assertEqual(
+            sorted(self.search(states=[world.state.id],
+                               amenities=[world.amenities[0].id])),
+            ["Search 0", "Search 1"])
+        self.assertEqual(
+            self.search(amenities=[a.id for a in world.amenities]),
+            ["Search 0"])
+
+    def test_ranges_and_sort(self):
+        """Test that the range filters and the sort apply"""
+        self.assertEqual(self.search(states=[self.world.state.id],
+                                     price_min=100, max_rooms=3,
+                                     sort="-price_by_night"),
+                         ["Search 2", "Search 1"])
+        response = self.client.post(self.url, json={"price_min": "cheap"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(self.url, json={"sort": "unknown"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor(self):
+        """Test that the pages of a search follow their cursors"""
+        body = {"states": [self.world.state.id], "sort": "price_by_night",
+                "limit": 3}
+        response = self.client.post(self.url, json=body)
+        self.assertEqual([place["name"] for place in response.get_json()],
+                         ["Search 0", "Search 1", "Search 2"])
+        body["after"] = response.headers["X-Next-Cursor"]
+        response = self.client.post(self.url, json=body)
+        self.assertEqual([place["name"] for place in response.get_json()],
+                         ["Search 3"])
+        self.assertNotIn("X-Next-Cursor", response.headers)
+
+    def test_fields_and_expand(self):
+        """Test that fields restricts and expand embeds"""
+        response = self.client.post(self.url, json={
+            "cities": [self.world.cities[1].id],
+            "fields": ["name", "price_by_night"]})
+        self.assertEqual(response.get_json(),
+                         [{"name": "Search 3", "price_by_night": 200}])
+        response = self.client.post(self.url, json={
+            "amenities": [a.id for a in self.world.amenities],
+            "expand": "reviews,amenities"})
+        place, = response.get_json()
+        self.assertEqual([review["text"] for review in place["reviews"]],
+                         ["Search review"])
+        self.assertEqual(len(place["amenities"]), 2)
+
+    def test_cached(self):
+        """Test that a repeated search is served from the cache until a
+        place changes"""
+        body = {"cities": [self.world.cities[1].id]}
+        # the body of a miss is kept once it is read
+        self.client.post(self.url, json=body).get_data()
+        response = self.client.post(self.url, json=body)
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+        place = self.world.places[3]
+        place.description = "Changed"
+        place.save()
+        response = self.client.post(self.url, json=body)
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        self.assertEqual(response.get_json()[0]["description"], "Changed")
+
+    def test_not_json(self):
+        """Test that a body that is not a JSON dictionary is refused"""
+        response = self.client.post(self.url, data="states",
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+
+
+class TestPlacesNearby(unittest.TestCase):
+    """Test the POST /places_nearby view"""
+    url = '/api/v1/views/places_nearby'
+
+    @classmethod
+    def setUpClass(cls):
+        """saves two places in a new city"""
+        state = State(name="Nearby")
+        state.save()
+        cls.city = City(state_id=state.id, name="Nearby")
+        cls.city.save()
+        user = User(email="nearby@hbnb.io", password="pwd")
+        user.save()
+        cls.near = Place(city_id=cls.city.id, user_id=user.id, name="Near",
+                         latitude=-33.0, longitude=151.0)
+        cls.near.save()
+        cls.far = Place(city_id=cls.city.id, user_id=user.id, name="Far",
+                        latitude=-33.5, longitude=151.5)
+        cls.far.save()
+
+    def setUp(self):
+        """makes a client of the app"""
+        self.client = app.test_client()
+
+    def ids(self, body):
+        """returns the ids of the places of this test found for body"""
+        response = self.client.post(self.url, json=body)
+        self.assertEqual(response.status_code, 200)
+        return [place["id"] for place in response.get_json()
+                if place["id"] in (self.near.id, self.far.id)]
+
+    def test_radius(self):
+        """Test that the places within the radius are found, nearest
+        first"""
+        body = {"latitude": -33.01, "longitude": 151.0}
+        self.assertEqual(self.ids(dict(body, radius=5)), [self.near.id])
+        self.assertEqual(self.ids(dict(body, radius=100)),
+                         [self.near.id, self.far.id])
+
+    def test_bbox(self):
+        """Test that the places inside the box are found"""
+        self.assertEqual(self.ids({"bbox": [-33.6, 151.4, -33.4, 151.6]}),
+                         [self.far.id])
+
+    def test_invalid_area(self):
+        """Test that a non-finite or negative radius and an out of range
+        point or box are refused"""
+        point = {"latitude": -33.0, "longitude": 151.0}
+        for body in (dict(point, radius=float("inf")),
+                     dict(point, radius=float("nan")),
+                     dict(point, radius=-1),
+                     {"latitude": 91, "longitude": 0, "radius": 1},
+                     {"latitude": 0, "longitude": -181, "radius": 1},
+                     dict(point, radius=1, limit=float("inf")),
+                     {"bbox": [-33, 151, -33, float("inf")]},
+                     {"bbox": [-100, 151, -33, 152]},
+                     {"bbox": [-33, 151]},
+                     point):
+            with self.subTest(body=body):
+                response = self.client.post(self.url, json=body)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json(),
+                                 {"error": "Missing or invalid search area"})
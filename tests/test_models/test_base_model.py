@@ -7,6 +7,7 @@ import pep8 as pycodestyle
 import time
 import unittest
 from unittest import mock
+import uuid
 BaseModel = models.base_model.BaseModel
 module_doc = models.base_model.__doc__
 
@@ -138,6 +139,16 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(new_d["created_at"], bm.created_at.strftime(t_format))
         self.assertEqual(new_d["updated_at"], bm.updated_at.strftime(t_format))
 
+    def test_to_dict_fields(self):
+        """test that to_dict with fields only returns those it has"""
+        bm = BaseModel()
+        bm.name = "Holberton"
+        d = bm.to_dict(fields=["name", "created_at", "nope"])
+        self.assertEqual(d, {"name": "Holberton",
+                             "created_at": bm.to_dict()["created_at"]})
+        self.assertEqual(bm.to_dict(fields=["__class__"]),
+                         {"__class__": "BaseModel"})
+
     def test_str(self):
         """test that the str method has the correct output"""
         inst = BaseModel()
@@ -158,3 +169,88 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(old_created_at, new_created_at)
         self.assertTrue(mock_storage.new.called)
         self.assertTrue(mock_storage.save.called)
+
+
+class TestChangeTracking(unittest.TestCase):
+    """Test the field-level change tracking of BaseModel"""
+    def test_new_instance_is_clean(self):
+        """Test that a freshly built or loaded instance has no changes"""
+        self.assertEqual(BaseModel().changed_fields(), set())
+        inst = BaseModel(**BaseModel(name="x").to_dict())
+        self.assertEqual(inst.changed_fields(), set())
+
+    def test_changed_fields(self):
+        """Test that only assignments with a different value are recorded"""
+        inst = BaseModel(name="Holberton", number=89)
+        inst.name = "Holberton"
+        self.assertEqual(inst.changed_fields(), set())
+        inst.name = "School"
+        inst.city = "SF"
+        self.assertEqual(inst.changed_fields(), {"name", "city"})
+        self.assertIn(inst, models.base_model.changed_objects())
+        inst.clear_changes()
+        self.assertEqual(inst.changed_fields(), set())
+        self.assertNotIn(inst, models.base_model.changed_objects())
+
+    def test_tracking_is_hidden(self):
+        """Test that change tracking adds nothing to to_dict or __dict__"""
+        inst = BaseModel()
+        inst.name = "Holberton"
+        self.assertCountEqual(inst.__dict__.keys(),
+                              ["id", "created_at", "updated_at", "name"])
+        self.assertNotIn("_changes", inst.to_dict())
+
+    @mock.patch('models.storage')
+    def test_save_keeps_changes_for_storage(self, mock_storage):
+        """Test that save leaves clearing the changes to the storage"""
+        inst = BaseModel()
+        inst.save()
+        self.assertIn("updated_at", inst.changed_fields())
+
+
+class TestIdGenerators(unittest.TestCase):
+    """Test the id generators available to BaseModel"""
+    uuid_regex = ('^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}'
+                  '-[0-9a-f]{4}-[0-9a-f]{12}$')
+
+    def test_uuid7_format(self):
+        """Test that uuid7 returns a valid version 7 uuid string"""
+        uid = models.base_model.uuid7()
+        self.assertEqual(len(uid), 36)
+        self.assertRegex(uid, self.uuid_regex)
+        self.assertEqual(uuid.UUID(uid).version, 7)
+        self.assertIn(uid[19], "89ab")
+
+    def test_uuid7_time_ordered(self):
+        """Test that successive uuid7 ids sort in creation order"""
+        ids = [models.base_model.uuid7() for i in range(5000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_uuid7_timestamp(self):
+        """Test that the uuid7 prefix holds the creation time in ms"""
+        tic = int(time.time() * 1000)
+        uid = models.base_model.uuid7()
+        toc = int(time.time() * 1000)
+        ms = int(uid.replace("-", "")[:12], 16)
+        self.assertTrue(tic - 1 <= ms <= toc + 1)
+
+    def test_uuid7_batch(self):
+        """Test that a batch of uuid7 ids is unique and ordered"""
+        ids = models.base_model.uuid7_batch(10000)
+        self.assertEqual(len(ids), 10000)
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), 10000)
+        self.assertLess(ids[-1], models.base_model.uuid7())
+        self.assertEqual(models.base_model.uuid7_batch(0), [])
+
+    def test_new_ids_uses_id_type(self):
+        """Test that new objects get ids from the configured generator"""
+        with mock.patch.object(models.base_model, "id_type", "uuid7"):
+            inst = BaseModel()
+            self.assertEqual(uuid.UUID(inst.id).version, 7)
+            self.assertEqual(len(models.base_model.new_ids(3)), 3)
+        with mock.patch.object(models.base_model, "id_type", "uuid4"):
+            self.assertEqual(uuid.UUID(BaseModel().id).version, 4)
+        with mock.patch.object(models.base_model, "id_type", "nope"):
+            self.assertRaises(ValueError, models.base_model.new_id)
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""
+Contains the FakeStorage class shared by the tests of the indexes built
+over storage
+"""
+
+
+class FakeStorage:
+    """minimal storage publishing write events to its listeners
+
+    The objects are kept in the objs list, which tests may change
+    directly, and the fields of the last all() or get_many() in fields.
+    """
+    def __init__(self, objs=()):
+        """keeps objs and an empty listener list"""
+        self.objs = list(objs)
+        self.listeners = []
+        self.fields = None
+
+    def objects(self, cls=None):
+        """returns the kept objects of cls, a class or class name"""
+        if cls is None:
+            return list(self.objs)
+        name = cls if isinstance(cls, str) else cls.__name__
+        return [obj for obj in self.objs if type(obj).__name__ == name]
+
+    def all(self, cls=None, fields=None):
+        """returns the kept objects of cls by key"""
+        self.fields = fields
+        return {type(obj).__name__ + "." + obj.id: obj
+                for obj in self.objects(cls)}
+
+    def get_many(self, cls, ids, fields=None):
+        """returns the kept objects of cls with the given ids"""
+        self.fields = fields
+        objs = {obj.id: obj for obj in self.objects(cls)}
+        return [objs[i] for i in ids if i in objs]
+
+    def count(self, cls=None):
+        """returns the number of kept objects of cls"""
+        return len(self.objects(cls))
+
+    def links(self, cls, relationship, ids=None):
+        """yields the (object id, related id) pairs of relationship"""
+        for obj in self.objects(cls):
+            if ids is None or obj.id in ids:
+                for related in getattr(obj, relationship):
+                    yield obj.id, related.id
+
+    def subscribe(self, listener):
+        """registers a write listener"""
+        self.listeners.append(listener)
+
+    def notify(self, event, obj):
+        """applies a write and publishes its event"""
+        if event == "delete":
+            if obj in self.objs:
+                self.objs.remove(obj)
+        elif obj not in self.objs:
+            self.objs.append(obj)
+        for listener in self.listeners:
+            listener(event, obj)
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+"""
+Contains the TestBitmapIndexDocs and TestBitmapIndex classes
+"""
+
+import inspect
+from models.engine import bitmap_index
+import pep8
+import random
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+BitmapIndex = bitmap_index.BitmapIndex
+
+
+class Amenity:
+    """stand-in amenity"""
+    def __init__(self, id):
+        """keeps the id"""
+        self.id = id
+
+
+class Place:
+    """stand-in place holding its linked amenities"""
+    def __init__(self, id, amenities=()):
+        """keeps the id and the linked amenities"""
+        self.id = id
+        self.amenities = list(amenities)
+
+
+class TestBitmapIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of BitmapIndex class"""
+    def test_pep8_conformance(self):
+        """Test that bitmap_index.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/bitmap_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_bitmap_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(bitmap_index.__doc__) > 1)
+        self.assertTrue(len(BitmapIndex.__doc__) > 1)
+        for name, func in inspect.getmembers(BitmapIndex,
+                                             inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestBitmapIndex(unittest.TestCase):
+    """Test the BitmapIndex class"""
+    def setUp(self):
+        """builds an index over random place-amenity links"""
+        rnd = random.Random(7)
+        self.amenities = [Amenity("a{}".format(i)) for i in range(10)]
+        self.places = []
+        for i in range(3000):
+            linked = [a for a in self.amenities if rnd.random() < 0.6]
+            self.places.append(Place("p{}".format(i), linked))
+        self.storage = FakeStorage(self.places)
+        self.index = BitmapIndex(self.storage, "Place", "amenities",
+                                 "Amenity")
+
+    def expected(self, amenity_ids):
+        """returns the ids of the places linked to all amenity_ids"""
+        return sorted(p.id for p in self.places
+                      if set(amenity_ids) <= {a.id for a in p.amenities})
+
+    def test_bit_positions(self):
+        """Test decoding of set bits"""
+        self.assertEqual(bitmap_index.bit_positions(0), [])
+        bits = [0, 3, 63, 64, 200, 1000]
+        self.assertEqual(bitmap_index.bit_positions(sum(1 << b
+                                                        for b in bits)),
+                         bits)
+
+    def test_linked_to_all(self):
+        """Test that the intersection matches a full scan"""
+        self.assertEqual(len(self.index), 3000)
+        for ids in [["a0"], ["a1", "a2"], ["a0", "a3", "a5", "a9"],
+                    [a.id for a in self.amenities]]:
+            with self.subTest(ids=ids):
+                self.assertEqual(sorted(self.index.linked_to_all(ids)),
+                                 self.expected(ids))
+        self.assertEqual(self.index.linked_to_all(["a0", "unknown"]), [])
+        self.assertEqual(len(self.index.linked_to_all([])), 3000)
+
+    def test_count_and_filter(self):
+        """Test count and filter against a full scan"""
+        ids = ["a1", "a4"]
+        self.assertEqual(self.index.count(ids), len(self.expected(ids)))
+        self.assertEqual(self.index.count([]), 3000)
+        self.assertEqual(bitmap_index.popcount(0b1011), 3)
+        candidates = [p.id for p in self.places[:100]] + ["unknown"]
+        self.assertEqual(self.index.filter(candidates, ids),
+                         [i for i in candidates if i in self.expected(ids)])
+
+    def test_write_events(self):
+        """Test that the index follows the storage write events"""
+        place = self.places[0]
+        place.amenities = [self.amenities[0]]
+        self.storage.notify("save", place)
+        self.assertEqual(self.index.links_of(place.id), {"a0"})
+        self.assertIn(place.id, self.index.linked_to_all(["a0"]))
+        self.assertNotIn(place.id, self.index.linked_to_all(["a1"]))
+        new = Place("new", self.amenities[:2])
+        self.storage.notify("save", new)
+        self.storage.notify("delete", place)
+        self.assertNotIn(place.id, self.index.linked_to_all(["a0"]))
+        self.assertIn("new", self.index.linked_to_all(["a0", "a1"]))
+        self.assertEqual(len(self.index), 3000)
+        self.storage.notify("delete", self.amenities[1])
+        self.assertEqual(self.index.linked_to_all(["a1"]), [])
+        self.assertEqual(self.index.links_of("new"), {"a0"})
@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+"""
+Contains the TestCacheDocs, TestLRUStore and TestCache classes
+"""
+
+import inspect
+from models.engine import cache
+import pep8
+import threading
+import time
+import unittest
+Cache = cache.Cache
+LRUStore = cache.LRUStore
+
+
+class FakeVersions:
+    """versions bumped by hand"""
+    def __init__(self):
+        """starts every version at 0"""
+        self.counters = {}
+
+    def version(self, *scope):
+        """returns the version of scope"""
+        return self.counters.get(scope, 0)
+
+    def bump(self, *scope):
+        """bumps the version of scope"""
+        self.counters[scope] = self.counters.get(scope, 0) + 1
+
+
+class TestCacheDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the cache classes"""
+    def test_pep8_conformance(self):
+        """Test that cache.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/cache.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_cache.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(cache.__doc__) > 1)
+        for cls in (Cache, LRUStore):
+            self.assertTrue(len(cls.__doc__) > 1)
+            for name, func in inspect.getmembers(cls, inspect.isfunction):
+                with self.subTest(function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestLRUStore(unittest.TestCase):
+    """Test the LRUStore class"""
+    def test_eviction(self):
+        """Test that the least recently used value is evicted first"""
+        store = LRUStore(2)
+        store.set("a", 1, 60)
+        store.set("b", 2, 60)
+        self.assertEqual(store.get("a"), 1)
+        store.set("c", 3, 60)
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.get("a"), 1)
+        self.assertEqual(store.get("c"), 3)
+
+    def test_expiry(self):
+        """Test that a value is not found after its ttl"""
+        store = LRUStore()
+        store.set("a", 1, 0)
+        self.assertIsNone(store.get("a"))
+        self.assertEqual(len(store), 0)
+
+
+class TestCache(unittest.TestCase):
+    """Test the Cache class"""
+    def setUp(self):
+        """builds a cache over hand bumped versions"""
+        self.versions = FakeVersions()
+        self.cache = Cache(self.versions)
+        self.calls = 0
+
+    def compute(self, cacheable=True):
+        """counts the calls and returns their number"""
+        self.calls += 1
+        return self.calls, cacheable
+
+    def test_invalidation(self):
+        """Test that a bump of one of its scopes drops a value"""
+        scopes = [("Review", "place_id", "p1"), ("Place",)]
+        self.assertEqual(self.cache.get("k", scopes, self.compute), 1)
+        self.assertEqual(self.cache.get("k", scopes, self.compute), 1)
+        self.versions.bump("Review", "place_id", "p2")
+        self.assertEqual(self.cache.get("k", scopes, self.compute), 1)
+        self.versions.bump("Review", "place_id", "p1")
+        self.assertEqual(self.cache.get("k", scopes, self.compute), 2)
+        self.versions.bump("Place")
+        self.assertEqual(self.cache.get("k", scopes, self.compute), 3)
+
+    def test_not_cacheable(self):
+        """Test that values not cacheable or with a ttl of 0 are not
+        kept"""
+        self.cache.get("k", [], lambda: self.compute(False))
+        self.assertEqual(self.cache.get("k", [], self.compute), 2)
+        self.cache.ttl = 0
+        self.assertEqual(self.cache.get("k", [], self.compute), 3)
+
+    def test_put(self):
+        """Test that a value put under a key taken before a write is not
+        found after it"""
+        key = self.cache.key("k", [("Place",)])
+        self.cache.put(key, "streamed")
+        self.assertEqual(self.cache.get("k", [("Place",)], self.compute),
+                         "streamed")
+        key = self.cache.key("k", [("Place",)])
+        self.versions.bump("Place")
+        self.cache.put(key, "stale")
+        self.assertEqual(self.cache.get("k", [("Place",)], self.compute), 1)
+
+    def test_single_flight(self):
+        """Test that concurrent misses of a key compute it once"""
+        def slow():
+            """computes slowly"""
+            time.sleep(0.1)
+            return self.compute()
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(self.cache.get("k", [], slow)))
+            for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [1] * 5)
+        self.assertEqual(self.calls, 1)
+
+    def test_later(self):
+        """Test that the callers missing a value kept later wait for put()
+        rather than computing it again"""
+        key = self.cache.key("k", [])
+        self.assertEqual(self.cache.lookup(
+            key, lambda: ("stream", cache.later)), "stream")
+        results = []
+        thread = threading.Thread(target=lambda: results.append(
+            self.cache.lookup(key, lambda: self.compute(True))))
+        thread.start()
+        time.sleep(0.05)
+        self.assertEqual(results, [])
+        self.cache.put(key, "body")
+        thread.join()
+        self.assertEqual(results, ["body"])
+        self.assertEqual(self.calls, 0)
+
+    def test_later_timeout(self):
+        """Test that the callers stop waiting for a value never put after
+        the timeout"""
+        self.cache.timeout = 0.05
+        key = self.cache.key("k", [])
+        self.cache.lookup(key, lambda: ("stream", cache.later))
+        self.assertEqual(self.cache.lookup(key, self.compute), 1)
+        self.cache.put(key)
+        self.assertEqual(self.cache.lookup(key, self.compute), 2)
+        self.assertEqual(self.cache.get("k", [], self.compute), 2)
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+"""
+Contains the TestColumnStoreDocs and TestColumnStore classes
+"""
+
+import inspect
+from models.engine import column_store
+from models.place import Place
+import pep8
+import random
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+ColumnStore = column_store.ColumnStore
+
+
+class TestColumnStoreDocs(unittest.TestCase):
+    """Tests to check the documentation and style of ColumnStore class"""
+    def test_pep8_conformance(self):
+        """Test that column_store.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/column_store.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_column_store.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(column_store.__doc__) > 1)
+        self.assertTrue(len(ColumnStore.__doc__) > 1)
+        for name, func in inspect.getmembers(ColumnStore,
+                                             inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+@unittest.skipIf(not ColumnStore.enabled, "NumPy is not installed")
+class TestColumnStore(unittest.TestCase):
+    """Test the ColumnStore class"""
+    def setUp(self):
+        """builds a store over random places in 5 cities"""
+        rnd = random.Random(11)
+        self.places = [Place(city_id="c{}".format(rnd.randrange(5)),
+                             price_by_night=rnd.randrange(20, 300),
+                             max_guest=rnd.randrange(1, 9),
+                             latitude=None if i % 7 else rnd.random())
+                       for i in range(300)]
+        self.storage = FakeStorage(self.places)
+        self.store = ColumnStore(self.storage, "Place",
+                                 ("price_by_night", "max_guest",
+                                  "latitude"), ("city_id",))
+
+    def check(self, groups):
+        """compares per city stats with the ones of a full scan"""
+        for group in groups:
+            places = [p for p in self.storage.objs
+                      if p.city_id == group["city_id"]]
+            self.assertEqual(group["count"], len(places))
+            prices = [p.price_by_night for p in places]
+            self.assertEqual(group["price_by_night"]["sum"], sum(prices))
+            self.assertEqual(group["price_by_night"]["min"], min(prices))
+            self.assertEqual(group["price_by_night"]["max"], max(prices))
+            self.assertAlmostEqual(group["price_by_night"]["mean"],
+                                   sum(prices) / len(prices))
+            latitudes = [p.latitude for p in places
+                         if p.latitude is not None]
+            self.assertAlmostEqual(group["latitude"]["sum"], sum(latitudes))
+        self.assertEqual(sum(group["count"] for group in groups),
+                         len(self.storage.objs))
+
+    def test_stats(self):
+        """Test overall and per city aggregates against a full scan"""
+        self.assertEqual(len(self.store), 300)
+        overall, = self.store.stats(columns=["max_guest"])
+        self.assertEqual(overall["count"], 300)
+        self.assertEqual(overall["max_guest"]["sum"],
+                         sum(p.max_guest for p in self.places))
+        self.assertNotIn("price_by_night", overall)
+        self.check(self.store.stats("city_id"))
+
+    def test_histogram(self):
+        """Test the histogram against a full scan"""
+        counts, edges = self.store.histogram("price_by_night", 4, 0, 400)
+        self.assertEqual(edges, [0, 100, 200, 300, 400])
+        self.assertEqual(counts, [sum(1 for p in self.places
+                                      if low <= p.price_by_night < low + 100)
+                                  for low in (0, 100, 200, 300)])
+        counts, edges = self.store.histogram("latitude")
+        self.assertEqual(sum(counts), sum(1 for p in self.places
+                                          if p.latitude is not None))
+
+    def test_write_events(self):
+        """Test that the columns follow the storage write events"""
+        len(self.store)
+        for place in self.places[:100]:
+            self.storage.notify("delete", place)
+        self.places[150].price_by_night = 1000
+        self.storage.notify("save", self.places[150])
+        for i in range(2000):
+            self.storage.notify("save", Place(city_id="c9", latitude=None,
+                                              price_by_night=i))
+        self.assertEqual(len(self.store), 2200)
+        self.check(self.store.stats("city_id"))
+        self.storage.objs = []
+        self.storage.notify("reload", None)
+        self.assertEqual(self.store.stats(), [])
@@ -0,0 +1,126 @@
+#!/usr/bin/python3
+"""
+Contains the TestCountersDocs and TestCounters classes
+"""
+
+import inspect
+import json
+from models.engine import counters
+import os
+import pep8
+import tempfile
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+Counters = counters.Counters
+
+
+class City:
+    """stand-in city"""
+    def __init__(self, id, state_id):
+        """keeps the attributes"""
+        self.id = id
+        self.state_id = state_id
+
+
+class Place:
+    """stand-in place"""
+    def __init__(self, id, city_id):
+        """keeps the attributes"""
+        self.id = id
+        self.city_id = city_id
+
+
+class TestCountersDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Counters class"""
+    def test_pep8_conformance(self):
+        """Test that counters.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/counters.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_counters.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(counters.__doc__) > 1)
+        self.assertTrue(len(Counters.__doc__) > 1)
+        for name, func in inspect.getmembers(Counters, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestCounters(unittest.TestCase):
+    """Test the Counters class"""
+    def setUp(self):
+        """builds counters over 4 cities of 2 states and 40 places"""
+        self.cities = [City("c{}".format(i), "s{}".format(i % 2))
+                       for i in range(4)]
+        self.places = [Place("p{}".format(i), "c{}".format(i % 4))
+                       for i in range(40)]
+        self.storage = FakeStorage(self.cities + self.places)
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        os.remove(self.path)
+        self.counters = self.make()
+
+    def tearDown(self):
+        """removes the snapshot"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def make(self):
+        """returns new counters over the storage"""
+        return Counters(self.storage, ("City", "Place"),
+                        {"City": ("state_id",), "Place": ("city_id",)},
+                        self.path)
+
+    def test_counts(self):
+        """Test the totals and the groups"""
+        self.assertEqual(self.counters.total("Place"), 40)
+        self.assertEqual(self.counters.total("City"), 4)
+        self.assertEqual(self.counters.total("Review"), 0)
+        self.assertEqual(self.counters.count("Place", "city_id", "c1"), 10)
+        self.assertEqual(self.counters.count("Place", "city_id", "c9"), 0)
+        self.assertEqual(self.counters.counts("City", "state_id"),
+                         {"s0": 2, "s1": 2})
+
+    def test_write_events(self):
+        """Test that the counts follow the storage write events"""
+        self.counters.total("Place")
+        place = self.places[0]
+        place.city_id = "c3"
+        self.storage.notify("save", place)
+        self.storage.notify("save", place)
+        self.storage.notify("save", Place("new", "c3"))
+        self.storage.notify("delete", self.places[1])
+        self.storage.notify("delete", self.cities[0])
+        self.assertEqual(self.counters.total("Place"), 40)
+        self.assertEqual(self.counters.counts("Place", "city_id"),
+                         {"c0": 9, "c1": 9, "c2": 10, "c3": 12})
+        self.assertEqual(self.counters.counts("City", "state_id"),
+                         {"s0": 1, "s1": 2})
+        self.assertEqual(self.counters.verify(), [])
+
+    def test_snapshot(self):
+        """Test that the snapshot is reused only when it can be trusted"""
+        self.counters.total("Place")
+        self.counters.persist()
+        with open(self.path) as f:
+            snapshot = json.load(f)
+        snapshot["counts"]["Place.city_id"]["c0"] = 99
+        with open(self.path, "w") as f:
+            json.dump(snapshot, f)
+        loaded = self.make()
+        self.assertEqual(loaded.count("Place", "city_id", "c0"), 99)
+        self.assertEqual(loaded.verify(),
+                         [("Place.city_id", "c0", 99, 10)])
+        self.assertEqual(self.make().count("Place", "city_id", "c0"), 10)
+        unbuilt = self.make()
+        self.storage.notify("save", Place("new", "c0"))
+        self.assertTrue(os.path.exists(self.path))
+        unbuilt.persist()
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(unbuilt.count("Place", "city_id", "c0"), 11)
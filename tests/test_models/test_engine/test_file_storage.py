@@ -19,8 +19,11 @@ from models import storage
 import json
 import os
 import pep8
+import threading
 import unittest
+from unittest import mock
 FileStorage = file_storage.FileStorage
+file_path = FileStorage._FileStorage__file_path
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
 
@@ -115,7 +118,7 @@ class TestFileStorage(unittest.TestCase):
         for key, value in new_dict.items():
             new_dict[key] = value.to_dict()
         string = json.dumps(new_dict)
-        with open("file.json", "r") as f:
+        with open(file_path, "r") as f:
             js = f.read()
         self.assertEqual(json.loads(string), json.loads(js))
 
@@ -149,3 +152,143 @@ class TestFileStorage(unittest.TestCase):
 
         # Confirm the results
         self.assertEqual(user, stored_user)
+
+    def test_save_skips_unchanged(self):
+        """Test that save does not rewrite the file when nothing changed"""
+        state = State(name="California")
+        storage.new(state)
+        storage.save()
+        self.assertEqual(state.changed_fields(), set())
+        with mock.patch("models.engine.file_storage.open") as m_open:
+            storage.save()
+            state.name = "California"
+            storage.save()
+            self.assertFalse(m_open.called)
+        state.name = "Nevada"
+        storage.save()
+        with open(file_path, "r") as f:
+            js = json.load(f)
+        self.assertEqual(js["State." + state.id]["name"], "Nevada")
+        self.assertEqual(state.changed_fields(), set())
+
+    def test_save_reencodes_only_changed(self):
+        """Test that save serializes only new or changed objects"""
+        first = State(name="Oregon")
+        second = State(name="Texas")
+        storage.new(first)
+        storage.new(second)
+        storage.save()
+        second.name = "Utah"
+        with mock.patch.object(State, "to_dict",
+                               autospec=True,
+                               side_effect=State.to_dict) as m_to_dict:
+            storage.save()
+        self.assertEqual([c[0][0] for c in m_to_dict.call_args_list],
+                         [second])
+
+    def test_save_deleted(self):
+        """Test that deleted objects are removed from the file"""
+        state = State(name="Ohio")
+        storage.new(state)
+        storage.save()
+        storage.delete(state)
+        storage.save()
+        with open(file_path, "r") as f:
+            js = json.load(f)
+        self.assertNotIn("State." + state.id, js)
+
+    def test_reload_skips_unchanged_file(self):
+        """Test that reload keeps objects when the file did not change"""
+        state = State(name="Iowa")
+        storage.new(state)
+        storage.save()
+        storage.reload()
+        self.assertIs(storage.all()["State." + state.id], state)
+        state.name = "Idaho"
+        storage.reload()
+        reloaded = storage.all()["State." + state.id]
+        self.assertIsNot(reloaded, state)
+        self.assertEqual(reloaded.name, "Iowa")
+
+    def test_page(self):
+        """Test that page walks the objects in (created_at, id) order"""
+        amenities = [Amenity(name="amenity{}".format(i)) for i in range(5)]
+        for amenity in amenities:
+            storage.new(amenity)
+        storage.save()
+        storage.page(Amenity)
+        late = Amenity(name="late")
+        storage.new(late)
+        storage.delete(amenities[2])
+        found = []
+        after = None
+        while True:
+            page = storage.page("Amenity", after, 2)
+            if not page:
+                break
+            self.assertLessEqual(len(page), 2)
+            found.extend(page)
+            after = (page[-1].created_at, page[-1].id)
+        self.assertEqual(found, sorted(storage.all(Amenity).values(),
+                                       key=lambda a: (a.created_at, a.id)))
+        self.assertNotIn(amenities[2], found)
+        self.assertIn(late, found)
+
+    def test_new_many_delete_many(self):
+        """Test that new_many and delete_many keep the objects and their
+        page() order like new and delete"""
+        storage.page(City)
+        cities = [City(name="city{}".format(i)) for i in range(5)]
+        storage.new_many(cities)
+        for city in cities:
+            self.assertIs(storage.get(City, city.id), city)
+        storage.delete_many(cities[1:3])
+        self.assertIsNone(storage.get(City, cities[1].id))
+        found = storage.page(City)
+        self.assertEqual([city for city in found if city in cities],
+                         [cities[0], cities[3], cities[4]])
+        self.assertEqual(found, sorted(found,
+                                       key=lambda c: (c.created_at, c.id)))
+
+    def test_links(self):
+        """Test that links only yields the pairs of the given ids"""
+        amenity = Amenity(name="wifi")
+        places = [Place(name="place{}".format(i)) for i in range(3)]
+        storage.new_many([amenity] + places)
+        for place in places[:2]:
+            place.amenity_ids = [amenity.id]
+        ids = [places[1].id, places[2].id, "nope"]
+        self.assertEqual(list(storage.links(Place, "amenities", ids)),
+                         [(places[1].id, amenity.id)])
+        self.assertIn((places[0].id, amenity.id),
+                      list(storage.links(Place, "amenities")))
+
+    def test_batch(self):
+        """Test that the saves of a batch write the file once, at its end,
+        and still notify their writes"""
+        storage.new(State(name="before"))
+        storage.save()
+        events = []
+        storage.subscribe(lambda event, obj: events.append((event, obj)))
+        states = [State(name="state{}".format(i)) for i in range(3)]
+        with storage.batch():
+            for state in states:
+                state.save()
+            with open(file_path, "r") as f:
+                self.assertNotIn("State." + states[0].id, json.load(f))
+            self.assertEqual([obj for event, obj in events], states)
+        with open(file_path, "r") as f:
+            js = json.load(f)
+        for state in states:
+            self.assertEqual(js["State." + state.id]["name"], state.name)
+        storage._FileStorage__listeners.pop()
+
+    def test_batch_other_thread(self):
+        """Test that a batch only defers the file writes of its thread"""
+        state = State(name="other")
+        with storage.batch():
+            thread = threading.Thread(target=state.save)
+            thread.start()
+            thread.join()
+            with open(file_path, "r") as f:
+                self.assertIn("State." + state.id, json.load(f))
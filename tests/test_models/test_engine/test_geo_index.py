@@ -0,0 +1,118 @@
+#!/usr/bin/python3
+"""
+Contains the TestGeoIndexDocs and TestGeoIndex classes
+"""
+
+import inspect
+from models.engine import geo_index
+from models.place import Place
+import pep8
+import random
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+GeoIndex = geo_index.GeoIndex
+haversine = geo_index.haversine
+
+
+class TestGeoIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of GeoIndex class"""
+    def test_pep8_conformance(self):
+        """Test that geo_index.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/geo_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_geo_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(geo_index.__doc__) > 1)
+        self.assertTrue(len(GeoIndex.__doc__) > 1)
+        for name, func in inspect.getmembers(GeoIndex, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestGeoIndex(unittest.TestCase):
+    """Test the GeoIndex class"""
+    def setUp(self):
+        """builds an index over random places"""
+        rnd = random.Random(42)
+        self.places = []
+        for i in range(2000):
+            self.places.append(Place(latitude=rnd.uniform(30, 50),
+                                     longitude=rnd.uniform(-125, -70)))
+        self.storage = FakeStorage(self.places)
+        self.index = GeoIndex(self.storage, "Place")
+
+    def brute_nearby(self, lat, lon, radius):
+        """returns the expected nearby results by full scan"""
+        found = []
+        for place in self.storage.objs:
+            dist = haversine(lat, lon, place.latitude, place.longitude)
+            if dist <= radius:
+                found.append((dist, place.id))
+        return sorted(found)
+
+    def test_haversine(self):
+        """Test the great-circle distance"""
+        self.assertAlmostEqual(haversine(0, 0, 0, 1), 111.195, places=2)
+        self.assertEqual(haversine(10, 20, 10, 20), 0)
+        self.assertAlmostEqual(haversine(0, 179.5, 0, -179.5),
+                               haversine(0, 0, 0, 1))
+
+    def test_nearby_matches_full_scan(self):
+        """Test that radius searches match a full scan, nearest first"""
+        for lat, lon, radius in [(40, -100, 50), (37.7, -122.4, 300),
+                                 (45, -75, 1000), (40, -100, 0)]:
+            with self.subTest(lat=lat, lon=lon, radius=radius):
+                expected = self.brute_nearby(lat, lon, radius)
+                self.assertEqual(self.index.nearby(lat, lon, radius),
+                                 expected)
+                self.assertEqual(self.index.nearby(lat, lon, radius, 5),
+                                 expected[:5])
+
+    def test_within(self):
+        """Test bounding box searches"""
+        found = self.index.within(35, -110, 40, -100)
+        expected = []
+        for p in self.places:
+            if 35 <= p.latitude <= 40 and -110 <= p.longitude <= -100:
+                expected.append(p.id)
+        self.assertCountEqual([i for d, i in found], expected)
+        self.assertEqual(found, sorted(found))
+        self.assertEqual(len(self.index.within(35, -110, 40, -100,
+                                               limit=3)), 3)
+
+    def test_within_antimeridian(self):
+        """Test a bounding box crossing the antimeridian"""
+        east = Place(latitude=0.0, longitude=179.9)
+        west = Place(latitude=0.0, longitude=-179.9)
+        self.storage.objs = [east, west]
+        self.storage.notify("reload", None)
+        found = self.index.within(-1, 179, 1, -179)
+        self.assertCountEqual([i for d, i in found], [east.id, west.id])
+
+    def test_write_events(self):
+        """Test that the index follows the storage write events"""
+        self.assertEqual(len(self.index), 2000)
+        place = Place(latitude=10.0, longitude=10.0)
+        self.storage.notify("save", place)
+        self.assertEqual(self.index.nearby(10, 10, 1), [(0.0, place.id)])
+        place.latitude = 11.0
+        self.storage.notify("save", place)
+        self.assertEqual(self.index.nearby(10, 10, 1), [])
+        self.assertEqual(self.index.nearby(11, 10, 1), [(0.0, place.id)])
+        self.storage.notify("delete", place)
+        self.assertEqual(self.index.nearby(11, 10, 1), [])
+        self.assertEqual(len(self.index), 2000)
+
+    def test_missing_coordinates(self):
+        """Test that places without coordinates are not indexed"""
+        place = Place(latitude=None, longitude=None)
+        self.storage.objs = [place]
+        self.storage.notify("reload", None)
+        self.assertEqual(len(self.index), 0)
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+Contains the TestHashIndexDocs and TestHashIndex classes
+"""
+
+import inspect
+from models.engine import hash_index
+from models.place import Place
+import pep8
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+HashIndex = hash_index.HashIndex
+
+
+class TestHashIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of HashIndex class"""
+    def test_pep8_conformance(self):
+        """Test that hash_index.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/hash_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_hash_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(hash_index.__doc__) > 1)
+        self.assertTrue(len(HashIndex.__doc__) > 1)
+        for name, func in inspect.getmembers(HashIndex, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestHashIndex(unittest.TestCase):
+    """Test the HashIndex class"""
+    def setUp(self):
+        """builds an index over places spread in 10 cities"""
+        self.places = [Place(city_id="c{}".format(i % 10))
+                       for i in range(100)]
+        self.storage = FakeStorage(self.places)
+        self.index = HashIndex(self.storage, "Place", "city_id")
+
+    def test_lookups(self):
+        """Test ids, count and filter against the kept places"""
+        self.assertEqual(len(self.index), 100)
+        expected = {p.id for p in self.places if p.city_id in ("c1", "c2")}
+        self.assertEqual(self.index.ids(["c1", "c2", "nope"]), expected)
+        self.assertEqual(self.index.count(["c1", "c2", "c2"]), 20)
+        ids = [p.id for p in self.places[:15]] + ["nope"]
+        self.assertEqual(self.index.filter(ids, ["c3"]),
+                         [self.places[3].id, self.places[13].id])
+        self.assertEqual(self.index.value_of(self.places[4].id), "c4")
+
+    def test_write_events(self):
+        """Test that the index follows the storage write events"""
+        place = self.places[0]
+        place.city_id = "c9"
+        self.storage.notify("save", place)
+        self.assertEqual(self.index.count(["c0"]), 9)
+        self.assertIn(place.id, self.index.ids(["c9"]))
+        self.storage.notify("delete", place)
+        self.assertNotIn(place.id, self.index.ids(["c9"]))
+        new = Place(city_id="c42")
+        self.storage.notify("save", new)
+        self.assertEqual(self.index.ids(["c42"]), {new.id})
+        self.assertEqual(len(self.index), 100)
+        self.storage.objs = []
+        self.storage.notify("reload", None)
+        self.assertEqual(len(self.index), 0)
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Contains the TestLimiterDocs and TestLimiter classes
+"""
+
+import inspect
+from models.engine import limiter
+import pep8
+import threading
+import time
+import unittest
+Limiter = limiter.Limiter
+
+
+class TestLimiterDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Limiter"""
+    def test_pep8_conformance(self):
+        """Test that limiter.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/limiter.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_limiter.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(limiter.__doc__) > 1)
+        self.assertTrue(len(Limiter.__doc__) > 1)
+        for name, func in inspect.getmembers(Limiter, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestLimiter(unittest.TestCase):
+    """Test the Limiter class"""
+    def test_no_queue(self):
+        """Test that the callers beyond the slots are rejected at once"""
+        limit = Limiter(2)
+        self.assertTrue(limit.acquire())
+        self.assertTrue(limit.acquire())
+        self.assertEqual(limit.active, 2)
+        tic = time.monotonic()
+        self.assertFalse(limit.acquire())
+        self.assertLess(time.monotonic() - tic, 0.1)
+        limit.release()
+        self.assertTrue(limit.acquire())
+
+    def test_queue(self):
+        """Test that queued callers get the released slots and that the
+        callers beyond the queue are rejected"""
+        limit = Limiter(1, queue=2, timeout=5)
+        self.assertTrue(limit.acquire())
+        results = []
+
+        def wait():
+            """waits for the slot and gives it back"""
+            results.append(limit.acquire())
+            limit.release()
+        threads = [threading.Thread(target=wait) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        while limit.waiting < 2:
+            time.sleep(0.001)
+        self.assertFalse(limit.acquire())
+        limit.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [True, True])
+        self.assertEqual((limit.active, limit.waiting), (0, 0))
+
+    def test_timeout(self):
+        """Test that a queued caller gives up after the timeout"""
+        limit = Limiter(1, queue=1, timeout=0.05)
+        self.assertTrue(limit.acquire())
+        tic = time.monotonic()
+        self.assertFalse(limit.acquire())
+        self.assertGreaterEqual(time.monotonic() - tic, 0.05)
+        self.assertEqual((limit.active, limit.waiting), (1, 0))
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+"""
+Contains the TestMetricsDocs and TestMetrics classes
+"""
+
+from flask import Flask
+import inspect
+from models.engine import metrics
+import pep8
+import unittest
+Metrics = metrics.Metrics
+
+
+class FakeStorage:
+    """storage with two operations, one failing"""
+    def get(self, cls, id):
+        """returns id"""
+        return id
+
+    def save(self):
+        """fails"""
+        raise IOError("full")
+
+    def get_many(self, cls, ids):
+        """returns the ids, one get() each"""
+        return [self.get(cls, id) for id in ids]
+
+
+class TestMetricsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the metrics"""
+    def test_pep8_conformance(self):
+        """Test that metrics.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/metrics.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_metrics.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(metrics.__doc__) > 1)
+        self.assertTrue(len(Metrics.__doc__) > 1)
+        for func in (metrics.instrument, metrics.init_app, metrics.escape,
+                     metrics.number):
+            self.assertTrue(len(func.__doc__) > 1)
+        for name, func in inspect.getmembers(Metrics, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestMetrics(unittest.TestCase):
+    """Test the Metrics class and the functions filling it"""
+    def setUp(self):
+        """makes an empty registry"""
+        self.metrics = Metrics()
+
+    def test_counter_and_gauge(self):
+        """Test that counters and gauges render one line per series"""
+        self.metrics.counter("jobs_total", "Jobs.")
+        self.metrics.gauge("busy", "Busy workers.")
+        self.metrics.inc("jobs_total", kind="a")
+        self.metrics.inc("jobs_total", 2, kind='say "hi"\n')
+        self.metrics.inc("busy", 3)
+        self.metrics.inc("busy", -1)
+        self.assertEqual(self.metrics.value("jobs_total", kind="a"), 1)
+        self.assertEqual(self.metrics.value("jobs_total", kind="b"), 0)
+        self.assertEqual(self.metrics.render(), "\n".join([
+            "# HELP hbnb_busy Busy workers.",
+            "# TYPE hbnb_busy gauge",
+            "hbnb_busy 2",
+            "# HELP hbnb_jobs_total Jobs.",
+            "# TYPE hbnb_jobs_total counter",
+            'hbnb_jobs_total{kind="a"} 1',
+            'hbnb_jobs_total{kind="say \\"hi\\"\\n"} 2']) + "\n")
+
+    def test_histogram(self):
+        """Test that histograms render cumulative buckets, sum and count"""
+        self.metrics.histogram("latency", "Latency.", (0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            self.metrics.observe("latency", value, route="/")
+        self.assertEqual(self.metrics.value("latency", route="/"), 4)
+        self.assertEqual(self.metrics.render().splitlines()[2:], [
+            'hbnb_latency_bucket{route="/",le="0.1"} 2',
+            'hbnb_latency_bucket{route="/",le="1"} 3',
+            'hbnb_latency_bucket{route="/",le="+Inf"} 4',
+            'hbnb_latency_sum{route="/"} 3.65',
+            'hbnb_latency_count{route="/"} 4'])
+
+    def test_instrument(self):
+        """Test that the storage operations are counted, failed ones too"""
+        storage = FakeStorage()
+        metrics.instrument(storage, self.metrics)
+        self.assertEqual(storage.get("State", "x"), "x")
+        self.assertRaises(IOError, storage.save)
+        for operation in ("get", "save"):
+            self.assertEqual(self.metrics.value("storage_operations_total",
+                                                operation=operation), 1)
+            self.assertEqual(self.metrics.value(
+                "storage_operation_duration_seconds", operation=operation),
+                1)
+        self.assertEqual(self.metrics.value("storage_operations_total",
+                                            operation="all"), 0)
+
+    def test_nested_operations(self):
+        """Test that the operations run by another one are not counted"""
+        storage = FakeStorage()
+        metrics.instrument(storage, self.metrics)
+        self.assertEqual(storage.get_many("State", ["a", "b"]), ["a", "b"])
+        self.assertEqual(self.metrics.value("storage_operations_total",
+                                            operation="get_many"), 1)
+        self.assertEqual(self.metrics.value("storage_operations_total",
+                                            operation="get"), 0)
+        storage.get("State", "c")
+        self.assertEqual(self.metrics.value("storage_operations_total",
+                                            operation="get"), 1)
+
+    def test_init_app(self):
+        """Test that requests are counted by route and status"""
+        app = Flask(__name__)
+        app.add_url_rule("/items/<id>", "item", lambda id: id)
+        metrics.init_app(app, self.metrics)
+        client = app.test_client()
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/nope")
+        total = "http_requests_total"
+        self.assertEqual(self.metrics.value(
+            total, method="GET", endpoint="/items/<id>", status=200), 2)
+        self.assertEqual(self.metrics.value(
+            total, method="GET", endpoint="unmatched", status=404), 1)
+        self.assertEqual(self.metrics.value("http_requests_in_flight"), 0)
+        response = client.get("/metrics")
+        self.assertEqual(response.mimetype, "text/plain")
+        self.assertIn('hbnb_http_request_duration_seconds_count{'
+                      'endpoint="/items/<id>",method="GET"} 2',
+                      response.get_data(as_text=True))
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+"""
+Contains the TestPrefixIndexDocs and TestPrefixIndex classes
+"""
+
+import inspect
+from models.engine import prefix_index
+import pep8
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+PrefixIndex = prefix_index.PrefixIndex
+
+
+class State:
+    """stand-in state"""
+    def __init__(self, id, name):
+        """keeps the id and name"""
+        self.id = id
+        self.name = name
+
+
+class City(State):
+    """stand-in city"""
+
+
+class TestPrefixIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of PrefixIndex class"""
+    def test_pep8_conformance(self):
+        """Test that prefix_index.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/prefix_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_prefix_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(prefix_index.__doc__) > 1)
+        self.assertTrue(len(PrefixIndex.__doc__) > 1)
+        for name, func in inspect.getmembers(PrefixIndex,
+                                             inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestPrefixIndex(unittest.TestCase):
+    """Test the PrefixIndex class"""
+    def setUp(self):
+        """builds an index over a few states and cities"""
+        self.storage = FakeStorage([
+            State("s1", "New York"), State("s2", "Nevada"),
+            State("s3", "California"), City("c1", "New York"),
+            City("c2", "Newark"), City("c3", "San José"),
+            City("c4", "San Francisco"), City("c5", "")])
+        self.index = PrefixIndex(self.storage,
+                                 {"State": "name", "City": "name"})
+
+    def test_complete(self):
+        """Test the matches, their order and the filters"""
+        self.assertEqual(len(self.index), 7)
+        self.assertEqual(self.index.complete("new"),
+                         [("City", "c1", "New York"),
+                          ("State", "s1", "New York"),
+                          ("City", "c2", "Newark")])
+        self.assertEqual(self.index.complete("YORK", ["State"]),
+                         [("State", "s1", "New York")])
+        self.assertEqual(self.index.complete("jose"),
+                         [("City", "c3", "San José")])
+        self.assertEqual(self.index.complete("san", limit=1),
+                         [("City", "c4", "San Francisco")])
+        self.assertEqual(self.index.complete("x"), [])
+        self.assertEqual(len(self.index.complete("", limit=100)), 7)
+
+    def test_write_events(self):
+        """Test that the index follows the storage write events"""
+        self.index.complete("n")
+        city = self.storage.objs[4]
+        city.name = "Oakland"
+        self.storage.notify("save", city)
+        self.storage.notify("save", State("s4", "Oregon"))
+        self.storage.notify("delete", self.storage.objs[0])
+        self.assertEqual(self.index.complete("new"),
+                         [("City", "c1", "New York")])
+        self.assertEqual(self.index.complete("o"),
+                         [("City", "c2", "Oakland"),
+                          ("State", "s4", "Oregon")])
+        self.storage.objs = []
+        self.storage.notify("reload", None)
+        self.assertEqual(self.index.complete(""), [])
@@ -0,0 +1,203 @@
+#!/usr/bin/python3
+"""
+Contains the TestQueryPlannerDocs and TestQueryPlanner classes
+"""
+
+import inspect
+from models.engine import query_planner
+from models.engine.bitmap_index import BitmapIndex
+from models.engine.hash_index import HashIndex
+from models.engine.sorted_index import SortedIndex
+import pep8
+import random
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+QueryPlanner = query_planner.QueryPlanner
+InPredicate = query_planner.InPredicate
+LinkedPredicate = query_planner.LinkedPredicate
+RangePredicate = query_planner.RangePredicate
+select = query_planner.select
+
+
+class Amenity:
+    """stand-in amenity"""
+    def __init__(self, id):
+        """keeps the id"""
+        self.id = id
+
+
+class Place:
+    """stand-in place"""
+    def __init__(self, id, city_id, price_by_night, amenities):
+        """keeps the attributes and the linked amenities"""
+        self.id = id
+        self.city_id = city_id
+        self.price_by_night = price_by_night
+        self.amenities = list(amenities)
+
+
+class TestQueryPlannerDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the planner"""
+    def test_pep8_conformance(self):
+        """Test that query_planner.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/query_planner.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_query_planner.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(query_planner.__doc__) > 1)
+        self.assertTrue(len(select.__doc__) > 1)
+        for cls in [QueryPlanner, InPredicate, LinkedPredicate,
+                    RangePredicate]:
+            self.assertTrue(len(cls.__doc__) > 1)
+            for name, func in inspect.getmembers(cls, inspect.isfunction):
+                with self.subTest(cls=cls, function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestQueryPlanner(unittest.TestCase):
+    """Test the QueryPlanner class"""
+    def setUp(self):
+        """builds a planner over random places"""
+        rnd = random.Random(3)
+        self.amenities = [Amenity("a{}".format(i)) for i in range(5)]
+        self.places = []
+        for i in range(1000):
+            linked = [a for a in self.amenities if rnd.random() < 0.5]
+            self.places.append(Place("p{:04}".format(i),
+                                     "c{}".format(rnd.randrange(50)),
+                                     rnd.randrange(20, 300), linked))
+        self.storage = FakeStorage(self.places)
+        self.cities = HashIndex(self.storage, "Place", "city_id")
+        self.links = BitmapIndex(self.storage, "Place", "amenities",
+                                 "Amenity")
+        self.prices = SortedIndex(self.storage, "Place", "price_by_night")
+        self.planner = QueryPlanner(self.storage, Place)
+
+    def expected(self, city_ids, amenity_ids, low, high):
+        """returns the ids of the matching places by full scan"""
+        return sorted(p.id for p in self.places
+                      if p.city_id in city_ids and
+                      set(amenity_ids) <= {a.id for a in p.amenities} and
+                      low <= p.price_by_night <= high)
+
+    def test_plan_order(self):
+        """Test that the most selective index predicate comes first"""
+        in_city = InPredicate(self.cities, ["c1"])
+        linked = LinkedPredicate(self.links, ["a0"])
+        price = RangePredicate("price_by_night", 50, 100)
+        steps = self.planner.plan([price, linked, in_city])
+        self.assertEqual([(op, p) for op, p, rows in steps],
+                         [("lookup", in_city), ("probe", linked),
+                          ("filter", price)])
+        steps = self.planner.plan([InPredicate(self.cities, ["c1"]),
+                                   LinkedPredicate(self.links, [])])
+        self.assertEqual(steps[1][0], "probe")
+        self.assertEqual(self.planner.plan([price])[0][0], "scan")
+
+    def test_run_matches_full_scan(self):
+        """Test that every plan returns the full scan results"""
+        cities = ["c{}".format(i) for i in range(0, 50, 3)]
+        for city_ids, amenity_ids, low, high in [
+                (cities, ["a1"], 0, 1000), (cities, ["a0", "a2"], 100, 200),
+                (["c7"], ["a0", "a1", "a2", "a3"], 0, 1000),
+                (cities[:1], [], 290, 300)]:
+            with self.subTest(city_ids=city_ids, amenity_ids=amenity_ids):
+                predicates = [InPredicate(self.cities, city_ids),
+                              RangePredicate("price_by_night", low, high)]
+                if amenity_ids:
+                    predicates.append(LinkedPredicate(self.links,
+                                                      amenity_ids))
+                total, found = self.planner.run(predicates)
+                expected = self.expected(city_ids, amenity_ids, low, high)
+                self.assertEqual(sorted(p.id for p in found), expected)
+                self.assertEqual(total, len(expected))
+        total, found = self.planner.run([InPredicate(self.cities, ["x"])])
+        self.assertEqual((total, found), (0, []))
+
+    def test_order_and_pagination(self):
+        """Test ordering, limit and offset"""
+        price = RangePredicate("price_by_night", 100)
+        total, found = self.planner.run([price], "price_by_night", True,
+                                        10, 5)
+        matching = sorted((p for p in self.places
+                           if p.price_by_night >= 100),
+                          key=lambda p: (p.price_by_night, p.id),
+                          reverse=True)
+        self.assertEqual(total, len(matching))
+        self.assertEqual(found, matching[5:15])
+        total, found = self.planner.run([], limit=3, offset=2)
+        self.assertEqual([p.id for p in found], ["p0002", "p0003", "p0004"])
+        total, found = self.planner.run([], "price_by_night")
+        self.assertEqual(len(found), 1000)
+        self.assertEqual(found, sorted(found, key=lambda p: (
+            p.price_by_night, p.id)))
+
+    def test_fields(self):
+        """Test that the fields to load include the sort attribute and
+        the attributes of the predicates without index"""
+        self.planner.run([], "price_by_night")
+        self.assertIsNone(self.storage.fields)
+        price = RangePredicate("price_by_night", 100)
+        in_city = InPredicate(self.cities, ["c1"])
+        self.planner.run([price, in_city], "name", fields=["id"])
+        self.assertEqual(self.storage.fields,
+                         {"id", "name", "price_by_night"})
+
+    def test_indexed_range(self):
+        """Test that a range with an index takes part in the plan"""
+        cheap = RangePredicate("price_by_night", 20, 22, self.prices)
+        in_cities = InPredicate(self.cities, ["c1", "c2", "c3"])
+        steps = self.planner.plan([in_cities, cheap])
+        self.assertEqual([(op, p) for op, p, rows in steps],
+                         [("lookup", cheap), ("probe", in_cities)])
+        total, found = self.planner.run([in_cities, cheap])
+        self.assertEqual(sorted(p.id for p in found),
+                         self.expected(["c1", "c2", "c3"], [], 20, 22))
+        wide = RangePredicate("price_by_night", 20, 290, self.prices)
+        total, found = self.planner.run([wide, in_cities])
+        self.assertEqual(sorted(p.id for p in found),
+                         self.expected(["c1", "c2", "c3"], [], 20, 290))
+
+    def test_select(self):
+        """Test that heap selection matches a full sort"""
+        self.places[7].price_by_night = None
+        by_price = sorted((p for p in self.places
+                           if p.price_by_night is not None),
+                          key=lambda p: (p.price_by_night, p.id))
+        for limit, offset in [(None, 0), (10, 0), (10, 990), (0, 5),
+                              (5000, 3)]:
+            with self.subTest(limit=limit, offset=offset):
+                end = None if limit is None else offset + limit
+                found = select(self.places, "price_by_night", False,
+                               limit, offset)
+                self.assertEqual(found, (by_price + [self.places[7]])[
+                    offset:end])
+                found = select(self.places, "price_by_night", True,
+                               limit, offset)
+                self.assertEqual(found, (by_price[::-1] +
+                                         [self.places[7]])[offset:end])
+        self.assertEqual(select(self.places), self.places)
+
+    def test_select_after(self):
+        """Test that walking pages with after returns every object once"""
+        for descending in (False, True):
+            with self.subTest(descending=descending):
+                key = query_planner.sort_key("price_by_night", descending)
+                found = []
+                after = None
+                while True:
+                    page = select(self.places, "price_by_night",
+                                  descending, 64, 0, after)
+                    if not page:
+                        break
+                    found.extend(page)
+                    after = key(page[-1])
+                self.assertEqual(found, select(self.places,
+                                               "price_by_night", descending))
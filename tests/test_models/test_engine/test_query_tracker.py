@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+"""
+Contains the TestQueryTrackerDocs and TestQueryTracker classes
+"""
+
+import inspect
+from models.engine import query_tracker
+import pep8
+import threading
+import unittest
+QueryLog = query_tracker.QueryLog
+QueryTracker = query_tracker.QueryTracker
+shape = query_tracker.shape
+
+
+class FakeStorage:
+    """storage running the statements it is given"""
+    def __init__(self):
+        """starts with no statement listener"""
+        self.listeners = []
+
+    def subscribe_statements(self, listener):
+        """registers a statement listener"""
+        self.listeners.append(listener)
+
+    def execute(self, statement, duration=0.001):
+        """notifies the listeners of statement"""
+        for listener in self.listeners:
+            listener(statement, (), duration)
+
+
+class TestQueryTrackerDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the tracker"""
+    def test_pep8_conformance(self):
+        """Test that query_tracker.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/query_tracker.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_query_tracker.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(query_tracker.__doc__) > 1)
+        self.assertTrue(len(shape.__doc__) > 1)
+        for cls in (QueryLog, QueryTracker):
+            self.assertTrue(len(cls.__doc__) > 1)
+            for name, func in inspect.getmembers(cls, inspect.isfunction):
+                with self.subTest(cls=cls, function=name):
+                    self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestQueryTracker(unittest.TestCase):
+    """Test the QueryLog and QueryTracker classes"""
+    def setUp(self):
+        """makes a tracker over a fake storage"""
+        self.storage = FakeStorage()
+        self.tracker = QueryTracker(self.storage)
+
+    def test_shape(self):
+        """Test that layout and placeholder lists do not change a shape"""
+        self.assertEqual(shape("SELECT *\n  FROM t WHERE id IN (?, ?, ?)"),
+                         "SELECT * FROM t WHERE id IN (?)")
+        self.assertEqual(shape("SELECT * FROM t WHERE id IN (%s,%s)"),
+                         "SELECT * FROM t WHERE id IN (?)")
+        self.assertEqual(shape("SELECT * FROM t WHERE id = %s"),
+                         "SELECT * FROM t WHERE id = %s")
+
+    def test_repeated(self):
+        """Test that the shapes run at least threshold times are found"""
+        log = self.tracker.start()
+        self.storage.execute("SELECT * FROM places")
+        for i in range(6):
+            self.storage.execute("SELECT * FROM amenities WHERE id = ?")
+        self.tracker.stop(log)
+        self.storage.execute("SELECT * FROM states")
+        self.assertEqual(log.count, 7)
+        self.assertAlmostEqual(log.duration, 0.007)
+        found = log.repeated(5)
+        self.assertEqual([(text, count) for text, count, duration in found],
+                         [("SELECT * FROM amenities WHERE id = ?", 6)])
+        self.assertEqual(len(log.repeated(1)), 2)
+
+    def test_nested_and_threads(self):
+        """Test that nested logs record a statement once each and that the
+        statements of other threads are left out"""
+        outer = self.tracker.start()
+        self.storage.execute("SELECT 1")
+        inner = self.tracker.start()
+        self.storage.execute("SELECT 2")
+        thread = threading.Thread(target=self.storage.execute,
+                                  args=("SELECT 3",))
+        thread.start()
+        thread.join()
+        self.tracker.stop(inner)
+        self.tracker.stop(outer)
+        self.tracker.stop(outer)
+        self.assertEqual((outer.count, inner.count), (2, 1))
@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""
+Contains the TestSlowLogDocs and TestSlowLog classes
+"""
+
+from flask import Flask
+import inspect
+import json
+import logging
+from models.engine import slow_log
+from models.engine.metrics import Metrics, instrument
+import pep8
+import time
+import unittest
+SlowLog = slow_log.SlowLog
+
+
+class FakeStorage:
+    """storage with a fast and a slow operation"""
+    def all(self, cls=None):
+        """returns two objects"""
+        return {"State.1": 1, "State.2": 2}
+
+    def save(self):
+        """takes a while"""
+        time.sleep(0.02)
+
+
+class TestSlowLogDocs(unittest.TestCase):
+    """Tests to check the documentation and style of the slow log"""
+    def test_pep8_conformance(self):
+        """Test that slow_log.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/slow_log.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_slow_log.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(slow_log.__doc__) > 1)
+        for func in (slow_log.class_name, slow_log.result_size,
+                     slow_log.request_endpoint):
+            self.assertTrue(len(func.__doc__) > 1)
+        self.assertTrue(len(SlowLog.__doc__) > 1)
+        for name, func in inspect.getmembers(SlowLog, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestSlowLog(unittest.TestCase):
+    """Test the SlowLog class"""
+    def setUp(self):
+        """makes a slow log of the operations of 10 ms or more"""
+        self.logger = logging.getLogger("hbnb.test_slow_log")
+        self.log = SlowLog(0.01, self.logger, lambda: "GET /states")
+
+    def records(self, run):
+        """returns the fields logged while calling run()"""
+        with self.assertLogs(self.logger, logging.WARNING) as logs:
+            run()
+            self.logger.warning("{}")
+        found = [json.loads(record.getMessage()) for record in logs.records]
+        for record, fields in zip(logs.records, found[:-1]):
+            self.assertEqual(record.hbnb, fields)
+        return found[:-1]
+
+    def test_operation(self):
+        """Test that only the slow operations are logged, with their
+        class and result size"""
+        def run():
+            """logs a fast, a slow and a write operation"""
+            self.log.operation("all", 0.002, ("State",), {}, {})
+            self.log.operation("get_many", 0.5, (), {"cls": int}, [1, 2])
+            self.log.operation("save", 0.02, (), {}, None)
+        self.assertEqual(self.records(run), [
+            {"event": "slow_storage_operation", "operation": "get_many",
+             "duration_ms": 500.0, "class": "int", "result_size": 2,
+             "endpoint": "GET /states"},
+            {"event": "slow_storage_operation", "operation": "save",
+             "duration_ms": 20.0, "class": None, "result_size": None,
+             "endpoint": "GET /states"}])
+
+    def test_statement(self):
+        """Test that slow statements are logged on one line"""
+        def run():
+            """logs a fast and a slow statement"""
+            self.log.on_statement("SELECT 1", (), 0.001)
+            self.log.on_statement("SELECT *\n FROM states", (), 0.25)
+        self.assertEqual(self.records(run), [
+            {"event": "slow_query", "statement": "SELECT * FROM states",
+             "duration_ms": 250.0, "endpoint": "GET /states"}])
+
+    def test_instrument(self):
+        """Test that instrumented storage methods reach the slow log"""
+        storage = FakeStorage()
+        instrument(storage, Metrics(), self.log)
+
+        def run():
+            """runs a fast and a slow operation"""
+            storage.all("State")
+            storage.save()
+        found = self.records(run)
+        self.assertEqual([fields["operation"] for fields in found], ["save"])
+
+    def test_request_endpoint(self):
+        """Test that the endpoint is the URL rule of the Flask request"""
+        self.assertIsNone(slow_log.request_endpoint())
+        app = Flask(__name__)
+        app.add_url_rule("/states/<id>", "state",
+                         lambda id: slow_log.request_endpoint())
+        response = app.test_client().get("/states/1")
+        self.assertEqual(response.get_data(as_text=True),
+                         "GET /states/<id>")
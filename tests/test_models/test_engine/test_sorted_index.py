@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""
+Contains the TestSortedIndexDocs and TestSortedIndex classes
+"""
+
+import inspect
+from models.engine import sorted_index
+from models.place import Place
+import pep8
+import random
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+SortedIndex = sorted_index.SortedIndex
+
+
+class TestSortedIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of SortedIndex class"""
+    def test_pep8_conformance(self):
+        """Test that sorted_index.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/sorted_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_sorted_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(sorted_index.__doc__) > 1)
+        self.assertTrue(len(SortedIndex.__doc__) > 1)
+        for name, func in inspect.getmembers(SortedIndex,
+                                             inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestSortedIndex(unittest.TestCase):
+    """Test the SortedIndex class"""
+    def setUp(self):
+        """builds an index over places with random prices"""
+        rnd = random.Random(5)
+        self.places = [Place(price_by_night=rnd.randrange(20, 120))
+                       for i in range(500)]
+        self.storage = FakeStorage(self.places)
+        self.index = SortedIndex(self.storage, "Place", "price_by_night")
+
+    def expected(self, low, high):
+        """returns the ids of the places priced between low and high"""
+        return {p.id for p in self.places
+                if (low is None or p.price_by_night >= low) and
+                (high is None or p.price_by_night <= high)}
+
+    def test_ranges(self):
+        """Test ids, count and filter against a full scan"""
+        self.assertEqual(len(self.index), 500)
+        for low, high in [(50, 60), (None, 30), (100, None), (None, None),
+                          (70, 70), (80, 40), (200, 300)]:
+            with self.subTest(low=low, high=high):
+                expected = self.expected(low, high)
+                self.assertEqual(self.index.ids(low, high), expected)
+                self.assertEqual(self.index.count(low, high), len(expected))
+                ids = [p.id for p in self.places[:50]] + ["nope"]
+                self.assertEqual(self.index.filter(ids, low, high),
+                                 [i for i in ids if i in expected])
+        place = self.places[0]
+        self.assertEqual(self.index.value_of(place.id),
+                         place.price_by_night)
+
+    def test_non_numbers(self):
+        """Test that values are coerced to numbers or left out"""
+        self.assertEqual(sorted_index.as_number("12.5"), 12.5)
+        self.assertIsNone(sorted_index.as_number("cheap"))
+        self.assertIsNone(sorted_index.as_number(True))
+        self.assertEqual(len(self.index), 500)
+        self.storage.notify("save", Place(price_by_night="cheap"))
+        self.storage.notify("save", Place(price_by_night="1000"))
+        self.assertEqual(len(self.index), 501)
+        self.assertEqual(self.index.count(1000, 1000), 1)
+
+    def test_write_events(self):
+        """Test that the index follows the storage write events"""
+        place = self.places[0]
+        place.price_by_night = 500
+        self.storage.notify("save", place)
+        self.assertEqual(self.index.ids(400, None), {place.id})
+        self.assertEqual(self.index.ids(None, 200), self.expected(None, 200))
+        self.storage.notify("delete", place)
+        self.assertEqual(self.index.count(400, None), 0)
+        self.assertEqual(len(self.index), 499)
+        self.storage.objs = []
+        self.storage.notify("reload", None)
+        self.assertEqual(len(self.index), 0)
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""
+Contains the TestTextIndexDocs and TestTextIndex classes
+"""
+
+import inspect
+from models.engine import text_index
+from models.place import Place
+from models.review import Review
+import os
+import pep8
+import tempfile
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import time
+import unittest
+TextIndex = text_index.TextIndex
+fields = {"Place": {"name": 2, "description": 1}, "Review": {"text": 1}}
+
+
+class TestTextIndexDocs(unittest.TestCase):
+    """Tests to check the documentation and style of TextIndex class"""
+    def test_pep8_conformance(self):
+        """Test that text_index.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/text_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_text_index.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(text_index.__doc__) > 1)
+        self.assertTrue(len(TextIndex.__doc__) > 1)
+        for name, func in inspect.getmembers(TextIndex, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestTextIndex(unittest.TestCase):
+    """Test the TextIndex class"""
+    def setUp(self):
+        """builds an index over a few places and reviews"""
+        self.loft = Place(name="Sunny loft",
+                          description="A bright loft near the beach")
+        self.cabin = Place(name="Mountain cabin",
+                           description="Quiet cabin, wood stove, no beach")
+        self.review = Review(text="Loved the loft, loft life is great")
+        self.storage = FakeStorage([self.loft, self.cabin, self.review])
+        self.index = TextIndex(self.storage, fields)
+
+    def keys(self, hits):
+        """returns the keys of search hits"""
+        return [key for score, key in hits]
+
+    def test_tokenize(self):
+        """Test tokenization"""
+        self.assertEqual(text_index.tokenize("The Wood-stove, is GREAT!"),
+                         ["wood", "stove", "great"])
+        self.assertEqual(text_index.tokenize(None), [])
+
+    def test_search_ranking(self):
+        """Test that results are ranked by relevance"""
+        total, hits = self.index.search("loft")
+        self.assertEqual(total, 2)
+        self.assertCountEqual(self.keys(hits),
+                              ["Place." + self.loft.id,
+                               "Review." + self.review.id])
+        total, hits = self.index.search("beach cabin")
+        self.assertEqual(total, 2)
+        self.assertEqual(self.keys(hits)[0], "Place." + self.cabin.id)
+        self.assertEqual(self.index.search("the"), (0, []))
+        self.assertEqual(self.index.search("nothing"), (0, []))
+
+    def test_search_filters_and_pages(self):
+        """Test class filters, limit and offset"""
+        total, hits = self.index.search("loft", ["Review"])
+        self.assertEqual((total, self.keys(hits)),
+                         (1, ["Review." + self.review.id]))
+        total, first = self.index.search("loft beach", limit=1)
+        total, second = self.index.search("loft beach", limit=1, offset=1)
+        total, both = self.index.search("loft beach", limit=2)
+        self.assertEqual(first + second, both)
+
+    def test_write_events(self):
+        """Test that the index follows the storage write events"""
+        self.assertEqual(len(self.index), 3)
+        self.cabin.description = "Lakeside cabin"
+        self.storage.notify("save", self.cabin)
+        self.assertEqual(self.index.search("beach")[0], 1)
+        self.assertEqual(self.index.search("lakeside")[0], 1)
+        self.storage.notify("delete", self.loft)
+        self.assertEqual(self.index.search("loft")[0], 1)
+        self.assertEqual(len(self.index), 2)
+
+    def test_persist(self):
+        """Test that a persisted index is reused for unchanged documents"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.json")
+            index = TextIndex(self.storage, fields, path)
+            index.build()
+            index.persist()
+            self.assertTrue(os.path.exists(path))
+            self.cabin.description = "Lakeside cabin"
+            reloaded = TextIndex(self.storage, fields, path)
+            self.assertEqual(reloaded.search("loft")[0], 2)
+            self.assertEqual(reloaded.search("lakeside")[0], 1)
+            self.assertEqual(reloaded.search("stove")[0], 0)
+            reloaded.persist()
+
+    def test_persist_in_background(self):
+        """Test that the writes leave the file to the background thread"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.json")
+            index = TextIndex(self.storage, fields, path, 0.05)
+            index.build()
+            self.storage.notify("save", self.cabin)
+            self.assertFalse(os.path.exists(path))
+            deadline = time.monotonic() + 5
+            while not os.path.exists(path) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(TextIndex(self.storage, fields, path).search(
+                "stove")[0], 1)
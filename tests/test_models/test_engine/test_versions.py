@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""
+Contains the TestVersionsDocs and TestVersions classes
+"""
+
+import inspect
+from models.engine import versions
+from models.review import Review
+from models.state import State
+import pep8
+from tests.test_models.test_engine.fake_storage import FakeStorage
+import unittest
+Versions = versions.Versions
+
+
+class TestVersionsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of Versions class"""
+    def test_pep8_conformance(self):
+        """Test that versions.py and its tests conform to PEP8."""
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/versions.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_versions.py',
+                                    'tests/test_models/test_engine/'
+                                    'fake_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_docstrings(self):
+        """Test for the presence of docstrings"""
+        self.assertTrue(len(versions.__doc__) > 1)
+        self.assertTrue(len(Versions.__doc__) > 1)
+        for name, func in inspect.getmembers(Versions, inspect.isfunction):
+            with self.subTest(function=name):
+                self.assertTrue(len(func.__doc__ or "") > 1)
+
+
+class TestVersions(unittest.TestCase):
+    """Test the Versions class"""
+    def setUp(self):
+        """builds versions over reviews of two places"""
+        self.reviews = [Review(place_id="p{}".format(i % 2))
+                        for i in range(4)]
+        self.storage = FakeStorage(self.reviews)
+        self.versions = Versions(self.storage, {"Review": ("place_id",)})
+
+    def test_writes(self):
+        """Test that a write bumps its class and group versions only"""
+        review = self.versions.version("Review")
+        p0 = self.versions.version("Review", "place_id", "p0")
+        p1 = self.versions.version("Review", "place_id", "p1")
+        state = self.versions.version("State")
+        self.storage.notify("save", Review(place_id="p0"))
+        self.assertNotEqual(self.versions.version("Review"), review)
+        self.assertNotEqual(
+            self.versions.version("Review", "place_id", "p0"), p0)
+        self.assertEqual(self.versions.version("Review", "place_id", "p1"),
+                         p1)
+        self.storage.notify("save", State())
+        self.assertNotEqual(self.versions.version("State"), state)
+
+    def test_moves_and_deletes(self):
+        """Test that moving or deleting an object bumps its old group"""
+        p0 = self.versions.version("Review", "place_id", "p0")
+        p1 = self.versions.version("Review", "place_id", "p1")
+        self.reviews[0].place_id = "p1"
+        self.storage.notify("save", self.reviews[0])
+        moved = self.versions.version("Review", "place_id", "p0")
+        self.assertNotEqual(moved, p0)
+        self.assertNotEqual(
+            self.versions.version("Review", "place_id", "p1"), p1)
+        self.storage.notify("delete", self.reviews[2])
+        self.assertNotEqual(
+            self.versions.version("Review", "place_id", "p0"), moved)
+
+    def test_reload(self):
+        """Test that a reload draws a new epoch"""
+        before = self.versions.version("Review")
+        self.storage.notify("reload", None)
+        self.assertNotEqual(self.versions.version("Review"), before)